@@ -12,6 +12,7 @@ import json
 from .batch_models import JobStatus, BatchJobResponse, BatchResultsResponse
 from .service import AnalysisService
 from ..services.storage.analysis_storage_service import AnalysisStorageService
+from ..models.statement_table import StatementTable
 
 class BatchJob:
     """Represents a batch analysis job"""
@@ -225,6 +226,8 @@ class BatchAnalysisService:
         """Convert numpy types and other non-serializable types to native Python types"""
         if isinstance(obj, dict):
             return {k: self._make_serializable(v) for k, v in obj.items()}
+        elif isinstance(obj, StatementTable):
+            return self._make_serializable(obj.to_dict())
         elif isinstance(obj, list):
             return [self._make_serializable(item) for item in obj]
         elif isinstance(obj, tuple):
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import Dict, Any, List, Optional
 from enum import Enum
+from ..models.statement_table import serialize_statements
 
 class AnalysisRequest(BaseModel):
     ticker: str
@@ -32,6 +33,12 @@ class AnalysisResponse(BaseModel):
     status: str = "completed"
     batch_analysis_id: Optional[str] = None
 
+    @field_validator('financial_metrics', mode='before')
+    @classmethod
+    def _serialize_statements(cls, value):
+        # revenue_data_statements holds StatementTables - JSON them only here
+        return serialize_statements(value)
+
 class HealthResponse(BaseModel):
     status: str
     version: str = "1.0.0"
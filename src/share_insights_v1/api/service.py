@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from ..services.orchestration.analysis_orchestrator import AnalysisOrchestrator
 from ..services.storage.analysis_storage_service import AnalysisStorageService
@@ -18,18 +20,29 @@ from ..implementations.analyzers.analyst_consensus_analyzer import AnalystConsen
 from ..implementations.data_providers.sec_edgar_provider import SECEdgarProvider
 from ..implementations.calculators.quality_calculator import QualityScoreCalculator
 from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ..implementations.data_providers.async_yahoo_provider import AsyncYahooFinanceProvider
 from ..implementations.classifier import CompanyClassifier
 from ..models.analysis_result import AnalysisType
+from ..models.statement_table import serialize_statements
 from .models import AnalyzerInfo
 
 # Use the same API logger as middleware
 logger = setup_logger(name='api', component='API', log_file='logs/api.log')
 
+# Orchestrator runs are still synchronous (each fans out to its own analyzer
+# threads), so cap how many run at once instead of borrowing a thread from the
+# loop's default executor for every request
+analysis_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('API_MAX_CONCURRENT_ANALYSES', '8')),
+    thread_name_prefix='analysis',
+)
+
 class AnalysisService:
     """Service layer for stock analysis API"""
     
     def __init__(self, save_to_db: bool = True, debug_mode: bool = False, max_news_articles: int = 5):
         self.data_provider = YahooFinanceProvider()
+        self.async_data_provider = AsyncYahooFinanceProvider(self.data_provider)
         self.classifier = CompanyClassifier()
         self.quality_calculator = QualityScoreCalculator()
         self.save_to_db = save_to_db
@@ -90,9 +103,11 @@ class AnalysisService:
         else:
             orchestrator = self._create_orchestrator_with_llm(llm_provider, llm_model)
         
-        # Run analysis in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, orchestrator.analyze_stock, ticker)
+        # Await the Yahoo data on the shared I/O pool, then run the analysis on
+        # the bounded analysis pool - the orchestrator finds the snapshot loaded
+        snapshot = await self.async_data_provider.warm_snapshot(ticker, sections=orchestrator.data_requirements())
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(analysis_executor, orchestrator.analyze_stock, ticker, snapshot)
         
         # Log orchestrator response
         if 'error' in result:
@@ -137,7 +152,7 @@ class AnalysisService:
                 import json
                 
                 # Use same serialization as test_orchestrator_comprehensive
-                full_response_json = json.dumps(result, indent=2, default=str)
+                full_response_json = json.dumps(serialize_statements(result), indent=2, default=str)
                 
                 log_with_context(
                     logger, 'info',
@@ -231,11 +246,13 @@ class AnalysisService:
     
     def _create_selective_orchestrator(self, enabled_analyzers: List[str], llm_provider: Optional[str] = None, llm_model: Optional[str] = None) -> AnalysisOrchestrator:
         """Create orchestrator with only selected analyzers"""
+        # Fetch only the data the selected analyzers read
         orchestrator = AnalysisOrchestrator(
             self.data_provider, 
             self.classifier, 
             self.quality_calculator,
-            self.debug_mode
+            self.debug_mode,
+            report_sections=AnalysisOrchestrator.CORE_SECTIONS
         )
         
         # Create LLM manager if provider/model specified
@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 import json
 import os
@@ -563,4 +564,8 @@ Consider factors like:
     
     def is_applicable(self, company_type: str) -> bool:
         """AI insights applicable to all company types"""
-        return True
\ No newline at end of file
+        return True
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics, revenue growth from the statements and price history"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS, DataSection.PRICES})
\ No newline at end of file
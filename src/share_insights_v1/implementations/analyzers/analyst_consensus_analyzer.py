@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...models.analysis_result import AnalysisResult, AnalysisType
 from ...models.recommendation import RecommendationType
@@ -13,7 +14,7 @@ class AnalystConsensusAnalyzer(IAnalyzer):
     def analyze(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze professional analyst consensus"""
         try:
-            analyst_data = self.data_provider.get_professional_analyst_data(ticker)
+            analyst_data = self.data_provider.get_professional_analyst_data(ticker, snapshot=data.get('ticker_snapshot'))
             
             if 'error' in analyst_data:
                 return {'error': f"Failed to get analyst data: {analyst_data['error']}"}
@@ -104,4 +105,8 @@ class AnalystConsensusAnalyzer(IAnalyzer):
     def is_applicable(self, company_type: str) -> bool:
         """Analyst consensus applicable to most public companies"""
         return True
-        # return company_type != "startup_loss_making"  # Startups typically don't have analyst coverage
\ No newline at end of file
+        # return company_type != "startup_loss_making"  # Startups typically don't have analyst coverage
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Analyst targets and ratings, price history when the quote has no price"""
+        return frozenset({DataSection.QUOTE, DataSection.ANALYST, DataSection.PRICES})
\ No newline at end of file
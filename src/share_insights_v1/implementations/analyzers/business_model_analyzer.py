@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...interfaces.sec_data_provider import SECDataProvider
 from ...models.business_model import (
@@ -11,6 +12,7 @@ import numpy as np
 import json
 from ...implementations.llm_providers.llm_manager import LLMManager
 from ...utils.debug_printer import debug_print
+from ..data_providers.sec_result_cache import filing_results
 
 class BusinessModelAnalyzer(IAnalyzer):
     """Analyzer for business model and revenue stream analysis"""
@@ -104,6 +106,10 @@ class BusinessModelAnalyzer(IAnalyzer):
         """Business model analysis applies to most company types"""
         excluded_types = [CompanyType.ETF.value]
         return company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics - the rest comes from SEC filings"""
+        return frozenset({DataSection.QUOTE})
     
     def analyze_business_model(self, ticker: str, company_info: Dict[str, Any], 
                              financial_metrics: Dict[str, Any]) -> Optional[BusinessModelReport]:
@@ -324,18 +330,23 @@ Respond with ONLY the business model type (e.g., "PLATFORM", "B2B_SAAS", etc.)
         )
     
     def _analyze_revenue_streams_from_sec(self, ticker: str) -> Optional[RevenueStreamAnalysis]:
-        """Analyze revenue streams from SEC Edgar XBRL data"""
+        """Analyze revenue streams from SEC Edgar XBRL data, reused until the company files again"""
+        if not self.sec_provider:
+            return None
+        return filing_results.get_or_compute(
+            'bm_revenue_streams', ticker, self.sec_provider.get_filing_version(ticker),
+            lambda: self._compute_revenue_streams_from_sec(ticker)
+        )
+    
+    def _compute_revenue_streams_from_sec(self, ticker: str) -> Optional[RevenueStreamAnalysis]:
         try:
-            if not self.sec_provider:
-                return None
-            
-            facts = self.sec_provider.get_filing_facts(ticker)
-            if not facts or 'facts' not in facts:
+            facts = self.sec_provider.get_company_facts(ticker)
+            if not facts:
                 debug_print(f"[BM_DEBUG] No SEC facts data for {ticker}")
                 return None
             
-            us_gaap = facts['facts'].get('us-gaap', {})
-            debug_print(f"[BM_DEBUG] SEC XBRL fields available for {ticker}: {len(us_gaap)} total fields")
+            us_gaap_fields = facts.concepts()
+            debug_print(f"[BM_DEBUG] SEC XBRL fields available for {ticker}: {len(us_gaap_fields)} total fields")
             
             # Generic revenue field detection
             revenue_keywords = {
@@ -353,7 +364,7 @@ Respond with ONLY the business model type (e.g., "PLATFORM", "B2B_SAAS", etc.)
             
             # Find all potential revenue fields
             potential_revenue_fields = []
-            for field_name in us_gaap.keys():
+            for field_name in us_gaap_fields:
                 field_lower = field_name.lower()
                 # Check if field contains revenue-related keywords
                 if any(keyword in field_lower for keyword in ['revenue', 'sales', 'income']) and \
@@ -367,13 +378,10 @@ Respond with ONLY the business model type (e.g., "PLATFORM", "B2B_SAAS", etc.)
             total_revenue = 0
             
             for field_name in potential_revenue_fields:
-                units = us_gaap[field_name].get('units', {})
-                if 'USD' in units:
+                if facts.has(field_name):
                     # Get most recent data point
-                    recent_data = sorted(units['USD'], key=lambda x: x.get('end', ''), reverse=True)[:1]
-                    if recent_data and recent_data[0].get('val', 0) > 0:
-                        value = recent_data[0]['val']
-                        
+                    value = facts.latest(field_name)
+                    if value and value > 0:
                         # Classify revenue stream type based on field name
                         stream_type = RevenueStreamType.MIXED  # default
                         field_lower = field_name.lower()
@@ -389,7 +397,7 @@ Respond with ONLY the business model type (e.g., "PLATFORM", "B2B_SAAS", etc.)
             if not revenue_components:
                 debug_print(f"[BM_DEBUG] No revenue components found in SEC data for {ticker}")
                 # Check if this is a pre-revenue company by looking at available fields
-                all_fields = list(us_gaap.keys())
+                all_fields = us_gaap_fields
                 debug_print(f"[BM_DEBUG] Available XBRL fields: {all_fields[:5]}...")
                 return None
             
@@ -916,16 +924,20 @@ Respond with JSON containing segment breakdown:
             return self._get_fallback_segment_data(sector, industry, product_analysis)
     
     def _collect_sec_edgar_data(self, ticker: str) -> Dict[str, Any]:
-        """Collect complete SEC Edgar data for the ticker"""
+        """Collect complete SEC Edgar data for the ticker, reused until the company files again"""
+        if not self.sec_provider:
+            return {'ticker': ticker, 'data_available': False, 'error': 'SEC provider not available'}
+        return filing_results.get_or_compute(
+            'bm_sec_data', ticker, self.sec_provider.get_filing_version(ticker),
+            lambda: self._compute_sec_edgar_data(ticker)
+        )
+    
+    def _compute_sec_edgar_data(self, ticker: str) -> Dict[str, Any]:
         sec_data = {
             'ticker': ticker,
             'data_available': False
         }
         
-        if not self.sec_provider:
-            sec_data['error'] = 'SEC provider not available'
-            return sec_data
-        
         try:
             # Get CIK
             cik = self.sec_provider._get_cik(ticker)
@@ -934,18 +946,18 @@ Respond with JSON containing segment breakdown:
                 sec_data['data_available'] = True
             
             # Get filing facts - summary only
-            facts = self.sec_provider.get_filing_facts(ticker)
+            facts = self.sec_provider.get_company_facts(ticker)
             if facts:
+                us_gaap_fields = facts.concepts()
                 sec_data['filing_facts'] = {
-                    'total_xbrl_fields': len(facts.get('facts', {}).get('us-gaap', {})),
-                    'entity_name': facts.get('entityName'),
-                    'cik': facts.get('cik')
+                    'total_xbrl_fields': len(us_gaap_fields),
+                    'entity_name': facts.entity_name,
+                    'cik': facts.cik
                 }
                 
                 # Count segment-related fields only
-                us_gaap = facts.get('facts', {}).get('us-gaap', {})
                 segment_field_count = 0
-                for field_name in us_gaap.keys():
+                for field_name in us_gaap_fields:
                     if any(keyword in field_name.lower() for keyword in ['segment', 'reportable', 'product', 'geographic']):
                         segment_field_count += 1
                 
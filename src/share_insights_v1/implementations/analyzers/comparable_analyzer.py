@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.peer_comparison_provider import PeerComparisonProvider
 from ...models.company import CompanyType
 from ...config.config import FinanceConfig
@@ -346,3 +347,7 @@ class ComparableAnalyzer(IAnalyzer):
         """Comparable analysis applies to most company types except ETFs"""
         excluded_types = [CompanyType.ETF.value]
         return company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics, plus the classification and quality grade built from the statements"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS})
@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...models.competitive_position import (
     CompetitivePositionReport, MarketPosition, CompetitiveAdvantage, 
@@ -69,6 +70,10 @@ class CompetitivePositionAnalyzer(IAnalyzer):
         """Competitive analysis applies to most company types"""
         excluded_types = [CompanyType.ETF.value]
         return company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics only"""
+        return frozenset({DataSection.QUOTE})
     
     def analyze_competitive_position(self, ticker: str, company_info: Dict[str, Any], 
                                    financial_metrics: Dict[str, Any], company_type: str = None) -> Optional[CompetitivePositionReport]:
@@ -1,9 +1,11 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...models.company import CompanyType
 from ..calculators import dcf_yf_new as dcf_yf
 from ...config.config import FinanceConfig
 from ...utils.debug_printer import debug_print
+from ..data_providers.ticker_snapshot import snapshot_for
 
 class DCFAnalyzer(IAnalyzer):
     """DCF valuation analyzer implementation using original dcf_yf logic.
@@ -52,11 +54,10 @@ class DCFAnalyzer(IAnalyzer):
             # Pass company type for risk adjustments
             base_tmp_config.company_type = company_type
 
-            # Build the ticker once and reuse it across every scenario run below -
-            # yfinance lazily caches .info/.cashflow/.income_stmt per-instance, so
-            # this avoids re-fetching the same data 4-5x for one analysis
-            import yfinance as yf
-            ticker_obj = yf.Ticker(ticker)
+            # Reuse the run's shared snapshot across every scenario below - it
+            # memoizes .info/.cashflow/.income_stmt, so neither the scenarios nor
+            # the provider's earlier get_financial_metrics call re-fetch them
+            ticker_obj = snapshot_for(ticker, data)
 
             base = self._run_scenario(
                 ticker, ticker_obj, base_tmp_config, metrics, company_type,
@@ -226,3 +227,7 @@ class DCFAnalyzer(IAnalyzer):
         # Exclude financial companies as they have different business models
         excluded_types = [CompanyType.FINANCIAL.value, CompanyType.ETF.value]
         return company_type in applicable_types and company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Cash flow and income statements, plus the classification and quality grade built from them"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS})
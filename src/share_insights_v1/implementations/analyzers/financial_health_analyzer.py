@@ -1,11 +1,14 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.sec_data_provider import SECDataProvider
 from ...models.financial_health import (
     FinancialHealthReport, CashFlowMetrics, DebtMetrics, 
     RevenueQuality, FinancialHealthGrade
 )
 from ...models.company import CompanyType
+from ..data_providers.sec_facts_store import CompanyFacts
+from ..data_providers.sec_result_cache import filing_results
 
 class FinancialHealthAnalyzer(IAnalyzer):
     """Analyzer for financial health from SEC filings"""
@@ -14,7 +17,17 @@ class FinancialHealthAnalyzer(IAnalyzer):
         self.sec_provider = sec_provider
     
     def analyze(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze financial health using IAnalyzer interface"""
+        """Analyze financial health using IAnalyzer interface. The result only
+        depends on SEC filings, so it is reused until the company files again."""
+        try:
+            return filing_results.get_or_compute(
+                'financial_health', ticker, self.sec_provider.get_filing_version(ticker),
+                lambda: self._analyze(ticker)
+            )
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def _analyze(self, ticker: str) -> Dict[str, Any]:
         try:
             health_report = self.analyze_financial_health(ticker)
             
@@ -43,12 +56,16 @@ class FinancialHealthAnalyzer(IAnalyzer):
         """Financial health analysis applies to most company types"""
         excluded_types = [CompanyType.ETF.value]
         return company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Nothing beyond the quote - financial health comes from SEC filings"""
+        return frozenset({DataSection.QUOTE})
     
     def analyze_financial_health(self, ticker: str) -> Optional[FinancialHealthReport]:
         """Analyze financial health from SEC filings"""
         
-        # Get company facts
-        facts = self.sec_provider.get_filing_facts(ticker)
+        # Get company facts (indexed - each lookup below is a dict read)
+        facts = self.sec_provider.get_company_facts(ticker)
         if not facts:
             return None
         
@@ -74,19 +91,17 @@ class FinancialHealthAnalyzer(IAnalyzer):
             strengths=strengths
         )
     
-    def _extract_cash_flow_metrics(self, facts: Dict[str, Any]) -> CashFlowMetrics:
+    def _extract_cash_flow_metrics(self, facts: CompanyFacts) -> CashFlowMetrics:
         """Extract cash flow metrics from SEC facts"""
         
-        us_gaap = facts.get('facts', {}).get('us-gaap', {})
-        
         # Get latest annual values
-        ocf = self._get_latest_annual_value(us_gaap.get('OperatingCashFlowsContinuingOperations', {}))
+        ocf = self._get_latest_annual_value(facts, 'OperatingCashFlowsContinuingOperations')
         if not ocf:
-            ocf = self._get_latest_annual_value(us_gaap.get('NetCashProvidedByUsedInOperatingActivities', {}))
+            ocf = self._get_latest_annual_value(facts, 'NetCashProvidedByUsedInOperatingActivities')
         
-        capex = self._get_latest_annual_value(us_gaap.get('PaymentsToAcquirePropertyPlantAndEquipment', {}))
-        net_income = self._get_latest_annual_value(us_gaap.get('NetIncomeLoss', {}))
-        revenues = self._get_latest_annual_value(us_gaap.get('Revenues', {}))
+        capex = self._get_latest_annual_value(facts, 'PaymentsToAcquirePropertyPlantAndEquipment')
+        net_income = self._get_latest_annual_value(facts, 'NetIncomeLoss')
+        revenues = self._get_latest_annual_value(facts, 'Revenues')
         
         # Calculate derived metrics
         free_cash_flow = None
@@ -108,24 +123,22 @@ class FinancialHealthAnalyzer(IAnalyzer):
             capex_intensity=capex_intensity
         )
     
-    def _extract_debt_metrics(self, facts: Dict[str, Any]) -> DebtMetrics:
+    def _extract_debt_metrics(self, facts: CompanyFacts) -> DebtMetrics:
         """Extract debt metrics from SEC facts"""
         
-        us_gaap = facts.get('facts', {}).get('us-gaap', {})
-        
         # Get debt values
-        total_debt = self._get_latest_annual_value(us_gaap.get('DebtCurrent', {}))
-        long_term_debt = self._get_latest_annual_value(us_gaap.get('LongTermDebt', {}))
+        total_debt = self._get_latest_annual_value(facts, 'DebtCurrent')
+        long_term_debt = self._get_latest_annual_value(facts, 'LongTermDebt')
         
         if total_debt and long_term_debt:
             total_debt += long_term_debt
         elif long_term_debt and not total_debt:
             total_debt = long_term_debt
         
-        cash = self._get_latest_annual_value(us_gaap.get('CashAndCashEquivalentsAtCarryingValue', {}))
-        equity = self._get_latest_annual_value(us_gaap.get('StockholdersEquity', {}))
-        interest_expense = self._get_latest_annual_value(us_gaap.get('InterestExpense', {}))
-        ebit = self._get_latest_annual_value(us_gaap.get('OperatingIncomeLoss', {}))
+        cash = self._get_latest_annual_value(facts, 'CashAndCashEquivalentsAtCarryingValue')
+        equity = self._get_latest_annual_value(facts, 'StockholdersEquity')
+        interest_expense = self._get_latest_annual_value(facts, 'InterestExpense')
+        ebit = self._get_latest_annual_value(facts, 'OperatingIncomeLoss')
         
         # Calculate derived metrics
         net_debt = None
@@ -147,56 +160,31 @@ class FinancialHealthAnalyzer(IAnalyzer):
             interest_coverage=interest_coverage
         )
     
-    def _extract_revenue_quality(self, facts: Dict[str, Any]) -> RevenueQuality:
+    def _extract_revenue_quality(self, facts: CompanyFacts) -> RevenueQuality:
         """Extract revenue quality metrics from SEC facts"""
         
-        us_gaap = facts.get('facts', {}).get('us-gaap', {})
-        
-        # Get revenue history for trend analysis
-        revenues_data = us_gaap.get('Revenues', {}).get('units', {}).get('USD', [])
+        # Annual revenue history (oldest first) for trend analysis
+        _, annual_revenues = facts.series('Revenues', form='10-K')
         
         # Calculate 3-year revenue growth
-        revenue_growth_3yr = self._calculate_revenue_growth(revenues_data)
+        revenue_growth_3yr = self._calculate_revenue_growth(annual_revenues)
         
         return RevenueQuality(
             revenue_growth_3yr=revenue_growth_3yr
         )
     
-    def _get_latest_annual_value(self, metric_data: Dict[str, Any]) -> Optional[float]:
-        """Get latest annual value from SEC metric data"""
-        
-        units = metric_data.get('units', {}).get('USD', [])
-        if not units:
-            return None
-        
-        # Filter for annual filings (10-K)
-        annual_values = [
-            item for item in units 
-            if item.get('form') == '10-K' and item.get('val') is not None
-        ]
-        
-        if not annual_values:
-            return None
-        
-        # Sort by end date and get latest
-        annual_values.sort(key=lambda x: x.get('end', ''), reverse=True)
-        return annual_values[0].get('val')
+    def _get_latest_annual_value(self, facts: CompanyFacts, concept: str) -> Optional[float]:
+        """Get latest annual (10-K) USD value of an XBRL concept"""
+        return facts.latest(concept, form='10-K')
     
-    def _calculate_revenue_growth(self, revenues_data: list) -> Optional[float]:
-        """Calculate 3-year revenue CAGR"""
-        
-        annual_revenues = [
-            item for item in revenues_data 
-            if item.get('form') == '10-K' and item.get('val') is not None
-        ]
+    def _calculate_revenue_growth(self, annual_revenues) -> Optional[float]:
+        """Calculate 3-year revenue CAGR from 10-K revenues, oldest first"""
         
         if len(annual_revenues) < 4:  # Need at least 4 years for 3-year growth
             return None
         
-        annual_revenues.sort(key=lambda x: x.get('end', ''))
-        
-        current_revenue = annual_revenues[-1]['val']
-        three_years_ago = annual_revenues[-4]['val']
+        current_revenue = annual_revenues[-1]
+        three_years_ago = annual_revenues[-4]
         
         if three_years_ago <= 0:
             return None
@@ -290,19 +278,9 @@ class FinancialHealthAnalyzer(IAnalyzer):
         
         return risks, strengths
     
-    def _get_latest_filing_date(self, facts: Dict[str, Any]) -> Optional[str]:
+    def _get_latest_filing_date(self, facts: CompanyFacts) -> Optional[str]:
         """Get latest filing date from facts"""
-        
-        us_gaap = facts.get('facts', {}).get('us-gaap', {})
-        
-        # Look for any metric with recent data
-        for metric_data in us_gaap.values():
-            units = metric_data.get('units', {}).get('USD', [])
-            if units:
-                latest = max(units, key=lambda x: x.get('filed', ''))
-                return latest.get('filed')
-        
-        return None
+        return facts.latest_filed()
     
     def _score_cash_flow(self, cash_flow: Optional[CashFlowMetrics]) -> str:
         """Score cash flow metrics"""
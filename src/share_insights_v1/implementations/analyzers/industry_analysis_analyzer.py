@@ -1,8 +1,10 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...interfaces.sec_data_provider import SECDataProvider
 from ...implementations.llm_providers.llm_manager import LLMManager
+from ..data_providers.sec_result_cache import filing_results
 import json
 import statistics
 
@@ -118,15 +120,21 @@ class IndustryAnalysisAnalyzer(IAnalyzer):
             return {'error': f"Enhanced industry analysis failed: {str(e)}"}
     
     def _get_sec_industry_data(self, ticker: str) -> Dict[str, Any]:
-        """Get SEC filing data for industry analysis"""
+        """Get SEC filing data for industry analysis, reused until the company files again"""
         try:
-            facts = self.sec_provider.get_filing_facts(ticker)
+            return filing_results.get_or_compute(
+                'industry_sec_data', ticker, self.sec_provider.get_filing_version(ticker),
+                lambda: self._compute_sec_industry_data(ticker)
+            )
+        except:
+            return {}
+    
+    def _compute_sec_industry_data(self, ticker: str) -> Dict[str, Any]:
+        try:
+            facts = self.sec_provider.get_company_facts(ticker)
             if not facts:
                 return {}
             
-            # Extract industry-relevant data from SEC filings
-            us_gaap = facts.get('facts', {}).get('us-gaap', {})
-            
             # Revenue concentration and customer data
             revenue_concentration = self._extract_revenue_concentration(facts)
             supplier_data = self._extract_supplier_information(facts)
@@ -673,32 +681,26 @@ Provide 5-7 most impactful catalysts with comprehensive analysis."""
         return risks[:6]  # Limit to 6 total risks
     
     # Helper methods for data extraction and fallbacks
-    def _extract_revenue_concentration(self, facts: Dict) -> str:
+    def _extract_revenue_concentration(self, facts: Any) -> str:
         """Extract revenue concentration from SEC filings"""
         # This would analyze customer concentration disclosures
         # For now, return a default assessment
         return "Moderate concentration"
     
-    def _extract_supplier_information(self, facts: Dict) -> Dict:
+    def _extract_supplier_information(self, facts: Any) -> Dict:
         """Extract supplier information from SEC filings"""
         return {'supplier_concentration': 'Medium', 'key_suppliers': []}
     
-    def _extract_regulatory_mentions(self, facts: Dict) -> List[str]:
+    def _extract_regulatory_mentions(self, facts: Any) -> List[str]:
         """Extract regulatory mentions from SEC filings"""
         return ['Standard industry regulations']
     
-    def _get_latest_filing_date(self, facts: Dict) -> Optional[str]:
+    def _get_latest_filing_date(self, facts: Any) -> Optional[str]:
         """Get latest filing date"""
         try:
-            us_gaap = facts.get('facts', {}).get('us-gaap', {})
-            for metric_data in us_gaap.values():
-                units = metric_data.get('units', {}).get('USD', [])
-                if units:
-                    latest = max(units, key=lambda x: x.get('filed', ''))
-                    return latest.get('filed')
+            return facts.latest_filed()
         except:
-            pass
-        return None
+            return None
     
     def _estimate_industry_benchmarks(self, sector: str, industry: str, market_cap: float) -> Dict:
         """Estimate industry benchmarks"""
@@ -908,4 +910,8 @@ Provide 5-7 most impactful catalysts with comprehensive analysis."""
     
     def is_applicable(self, company_type: str) -> bool:
         """Industry analysis applicable to all company types"""
-        return True
\ No newline at end of file
+        return True
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics, revenue growth from the statements and news"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS, DataSection.NEWS})
\ No newline at end of file
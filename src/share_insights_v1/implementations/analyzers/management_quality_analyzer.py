@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...interfaces.sec_data_provider import SECDataProvider
 from ...models.management_quality import (
@@ -21,7 +22,7 @@ class ManagementQualityAnalyzer(IAnalyzer):
             financial_metrics = data.get('financial_metrics', {})
             
             # Get management data (prioritize SEC, fallback to Yahoo)
-            management_data = self._get_management_data(ticker)
+            management_data = self._get_management_data(ticker, data.get('ticker_snapshot'))
             
             if not management_data:
                 return {'error': 'Could not retrieve management data'}
@@ -51,8 +52,12 @@ class ManagementQualityAnalyzer(IAnalyzer):
         """Management analysis applies to most company types"""
         excluded_types = [CompanyType.ETF.value]
         return company_type not in excluded_types
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Quote metrics and officers from the quote - the rest comes from SEC filings"""
+        return frozenset({DataSection.QUOTE})
     
-    def _get_management_data(self, ticker: str) -> Optional[Dict[str, Any]]:
+    def _get_management_data(self, ticker: str, snapshot: Optional[Any] = None) -> Optional[Dict[str, Any]]:
         """Get management data prioritizing SEC EDGAR, fallback to Yahoo"""
         
         # Try SEC EDGAR first
@@ -60,13 +65,13 @@ class ManagementQualityAnalyzer(IAnalyzer):
             sec_data = self.sec_provider.get_management_data(ticker)
             if 'error' not in sec_data:
                 # Get Yahoo data for additional details
-                yahoo_data = self.data_provider.get_management_data(ticker)
+                yahoo_data = self.data_provider.get_management_data(ticker, snapshot=snapshot)
                 if 'error' not in yahoo_data:
                     return {**sec_data, 'yahoo_data': yahoo_data}
                 return sec_data
         
         # Fallback to Yahoo Finance
-        yahoo_data = self.data_provider.get_management_data(ticker)
+        yahoo_data = self.data_provider.get_management_data(ticker, snapshot=snapshot)
         if 'error' not in yahoo_data:
             return {'yahoo_data': yahoo_data}
         
@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...interfaces.data_provider import IDataProvider
 from ...models.news_sentiment import (
     NewsSentimentReport, NewsItem, SentimentTrend, SentimentScore, NewsCategory
@@ -8,20 +9,32 @@ from ...models.company import CompanyType
 import requests
 import json
 import os
+import re
 from datetime import datetime, timedelta
 from ...implementations.llm_providers.llm_manager import LLMManager
+from ..data_providers.ticker_snapshot import TickerSnapshot
 from ...utils.prompt_formatter import PromptFormatter
 from ...utils.debug_printer import debug_print
+from ...utils import fixture_bundle
+from ...utils.article_cache import article_cache
+from ...utils.article_fetcher import article_fetcher, article_session
 
 class NewsSentimentAnalyzer(IAnalyzer):
     """Enhanced news sentiment analyzer with recent developments tracking"""
     
-    def __init__(self, data_provider: IDataProvider, llm_manager=None, debug_mode: bool = False, enable_web_scraping: bool = True, max_articles: int = 5):
+    def __init__(self, data_provider: IDataProvider, llm_manager=None, debug_mode: bool = False, enable_web_scraping: bool = True, max_articles: int = 5,
+                 batch_sentiment: Optional[bool] = None):
         self.data_provider = data_provider
         self.llm_manager = llm_manager or LLMManager()
         self.debug_mode = debug_mode
         self.enable_web_scraping = enable_web_scraping
         self.max_articles = max_articles
+        # Score a ticker's articles a few per LLM call instead of one call per article
+        if batch_sentiment is None:
+            batch_sentiment = os.getenv('NEWS_BATCH_SENTIMENT', 'true').lower() == 'true'
+        self.batch_sentiment = batch_sentiment
+        # Five fact blocks fit well inside the smallest provider output limit (2000 tokens)
+        self.sentiment_batch_size = max(1, int(os.getenv('NEWS_BATCH_SIZE', '5')))
     
     def analyze(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze news sentiment and recent developments"""
@@ -29,7 +42,7 @@ class NewsSentimentAnalyzer(IAnalyzer):
             company_info = data.get('company_info', {})
             
             # Get recent news
-            news_data = self._get_recent_news(ticker, company_info)
+            news_data = self._get_recent_news(ticker, company_info, data.get('ticker_snapshot'))
             
             if not news_data:
                 return {'error': 'Could not retrieve news data'}
@@ -77,13 +90,16 @@ class NewsSentimentAnalyzer(IAnalyzer):
     def is_applicable(self, company_type: str) -> bool:
         """News sentiment analysis applies to all company types including ETFs"""
         return True
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Company info and Yahoo news"""
+        return frozenset({DataSection.QUOTE, DataSection.NEWS})
     
-    def _get_recent_news(self, ticker: str, company_info: Dict[str, Any]) -> Optional[List[Dict]]:
+    def _get_recent_news(self, ticker: str, company_info: Dict[str, Any], snapshot: Optional[TickerSnapshot] = None) -> Optional[List[Dict]]:
         """Get recent news using yfinance"""
         
         try:
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
+            stock = snapshot or TickerSnapshot(ticker)
             
             # Get news from yfinance
             news_data = stock.news
@@ -129,16 +145,9 @@ class NewsSentimentAnalyzer(IAnalyzer):
                 click_url = content.get('clickThroughUrl', {})
                 url = canonical_url.get('url', '') or click_url.get('url', '')
                 
-                # Try to get full article content only if web scraping is enabled
-                full_content = None
-                if self.enable_web_scraping and url:
-                    full_content = self._fetch_article_content(url)
-                    if self.debug_mode and full_content and 'keep an eye on' in content.get('title', '').lower():
-                        debug_print(f"DEBUG: Scraped {len(full_content)} chars for '{content.get('title', '')[:50]}...'")
-                
                 processed_news.append({
                     'title': content.get('title', 'No title'),
-                    'summary': full_content or content.get('summary', content.get('description', 'No summary')),
+                    'summary': content.get('summary', content.get('description', 'No summary')),
                     'date': news_date,
                     'source': source,
                     'url': url,
@@ -146,6 +155,21 @@ class NewsSentimentAnalyzer(IAnalyzer):
                     'sentiment': 'neutral'
                 })
             
+            # Try to get full article content only if web scraping is enabled -
+            # stored articles first, the rest at once within the shared fetcher's deadline
+            if self.enable_web_scraping:
+                articles = {news['url']: article_cache.cached(news['url']) for news in processed_news if news['url']}
+                articles.update(article_fetcher.fetch_all(
+                    [url for url, text in articles.items() if text is None],
+                    lambda url: article_cache.get(url, lambda: self._fetch_article_content(url))
+                ))
+                for news in processed_news:
+                    full_content = articles.get(news['url'])
+                    if full_content:
+                        news['summary'] = full_content
+                    elif news['url'] in articles and self.debug_mode:
+                        debug_print(f"DEBUG: No article content for '{news['title'][:50]}...' - using Yahoo summary")
+            
             return processed_news
             
         except Exception as e:
@@ -157,14 +181,9 @@ class NewsSentimentAnalyzer(IAnalyzer):
     def _fetch_article_content(self, url: str) -> Optional[str]:
         """Fetch full article content from URL"""
         try:
-            import requests
             from bs4 import BeautifulSoup
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = fixture_bundle.through('article', url, lambda: article_session.get(url, timeout=article_fetcher.time_left(10)))
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -247,10 +266,13 @@ class NewsSentimentAnalyzer(IAnalyzer):
         news_items = []
         sentiment_scores = []
         
-        for news in news_data:
-            # Analyze sentiment using AI (or rule-based for demo)
-            sentiment_result = self._analyze_text_sentiment(news['title'], news['summary'], ticker)
-            
+        # Analyze sentiment using AI (or rule-based for demo)
+        if self.enable_web_scraping and self.batch_sentiment and ticker and len(news_data) > 1:
+            sentiment_results = self._analyze_batch_sentiment(news_data, ticker)
+        else:
+            sentiment_results = [self._analyze_text_sentiment(news['title'], news['summary'], ticker) for news in news_data]
+        
+        for news, sentiment_result in zip(news_data, sentiment_results):
             category = self._categorize_news(news)
             
             news_item = NewsItem(
@@ -390,6 +412,100 @@ Sentiment score: -1.0 (very negative) to 1.0 (very positive)"""
         # Fallback to rule-based when web scraping disabled
         return self._get_fallback_sentiment(title, summary, ticker)
 
+
+    def _analyze_batch_sentiment(self, news_data: List[Dict], ticker: str) -> List[Dict[str, float]]:
+        """Extract fact blocks for the articles `sentiment_batch_size` at a time.
+
+        Larger batches would run past the provider's output limit and cut off
+        the last articles' blocks, so a ticker with many articles takes a few
+        calls rather than one.
+        """
+        results = []
+        for start in range(0, len(news_data), self.sentiment_batch_size):
+            results.extend(self._score_article_batch(news_data[start:start + self.sentiment_batch_size], ticker))
+        return results
+
+    def _score_article_batch(self, news_data: List[Dict], ticker: str) -> List[Dict[str, float]]:
+        """Extract fact blocks for a batch of articles with a single LLM call.
+
+        Each article's block is parsed on its own, so a malformed or missing
+        entry (or a response cut off part way) only sends that article to the
+        rule-based fallback.
+        """
+        articles = "\n\n".join(
+            f"[ARTICLE {index}]\nTitle: {news['title']}\nContent: {news['summary']}"
+            for index, news in enumerate(news_data, 1)
+        )
+        batch_prompt = f"""🎯 OBJECTIVE: Extract institutional-grade "Fact Blocks" from each of the following {len(news_data)} news articles to feed into a financial modeling engine for {ticker}.
+
+ARTICLES:
+{articles}
+
+FOR EACH ARTICLE:
+1. **The Lead Fact**: What is the specific event? (e.g., $50M contract win, Q3 earnings beat of 5%, CEO departure).
+2. **Quantitative Evidence**: Quote exact numbers, dollar amounts, or percentages from the article.
+3. **The "Why it Matters" (Mechanism)**: How does this specifically change {ticker}'s business? (e.g., "Expands gross margin by reducing supply chain lag").
+4. **Verbatim Quote**: One high-impact quote for attribution (if available in content).
+5. **Sentiment Score**: Rate impact on {ticker} from -1.0 (very negative) to +1.0 (very positive).
+
+🚫 RESTRAINT: Do not provide an "opinion" or "summary." Provide only raw, structured data blocks.
+
+Return JSON with one entry per article, "index" matching its [ARTICLE n] number:"""
+
+        schema = {
+            "articles": [{
+                "index": 1,
+                "lead_fact": "Specific event description",
+                "quantitative_evidence": "Exact numbers/amounts from article",
+                "business_mechanism": "How this changes the business",
+                "verbatim_quote": "Direct quote from article (if available)",
+                "sentiment_score": 0.0,
+                "confidence": 0.8
+            }]
+        }
+
+        results: Dict[int, Dict[str, float]] = {}
+        try:
+            provider_name = PromptFormatter.get_provider_name_from_llm_manager(self.llm_manager)
+            prompt = batch_prompt + "\n" + PromptFormatter._format_json_schema(schema)
+            prompt = PromptFormatter.format_json_prompt(prompt, provider_name)
+            response = self.llm_manager.generate_response(prompt)
+            results = self._parse_batch_sentiment(response, len(news_data))
+            debug_print(f"🔍 DEBUG: Batch LLM response for {ticker} covered {len(results)}/{len(news_data)} articles")
+        except Exception as e:
+            if self.debug_mode:
+                debug_print(f"Batch sentiment analysis error for {ticker}: {e}")
+
+        return [results.get(index) or self._get_fallback_sentiment(news['title'], news['summary'], ticker)
+                for index, news in enumerate(news_data, 1)]
+
+    def _parse_batch_sentiment(self, response: str, count: int) -> Dict[int, Dict[str, float]]:
+        """Per-article results from a batch response, keyed by article number"""
+        results = {}
+        # Article blocks are flat objects - read each one independently
+        for block in re.findall(r'\{[^{}]*\}', response):
+            try:
+                result = json.loads(block)
+                index = int(result['index'])
+                score = float(result['sentiment_score'])
+            except (ValueError, KeyError, TypeError):
+                continue
+            if not 1 <= index <= count or index in results:
+                continue
+            enhanced_facts = None
+            if 'lead_fact' in result:
+                enhanced_facts = {
+                    'lead_fact': result.get('lead_fact', ''),
+                    'quantitative_evidence': result.get('quantitative_evidence', ''),
+                    'business_mechanism': result.get('business_mechanism', ''),
+                    'verbatim_quote': result.get('verbatim_quote', '')
+                }
+            results[index] = {
+                'score': score,
+                'confidence': result.get('confidence', 0.5),
+                'enhanced_facts': enhanced_facts
+            }
+        return results
     
     def _get_fallback_sentiment(self, title: str, summary: str, ticker: str = None) -> Dict[str, float]:
         """Fallback rule-based sentiment analysis with ticker-specific focus"""
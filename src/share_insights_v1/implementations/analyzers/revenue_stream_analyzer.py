@@ -1,10 +1,12 @@
-from typing import Dict, Any, List
-import yfinance as yf
+from typing import Dict, Any, List, FrozenSet
 import pandas as pd
 import numpy as np
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...models.company import CompanyType
 from ...implementations.llm_providers.llm_manager import LLMManager
+from ..data_providers.ticker_snapshot import TickerSnapshot, snapshot_for
+from ..data_providers.market_reference import market_reference
 
 class RevenueStreamAnalyzer(IAnalyzer):
     """Analyzes revenue streams and estimates earnings based on market indicators"""
@@ -36,12 +38,13 @@ class RevenueStreamAnalyzer(IAnalyzer):
             sector = financial_metrics.get('sector', 'Unknown')
             industry = financial_metrics.get('industry', 'Unknown')
             business_summary = financial_metrics.get('longBusinessSummary', '')
+            snapshot = snapshot_for(ticker, data)
             
             # Get revenue breakdown
-            revenue_streams = self._identify_revenue_streams(ticker, financial_metrics, business_summary)
+            revenue_streams = self._identify_revenue_streams(ticker, financial_metrics, business_summary, snapshot)
             
             # Analyze market correlations
-            market_analysis = self._analyze_market_correlations(ticker, sector)
+            market_analysis = self._analyze_market_correlations(ticker, sector, snapshot)
             
             # Estimate earnings based on market trends
             earnings_forecast = self._estimate_market_based_earnings(ticker, financial_metrics, market_analysis)
@@ -63,10 +66,10 @@ class RevenueStreamAnalyzer(IAnalyzer):
         except Exception as e:
             return {'error': f'Revenue stream analysis failed: {str(e)}'}
     
-    def _identify_revenue_streams(self, ticker: str, financial_metrics: Dict, business_summary: str) -> Dict[str, Any]:
+    def _identify_revenue_streams(self, ticker: str, financial_metrics: Dict, business_summary: str, snapshot: TickerSnapshot = None) -> Dict[str, Any]:
         """Identify and categorize revenue streams"""
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or TickerSnapshot(ticker)
             
             # Get segment data if available
             segments = {}
@@ -179,20 +182,32 @@ class RevenueStreamAnalyzer(IAnalyzer):
         
         return compositions.get(revenue_model, compositions['Diversified/Other'])
     
-    def _analyze_market_correlations(self, ticker: str, sector: str) -> Dict[str, Any]:
+    @staticmethod
+    def _by_trading_date(closes: pd.Series) -> pd.Series:
+        """Index closes by exchange-local date. Batch-prefetched prices come back
+        tz-naive while history() is tz-aware, and pandas won't join the two."""
+        if getattr(closes.index, 'tz', None) is not None:
+            closes = closes.copy()
+            closes.index = closes.index.tz_localize(None).normalize()
+        return closes
+
+    def _analyze_market_correlations(self, ticker: str, sector: str, snapshot: TickerSnapshot = None) -> Dict[str, Any]:
         """Analyze correlations with market indicators"""
         try:
             # Get sector ETFs
             sector_etfs = self.sector_indicators.get(sector, ['SPY'])  # Default to S&P 500
             
-            # Get price data for correlation analysis
-            stock = yf.Ticker(ticker)
-            stock_data = stock.history(period='1y')['Close']
+            # Get price data for correlation analysis - same 1y history the
+            # provider already pulled for this run's price_data
+            stock = snapshot or TickerSnapshot(ticker)
+            stock_data = self._by_trading_date(stock.history(period='1y')['Close'])
             
             correlations = {}
             for etf in sector_etfs[:2]:  # Limit to 2 ETFs to avoid rate limits
                 try:
-                    etf_data = yf.Ticker(etf).history(period='1y')['Close']
+                    # Sector ETFs repeat across every ticker in a batch - held
+                    # process-wide until the next market close
+                    etf_data = self._by_trading_date(market_reference.closes(etf, '1y'))
                     if len(stock_data) > 0 and len(etf_data) > 0:
                         # Align data and calculate correlation
                         aligned_data = pd.concat([stock_data, etf_data], axis=1, join='inner')
@@ -342,4 +357,8 @@ class RevenueStreamAnalyzer(IAnalyzer):
     
     def is_applicable(self, company_type: str) -> bool:
         """Revenue stream analysis applies to all company types"""
-        return True
\ No newline at end of file
+        return True
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Income statements and price history"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS, DataSection.PRICES})
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, FrozenSet
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...models.company import CompanyType
 from ...config.config import FinanceConfig
-import yfinance as yf
+from ..data_providers.ticker_snapshot import snapshot_for
 import numpy as np
 
 class StartupAnalyzer(IAnalyzer):
@@ -18,7 +19,7 @@ class StartupAnalyzer(IAnalyzer):
             company_info = data.get('company_info', {})
             sector = company_info.get('sector', '')
             industry = company_info.get('industry', '')
-            stock = yf.Ticker(ticker)
+            stock = snapshot_for(ticker, data)
             revenue_data = data.get('revenue_data_statements', {})
             cashflow = stock.cashflow
             income_stmt = stock.income_stmt
@@ -309,4 +310,8 @@ class StartupAnalyzer(IAnalyzer):
     
     def is_applicable(self, company_type: str) -> bool:
         """Startup analysis only applies to loss-making companies"""
-        return company_type == CompanyType.STARTUP_LOSS_MAKING.value
\ No newline at end of file
+        return company_type == CompanyType.STARTUP_LOSS_MAKING.value
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Cash flow and income statements"""
+        return frozenset({DataSection.QUOTE, DataSection.STATEMENTS})
\ No newline at end of file
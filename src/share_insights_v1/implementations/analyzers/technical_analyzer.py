@@ -1,7 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet
 import pandas as pd
 import numpy as np
 from ...interfaces.analyzer import IAnalyzer
+from ...models.data_section import DataSection
 from ...models.company import CompanyType
 import pandas_ta as pd_ta
 
@@ -509,4 +510,8 @@ class TechnicalAnalyzer(IAnalyzer):
     
     def is_applicable(self, company_type: str) -> bool:
         """Technical analysis applies to all company types"""
-        return True
\ No newline at end of file
+        return True
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Price history only"""
+        return frozenset({DataSection.PRICES})
\ No newline at end of file
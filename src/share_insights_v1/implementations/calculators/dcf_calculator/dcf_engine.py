@@ -19,16 +19,17 @@ class DCFEngine:
     def calculate_dcf(self, ticker_symbol: str, ticker=None) -> Dict:
         """Main DCF calculation using config parameters (already adjusted by analyzer).
 
-        `ticker` may be a pre-built yf.Ticker to reuse across multiple scenario
-        calculations for the same symbol (yfinance lazily caches .info/.cashflow/
-        .income_stmt per-instance, so reusing one avoids redundant fetches when
-        running several scenarios back to back). Built internally if not provided.
+        `ticker` may be a pre-built yf.Ticker or TickerSnapshot to reuse across
+        multiple scenario calculations for the same symbol (both cache .info/
+        .cashflow/.income_stmt per-instance, so reusing one avoids redundant
+        fetches when running several scenarios back to back). A disk-cached
+        TickerSnapshot is built internally if not provided.
         """
-        import yfinance as yf
         from ....models.company import CompanyType
+        from ...data_providers.ticker_snapshot import TickerSnapshot
 
         if ticker is None:
-            ticker = yf.Ticker(ticker_symbol)
+            ticker = TickerSnapshot(ticker_symbol)
 
         # Get company type from config (passed by analyzer)
         company_type = getattr(self.config, 'company_type', None)
@@ -2,7 +2,7 @@ from typing import Dict
 from ....utils.debug_printer import debug_print
 from ....utils import beta_calculator
 from ....config.config import FinanceConfig
-import yfinance as yf
+from ...data_providers.market_reference import market_reference
 
 class WACCCalculator:
     """Handles WACC and cost of capital calculations"""
@@ -42,7 +42,7 @@ class WACCCalculator:
 
     def _calculate_cost_of_equity(self, ticker):
         """Calculate cost of equity using CAPM. Returns (cost_equity, risk_free_rate)."""
-        beta = beta_calculator.BetaCalculator(ticker_symbol=ticker.info.get('symbol')).get_beta_with_fallbacks()
+        beta = beta_calculator.BetaCalculator(ticker_symbol=ticker.info.get('symbol'), ticker=ticker).get_beta_with_fallbacks()
         risk_free_rate = self._get_risk_free_rate()
 
         cost_equity = risk_free_rate + beta * (self.config.market_return - risk_free_rate)
@@ -52,10 +52,5 @@ class WACCCalculator:
         """Get risk-free rate from 10-year treasury, or a scenario override if configured"""
         if self.config.risk_free_rate_override is not None:
             return self.config.risk_free_rate_override
-        try:
-            treasury = yf.Ticker(ticker_symbol)
-            risk_free_rate = treasury.info['previousClose'] / 100
-            return risk_free_rate
-        except:
-            debug_print("Warning: Could not fetch risk-free rate, using default")
-            return 0.04  # Default 4%
\ No newline at end of file
+        # Shared across every scenario and ticker until the next market close
+        return market_reference.risk_free_rate(ticker_symbol, default=0.04)
\ No newline at end of file
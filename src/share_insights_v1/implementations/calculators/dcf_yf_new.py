@@ -18,10 +18,9 @@ def get_share_price(ticker_symbol: str, config: FinanceConfig = None, ticker=Non
 
 # Maintain backward compatibility for individual functions if needed
 def get_stock_ticker_object(ticker):
-    import yfinance as yf
-    return yf.Ticker(ticker)
+    from ..data_providers.ticker_snapshot import TickerSnapshot
+    return TickerSnapshot(ticker)
 
 def get_risk_free_rate(ticker='^TNX'):
-    import yfinance as yf
-    stock = yf.Ticker(ticker)
-    return stock.info['previousClose'] / 100
\ No newline at end of file
+    from ..data_providers.market_reference import market_reference
+    return market_reference.risk_free_rate(ticker)
\ No newline at end of file
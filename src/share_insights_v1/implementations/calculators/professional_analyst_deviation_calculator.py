@@ -1,4 +1,4 @@
-import yfinance as yf
+from ..data_providers.ticker_snapshot import TickerSnapshot
 import requests
 import pandas as pd
 import numpy as np
@@ -15,7 +15,7 @@ class ProfessionalAnalystData:
         
         data = {}
         try:
-            stock = yf.Ticker(ticker)
+            stock = TickerSnapshot(ticker)
             info = stock.info
             
             # Price targets
@@ -0,0 +1,81 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+from ...interfaces.data_provider import IAsyncDataProvider
+from ...models.data_section import DataSection, resolve_sections
+from .ticker_snapshot import TickerSnapshot
+from .yahoo_provider import YahooFinanceProvider
+
+# Every AsyncYahooFinanceProvider shares this pool, so the number of threads
+# doing Yahoo I/O stays fixed however many API requests are awaiting data
+yahoo_io_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('YAHOO_IO_WORKERS', '16')),
+    thread_name_prefix='yahoo-io',
+)
+
+
+class AsyncYahooFinanceProvider(IAsyncDataProvider):
+    """Yahoo Finance data as coroutines, for the FastAPI service.
+
+    yfinance has no async client, so each blocking fetch runs on the shared,
+    bounded `yahoo_io_executor` while the event loop keeps serving other
+    requests. Results come from the wrapped YahooFinanceProvider and its
+    TickerSnapshot, so the disk cache, price store, request pacing and
+    single-flight coalescing all still apply.
+    """
+
+    # Snapshot resources an orchestrator run reads (provider calls plus analyzers),
+    # by data section - price history is warmed separately through the PriceStore
+    WARM_RESOURCES = {
+        DataSection.QUOTE: ('info',),
+        DataSection.STATEMENTS: ('income_stmt', 'quarterly_income_stmt', 'cashflow', 'balance_sheet'),
+        DataSection.DIVIDENDS: ('dividends',),
+        DataSection.ANALYST: ('upgrades_downgrades',),
+        DataSection.NEWS: ('news',),
+    }
+
+    def __init__(self, provider: Optional[YahooFinanceProvider] = None):
+        self.provider = provider or YahooFinanceProvider()
+
+    def create_snapshot(self, ticker: str) -> TickerSnapshot:
+        return self.provider.create_snapshot(ticker)
+
+    async def warm_snapshot(self, ticker: str, snapshot: Optional[TickerSnapshot] = None,
+                            sections: Optional[Iterable[DataSection]] = None) -> TickerSnapshot:
+        """Load everything an analysis run reads, concurrently, before it starts.
+
+        `sections` is the run's data plan (AnalysisOrchestrator.data_requirements);
+        None warms every section. Failed resources are left unloaded - the run
+        that needs them retries and reports the error the same way it would
+        have without warming.
+        """
+        sections = resolve_sections(sections)
+        snapshot = snapshot or self.create_snapshot(ticker)
+        loads = [
+            self._run(getattr, snapshot, resource)
+            for section, resources in self.WARM_RESOURCES.items() if section in sections
+            for resource in resources
+        ]
+        if DataSection.PRICES in sections:
+            loads.append(self._run(snapshot.history, period=self.provider.PRICE_HISTORY_PERIOD))
+        await asyncio.gather(*loads, return_exceptions=True)
+        return snapshot
+
+    async def get_financial_metrics(self, ticker: str, snapshot: Optional[TickerSnapshot] = None,
+                                    sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Any]:
+        return await self._run(self.provider.get_financial_metrics, ticker, snapshot=snapshot, sections=sections)
+
+    async def get_price_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict[str, Any]:
+        return await self._run(self.provider.get_price_data, ticker, snapshot=snapshot)
+
+    async def get_professional_analyst_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict[str, Any]:
+        return await self._run(self.provider.get_professional_analyst_data, ticker, snapshot=snapshot)
+
+    async def get_management_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict[str, Any]:
+        return await self._run(self.provider.get_management_data, ticker, snapshot=snapshot)
+
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(yahoo_io_executor, functools.partial(fn, *args, **kwargs))
@@ -0,0 +1,109 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from ...utils.debug_printer import debug_print
+from .ticker_snapshot import TickerSnapshot
+
+# Reference series settle shortly after the US close; everything fetched
+# before then stays valid until the following close
+MARKET_TZ = ZoneInfo('America/New_York')
+SETTLE_TIME = (16, 30)
+
+
+def next_settle(after: datetime) -> datetime:
+    """First US close (plus settle buffer) strictly after `after`, skipping weekends"""
+    local = after.astimezone(MARKET_TZ)
+    candidate = local.replace(hour=SETTLE_TIME[0], minute=SETTLE_TIME[1], second=0, microsecond=0)
+    if candidate <= local:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+class MarketReferenceData:
+    """Process-wide source for the series every analysis shares.
+
+    The benchmark index (^GSPC) for beta, the 10-year treasury yield (^TNX) for
+    WACC and the sector ETF histories for revenue stream correlations are the
+    same for every ticker in a batch, yet each caller used to download its own
+    copy - per stock, and for ^TNX per DCF scenario. This service fetches each
+    series once and keeps it until the next US market close, so a batch run pays
+    for them once per trading day.
+    """
+
+    def __init__(self):
+        self._values: Dict[Tuple, Tuple[Any, datetime]] = {}
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.hits = 0
+        self.fetches = 0
+
+    def closes(self, symbol: str, period: str = '1y') -> pd.Series:
+        """Daily closes for an index or ETF (empty Series if unavailable)"""
+        def load():
+            history = TickerSnapshot(symbol).history(period=period)
+            return history['Close'] if history is not None and not history.empty else pd.Series(dtype='float64')
+        return self._get(('closes', symbol, period), load)
+
+    def benchmark_closes(self, period: str = '2y', symbol: str = '^GSPC') -> pd.Series:
+        """Benchmark index closes used for beta regressions"""
+        return self.closes(symbol, period)
+
+    def risk_free_rate(self, symbol: str = '^TNX', default: float = 0.04) -> float:
+        """Latest 10-year treasury yield as a decimal, or `default` if Yahoo has none"""
+        def load():
+            return TickerSnapshot(symbol).info['previousClose'] / 100
+        try:
+            return self._get(('rate', symbol), load)
+        except Exception:
+            debug_print("Warning: Could not fetch risk-free rate, using default")
+            return default
+
+    def invalidate(self):
+        """Drop everything held (e.g. after a rate decision mid-session)"""
+        with self._guard:
+            self._values.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._guard:
+            return {'hits': self.hits, 'fetches': self.fetches, 'series_held': len(self._values)}
+
+    def _get(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        value = self._fresh(key)
+        if value is not None:
+            return value
+
+        with self._lock_for(key):
+            # Another thread may have loaded it while we waited
+            value = self._fresh(key)
+            if value is not None:
+                return value
+            value = load()
+            with self._guard:
+                self.fetches += 1
+                self._values[key] = (value, next_settle(datetime.now(MARKET_TZ)))
+            return value
+
+    def _fresh(self, key: Tuple) -> Optional[Any]:
+        with self._guard:
+            entry = self._values.get(key)
+            if entry is None or datetime.now(MARKET_TZ) >= entry[1]:
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def _lock_for(self, key: Tuple) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+
+# Global instance shared by WACC, beta and revenue stream calculations
+market_reference = MarketReferenceData()
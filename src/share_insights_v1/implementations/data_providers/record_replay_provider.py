@@ -0,0 +1,28 @@
+from ...utils.fixture_bundle import FixtureBundle, use_bundle
+from .yahoo_provider import YahooFinanceProvider
+
+
+class RecordReplayDataProvider(YahooFinanceProvider):
+    """Yahoo provider that records to, or replays from, a fixture bundle.
+
+    Constructing one activates the bundle process-wide, so besides the Yahoo
+    data behind this provider (including the snapshots analyzers, WACC and
+    market reference data build themselves) the SEC EDGAR requests, news
+    article scraping and LLMManager prompts of the run are recorded or replayed
+    too. Use mode='record' once against the live services for a set of
+    tickers, then mode='replay' for offline, deterministic runs: orchestrator
+    benchmarks, analyzer profiling, re-running a historical batch.
+
+    Entry points that build their own YahooFinanceProvider (batch scripts,
+    the API) get the same behaviour from FIXTURE_MODE / FIXTURE_BUNDLE_DIR.
+    """
+
+    def __init__(self, bundle_path: str, mode: str = 'replay'):
+        super().__init__()
+        self.bundle = FixtureBundle(bundle_path, mode=mode)
+        use_bundle(self.bundle)
+
+    def close(self):
+        """Write the bundle manifest and switch recording/replay off"""
+        self.bundle.write_manifest()
+        use_bundle(None)
@@ -0,0 +1,122 @@
+import json
+import os
+import re
+import threading
+import zipfile
+from typing import Any, Dict, Iterable, List, Optional
+
+from .sec_facts_store import CompanyFacts, FactsStore
+from .sec_submissions import FilingIndex
+
+MEMBER_PATTERN = re.compile(r'^CIK(\d{10})\.json$')
+
+
+class SECBulkArchive:
+    """EDGAR's nightly bulk archives (companyfacts.zip, submissions.zip) as a
+    local data source.
+
+    Both archives hold one JSON document per company, named CIK##########.json,
+    with the same content the per-company API endpoints return. A lookup is
+    a read of that one member through the zip's central directory - the
+    archive itself (tens of GB uncompressed) is never extracted or loaded - so
+    a full-exchange run reads local disk instead of making two rate-limited
+    HTTP calls per ticker.
+    """
+
+    def __init__(self, companyfacts_path: Optional[str] = None, submissions_path: Optional[str] = None):
+        self.companyfacts_path = companyfacts_path
+        self.submissions_path = submissions_path
+        self.lock = threading.Lock()
+        self._archives: Dict[str, zipfile.ZipFile] = {}
+        self.stats = {'reads': 0, 'misses': 0}
+
+    @classmethod
+    def from_dir(cls, directory: Optional[str]) -> Optional['SECBulkArchive']:
+        """Archive over `directory`/companyfacts.zip and submissions.zip, or
+        None if neither file is there"""
+        if not directory:
+            return None
+        paths = [os.path.join(directory, name) for name in ('companyfacts.zip', 'submissions.zip')]
+        paths = [path if os.path.isfile(path) else None for path in paths]
+        return cls(*paths) if any(paths) else None
+
+    def company_facts(self, cik: int) -> Optional[Dict[str, Any]]:
+        """companyfacts document for `cik`, or None if the archive doesn't have it"""
+        return self._read(self.companyfacts_path, cik)
+
+    def submissions(self, cik: int) -> Optional[Dict[str, Any]]:
+        """submissions document (recent filings) for `cik`"""
+        return self._read(self.submissions_path, cik)
+
+    def ciks(self) -> List[int]:
+        """Every company with a companyfacts document in the archive"""
+        archive = self._archive(self.companyfacts_path)
+        if archive is None:
+            return []
+        matches = (MEMBER_PATTERN.match(name) for name in archive.namelist())
+        return [int(match.group(1)) for match in matches if match]
+
+    def load_facts_store(self, store: FactsStore, ciks: Optional[Iterable[int]] = None) -> int:
+        """Parse company facts from the archive into `store` ahead of a run.
+        Returns the number of companies loaded.
+
+        Each entry is stamped with the company's latest 10-K/10-Q accession
+        from submissions.zip - the version SECEdgarProvider asks the store for -
+        so the run serves it instead of parsing the member again. Without
+        submissions.zip nothing is preloaded, since unversioned entries would
+        never be used.
+        """
+        if not self.submissions_path:
+            return 0
+        loaded = 0
+        for cik in (self.ciks() if ciks is None else ciks):
+            data = self.company_facts(cik)
+            submissions = self.submissions(cik)
+            if data and submissions:
+                facts = CompanyFacts.from_json(data)
+                facts.version = FilingIndex.from_submissions(submissions).latest_accession()
+                store.put(cik, facts)
+                loaded += 1
+        return loaded
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+    def close(self):
+        with self.lock:
+            for archive in self._archives.values():
+                archive.close()
+            self._archives.clear()
+
+    def _read(self, path: Optional[str], cik: int) -> Optional[Dict[str, Any]]:
+        archive = self._archive(path)
+        if archive is None:
+            return None
+        try:
+            # ZipFile serialises reads of its shared file handle, so analyzer
+            # threads can read different members concurrently
+            with archive.open(f"CIK{cik:010d}.json") as member:
+                data = json.load(member)
+        except KeyError:
+            self._count('misses')
+            return None
+        self._count('reads')
+        return data
+
+    def _archive(self, path: Optional[str]) -> Optional[zipfile.ZipFile]:
+        if not path:
+            return None
+        with self.lock:
+            if path not in self._archives:
+                self._archives[path] = zipfile.ZipFile(path)
+            return self._archives[path]
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+
+# Archives under SEC_BULK_DIR, when configured - used by every SECEdgarProvider
+# in place of the per-company submissions and companyfacts endpoints
+bulk_archive = SECBulkArchive.from_dir(os.getenv('SEC_BULK_DIR'))
@@ -0,0 +1,200 @@
+import os
+import re
+import tempfile
+import threading
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Optional
+
+from ...utils.single_flight import SingleFlight
+
+# "Item 1. Business" heading and the headings that end the section
+SECTION_START = re.compile(r'Item\s*1\s*[\.:\-–—]?\s*Business', re.IGNORECASE)
+SECTION_END = re.compile(r'Item\s*1A|Item\s*2', re.IGNORECASE)
+
+# A "section" shorter than this is the table-of-contents entry, not Item 1 itself
+MIN_SECTION_CHARS = 300
+
+FALLBACK_KEYWORDS = ('products', 'services', 'operations', 'segments', 'revenue')
+NOT_FOUND = "Business description not found in filing"
+
+
+class _TextStream(HTMLParser):
+    """Incremental HTML -> text: tags become spaces, entities are decoded"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        self.parts.append(' ')
+
+    def handle_endtag(self, tag):
+        self.parts.append(' ')
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def read(self, html: str) -> str:
+        self.feed(html)
+        text = ''.join(self.parts)
+        self.parts = []
+        return text
+
+
+class BusinessSectionExtractor:
+    """Pulls the Item 1 - Business section out of a 10-K as it streams in.
+
+    Feed it chunks of the primary document's HTML; markup is stripped and
+    whitespace collapsed chunk by chunk, and only a small window of text is
+    kept while looking for the heading. feed() returns True as soon as the
+    section has ended (Item 1A / Item 2) or `limit` characters of it are in
+    hand, so the caller can stop downloading - usually a small fraction of
+    the filing. Table-of-contents entries are skipped.
+    """
+
+    def __init__(self, limit: int = 5000, head_chars: int = 10000):
+        self.limit = limit
+        self.head_chars = head_chars
+        self.head = ''
+        self.done = False
+        self._parser = _TextStream()
+        self._text = ''
+        self._in_section = False
+        self._section: Optional[str] = None
+
+    def feed(self, html: str) -> bool:
+        """Add a chunk of HTML. Returns True once the section is complete."""
+        if self.done:
+            return True
+        text = self._parser.read(html)
+        if len(self.head) < self.head_chars:
+            self.head = re.sub(r'\s+', ' ', self.head + text)[:self.head_chars]
+        self._text = re.sub(r'\s+', ' ', self._text + text)
+        self._scan()
+        return self.done
+
+    def result(self) -> str:
+        """The section (at most `limit` chars), or the fallback once input ends"""
+        self._parser.close()
+        if self._section is None and self._in_section:
+            self._section = self._text[:self.limit].strip()
+        if self._section:
+            return self._section
+        # No Item 1 heading - fall back to the start of the document if it
+        # reads like a business description
+        head = self.head.strip()
+        if any(keyword in head.lower() for keyword in FALLBACK_KEYWORDS):
+            return head
+        return NOT_FOUND
+
+    def _scan(self):
+        while not self.done:
+            if not self._in_section:
+                start = SECTION_START.search(self._text)
+                if not start:
+                    # Keep enough tail for a heading split across chunks
+                    self._text = self._text[-64:]
+                    return
+                self._text = self._text[start.start():]
+                self._in_section = True
+
+            heading = SECTION_START.match(self._text)
+            end = SECTION_END.search(self._text, heading.end() if heading else 0)
+            if end and end.start() < MIN_SECTION_CHARS:
+                # Table of contents - keep looking after this entry
+                self._text = self._text[end.start():]
+                self._in_section = False
+                continue
+            if end and end.start() <= self.limit:
+                self._section = self._text[:end.start()].strip()
+                self.done = True
+            elif len(self._text) >= self.limit + 16:
+                self._section = self._text[:self.limit].strip()
+                self.done = True
+            return
+
+
+def extract_business_section(chunks: Iterable[str], limit: int = 5000) -> str:
+    """Item 1 - Business from an iterable of HTML chunks, reading no further than needed"""
+    extractor = BusinessSectionExtractor(limit=limit)
+    for chunk in chunks:
+        if extractor.feed(chunk):
+            break
+    return extractor.result()
+
+
+class BusinessSectionStore:
+    """Extracted business sections on disk, keyed by filing accession number.
+
+    A filing never changes once accepted, so each 10-K is downloaded and
+    parsed once; every later business-model or industry run - in this process
+    or the next - reads the stored text. Concurrent requests for the same
+    filing share one extraction.
+    """
+
+    def __init__(self, store_dir: str, enabled: bool = True):
+        self.store_dir = store_dir
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.stats = {'hits': 0, 'extractions': 0}
+
+    def get(self, accession_number: str, extract: Callable[[], Optional[str]]) -> Optional[str]:
+        """Stored section for the filing; `extract` produces it (None on failure)"""
+        text = self._stored(accession_number)
+        if text is not None:
+            return text
+        return self._flight.do(accession_number, lambda: self._extract(accession_number, extract))
+
+    def _extract(self, accession_number: str, extract: Callable[[], Optional[str]]) -> Optional[str]:
+        # An earlier flight may have stored it since the check in get()
+        text = self._stored(accession_number)
+        if text is not None:
+            return text
+
+        text = extract()
+        if text is None:
+            return None
+        self._count('extractions')
+        if self.enabled:
+            self._save(self._path(accession_number), text)
+        return text
+
+    def _stored(self, accession_number: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(accession_number), encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+        self._count('hits')
+        return text
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+    def _save(self, path: str, text: str):
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # extracted again next time
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def _path(self, accession_number: str) -> str:
+        return os.path.join(self.store_dir, f"{accession_number}.txt")
+
+
+# Global store shared by every SECEdgarProvider in the process
+business_sections = BusinessSectionStore(
+    store_dir=os.path.join(os.getenv('SEC_CACHE_DIR', os.path.join('.cache', 'sec')), 'business'),
+    enabled=os.getenv('SEC_CACHE_ENABLED', 'true').lower() == 'true',
+)
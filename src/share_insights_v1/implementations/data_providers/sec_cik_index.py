@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+DAY = 24 * 60 * 60
+
+
+class CikIndex:
+    """Ticker -> CIK map built from SEC's company_tickers.json.
+
+    The SEC file is several MB and SECEdgarProvider used to download it for
+    every lookup - once per SEC method, several times per analysis. The index
+    keeps the parsed map in memory for the life of the process and persists it
+    to disk, so it is downloaded at most once a day (`ttl`) across runs. If the
+    daily refresh fails, the previous copy keeps being served.
+    """
+
+    def __init__(self, path: str, ttl: float = DAY, enabled: bool = True):
+        self.path = path
+        self.ttl = ttl
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.downloads = 0
+        self._ciks: Optional[Dict[str, int]] = None
+        self._fetched_at = 0.0
+
+    def lookup(self, ticker: str, fetch: Callable[[], Optional[Dict[str, Any]]]) -> Optional[int]:
+        """CIK for `ticker`, or None if the SEC doesn't list it.
+
+        `fetch` returns the parsed company_tickers.json (or None on failure);
+        it is only called when neither memory nor disk has a fresh copy.
+        """
+        with self.lock:
+            if self._ciks is None:
+                self._load()
+            if self._ciks is None or time.time() - self._fetched_at > self.ttl:
+                self._refresh(fetch)
+            return (self._ciks or {}).get(ticker.upper())
+
+    def invalidate(self):
+        """Force a re-download on the next lookup"""
+        with self.lock:
+            self._ciks = None
+            self._fetched_at = 0.0
+            if self.enabled:
+                try:
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'tickers': len(self._ciks or {}),
+                'age_hours': round((time.time() - self._fetched_at) / 3600, 1) if self._fetched_at else None,
+                'downloads': self.downloads,
+            }
+
+    def _refresh(self, fetch: Callable[[], Optional[Dict[str, Any]]]):
+        data = fetch()
+        if not data:
+            return  # keep serving the stale copy, if any
+        self.downloads += 1
+        # company_tickers.json is {"0": {"cik_str": 320193, "ticker": "AAPL", ...}, ...}
+        self._ciks = {
+            entry['ticker'].upper(): int(entry['cik_str'])
+            for entry in data.values() if entry.get('ticker') and entry.get('cik_str') is not None
+        }
+        self._fetched_at = time.time()
+        self._save()
+
+    def _load(self):
+        if not self.enabled:
+            return
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            self._ciks = stored['ciks']
+            self._fetched_at = stored['fetched_at']
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    def _save(self):
+        if not self.enabled:
+            return
+        directory = os.path.dirname(self.path) or '.'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'fetched_at': self._fetched_at, 'ciks': self._ciks}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # in-memory copy still serves this process
+
+
+# Global index shared by every SECEdgarProvider in the process
+cik_index = CikIndex(
+    path=os.path.join(os.getenv('SEC_CACHE_DIR', os.path.join('.cache', 'sec')), 'cik_index.json'),
+    enabled=os.getenv('SEC_CACHE_ENABLED', 'true').lower() == 'true',
+)
@@ -1,50 +1,126 @@
+import codecs
+import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, Any, Optional
 from ...interfaces.sec_data_provider import SECDataProvider
-import time
 from ...utils.debug_printer import debug_print
+from ...utils import fixture_bundle
+from ...utils.rate_limiter import sec_limiter
+from .sec_cik_index import cik_index
+from .sec_submissions import FilingIndex, submissions_cache
+from .sec_facts_store import CompanyFacts, facts_store
+from .sec_business_section import business_sections, extract_business_section
+from .sec_bulk_archive import SECBulkArchive, bulk_archive as default_bulk_archive
+
+SEC_HEADERS = {
+    'User-Agent': 'StockAnalysisFramework admin@stockanalysis.dev',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session for sec.gov / data.sec.gov, sized for the analyzer
+    threads that share it"""
+    session = requests.Session()
+    session.headers.update(SEC_HEADERS)
+    pool_size = int(os.getenv('SEC_HTTP_POOL_SIZE', '16'))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    return session
+
+
+# Process-wide session - connections are reused across requests, threads and providers
+sec_session = _make_session()
+
+
 class SECEdgarProvider(SECDataProvider):
     """SEC EDGAR API data provider for financial filings"""
     
-    def __init__(self):
+    def __init__(self, bulk_archive: Optional[SECBulkArchive] = None):
         self.base_url = "https://data.sec.gov"
         self.cik_retrieval_url = "https://sec.gov"
-        self.headers = {
-            'User-Agent': 'StockAnalysisFramework admin@stockanalysis.dev',
-            'Accept-Encoding': 'gzip, deflate'
-        }
-        self.rate_limit_delay = 0.1  # SEC requires 10 requests per second max
+        self.headers = SEC_HEADERS
+        # SEC allows 10 requests per second per client - enforced process-wide by sec_limiter
+        self.session = sec_session
+        self.limiter = sec_limiter
+        # Local EDGAR bulk archives (SEC_BULK_DIR) replace the per-company
+        # submissions and companyfacts endpoints when configured
+        self.bulk_archive = bulk_archive or default_bulk_archive
     
-    def get_latest_10k(self, ticker: str) -> Optional[Dict[str, Any]]:
-        """Get latest 10-K filing data"""
+    def _get(self, url: str, stream: bool = False, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET an EDGAR URL through the shared session and rate limiter.
+        Recorded/replayed when a fixture bundle is active."""
+        def fetch():
+            self.limiter.acquire()
+            response = self.session.get(url, timeout=30, stream=stream, headers=headers)
+            if response.status_code == 429:
+                # Back off every thread, then retry once
+                response.close()
+                self.limiter.on_rate_limited()
+                self.limiter.acquire()
+                response = self.session.get(url, timeout=30, stream=stream, headers=headers)
+            if response.status_code != 429:
+                self.limiter.on_success()
+            return response
+        key = (url, tuple(sorted(headers.items()))) if headers else url
+        return fixture_bundle.through('sec', key, fetch)
+    
+    def _get_filings(self, cik: int) -> Optional[FilingIndex]:
+        """Form-type index of the company's recent filings, shared through the
+        process-wide submissions cache"""
+        def fetch():
+            # Only when submissions.zip is there - a companyfacts-only
+            # directory still takes filings from the API
+            if self.bulk_archive and self.bulk_archive.submissions_path:
+                return self.bulk_archive.submissions(cik)
+            # Revalidate an expired copy instead of re-downloading it
+            previous = submissions_cache.stale(cik)
+            response = self._get(f"{self.base_url}/submissions/CIK{cik:010d}.json",
+                                 headers=previous.validators if previous else None)
+            if response.status_code == 304 and previous is not None:
+                return previous
+            if response.status_code != 200:
+                debug_print(f"Failed to fetch filings for CIK {cik}: {response.status_code}")
+                return None
+            return FilingIndex.from_submissions(response.json(), validators=self._validators(response))
+        return submissions_cache.get(cik, fetch)
+    
+    @staticmethod
+    def _validators(response: requests.Response) -> Dict[str, str]:
+        """Conditional-request headers for re-checking `response`'s resource"""
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        return validators
+    
+    def get_filing_version(self, ticker: str) -> Optional[str]:
+        """Accession number of the company's latest 10-K/10-Q. SEC-derived
+        results computed under the same version are still current."""
         try:
             cik = self._get_cik(ticker)
             if not cik:
                 return None
             
-            # Get company filings
-            filings_url = f"{self.base_url}/submissions/CIK{cik:010d}.json"
-            response = requests.get(filings_url, headers=self.headers)
-            time.sleep(self.rate_limit_delay)
+            filings = self._get_filings(cik)
+            return filings.latest_accession() if filings else None
             
-            if response.status_code != 200:
+        except Exception as e:
+            debug_print(f"Error checking filings for {ticker}: {e}")
+            return None
+    
+    def get_latest_10k(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get latest 10-K filing data"""
+        try:
+            cik = self._get_cik(ticker)
+            if not cik:
                 return None
             
-            data = response.json()
-            filings = data.get('filings', {}).get('recent', {})
-            
-            # Find latest 10-K
-            for i, form in enumerate(filings.get('form', [])):
-                if form == '10-K':
-                    return {
-                        'form': form,
-                        'filing_date': filings['filingDate'][i],
-                        'accession_number': filings['accessionNumber'][i],
-                        'primary_document': filings['primaryDocument'][i]
-                    }
-            
-            return None
+            filings = self._get_filings(cik)
+            return filings.latest('10-K') if filings else None
             
         except Exception as e:
             debug_print(f"Error fetching 10-K for {ticker}: {e}")
@@ -57,77 +133,78 @@ class SECEdgarProvider(SECDataProvider):
             if not cik:
                 return None
             
-            filings_url = f"{self.base_url}/submissions/CIK{cik:010d}.json"
-            response = requests.get(filings_url, headers=self.headers)
-            time.sleep(self.rate_limit_delay)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            filings = data.get('filings', {}).get('recent', {})
-            
-            # Find latest 10-Q
-            for i, form in enumerate(filings.get('form', [])):
-                if form == '10-Q':
-                    return {
-                        'form': form,
-                        'filing_date': filings['filingDate'][i],
-                        'accession_number': filings['accessionNumber'][i],
-                        'primary_document': filings['primaryDocument'][i]
-                    }
-            
-            return None
+            filings = self._get_filings(cik)
+            return filings.latest('10-Q') if filings else None
             
         except Exception as e:
             debug_print(f"Error fetching 10-Q for {ticker}: {e}")
             return None
     
     def get_filing_facts(self, ticker: str) -> Optional[Dict[str, Any]]:
-        """Get company facts from SEC API"""
+        """Get company facts from SEC API (raw companyfacts JSON - analyzers
+        should prefer get_company_facts)"""
         try:
             cik = self._get_cik(ticker)
             if not cik:
                 return None
             
-            facts_url = f"{self.base_url}/api/xbrl/companyfacts/CIK{cik:010d}.json"
-            response = requests.get(facts_url, headers=self.headers)
-            time.sleep(self.rate_limit_delay)
-            
-            if response.status_code != 200:
-                return None
-            
-            return response.json()
+            return self._fetch_company_facts(cik)
             
         except Exception as e:
             debug_print(f"Error fetching facts for {ticker}: {e}")
             return None
     
-    def _get_cik(self, ticker: str) -> Optional[int]:
-        """Get CIK number for ticker"""
+    def get_company_facts(self, ticker: str) -> Optional[CompanyFacts]:
+        """Company facts as an indexed CompanyFacts, served from the local facts
+        store and downloaded only when the stored copy is missing or stale"""
         try:
-            # Use SEC company tickers endpoint
-            tickers_url = f"{self.cik_retrieval_url}/files/company_tickers.json"
-            response = requests.get(tickers_url, headers=self.headers)
-            time.sleep(self.rate_limit_delay)
-            
-            if response.status_code != 200:
-                debug_print(f"Failed to fetch tickers: {response.status_code}")
+            cik = self._get_cik(ticker)
+            if not cik:
                 return None
             
-            data = response.json()
-            
-            # Search through the numbered entries
-            for entry in data.values():
-                if entry.get('ticker', '').upper() == ticker.upper():
-                    return entry.get('cik_str')
+            # Stored facts stay current until the company files a new report
+            filings = self._get_filings(cik)
+            version = filings.latest_accession() if filings else None
+            return fixture_bundle.through(
+                'sec_facts', cik,
+                lambda: facts_store.get(cik, lambda: self._fetch_company_facts(cik), version=version)
+            )
             
+        except Exception as e:
+            debug_print(f"Error loading facts for {ticker}: {e}")
             return None
-            
+    
+    def _fetch_company_facts(self, cik: int) -> Optional[Dict[str, Any]]:
+        if self.bulk_archive and self.bulk_archive.companyfacts_path:
+            return self.bulk_archive.company_facts(cik)
+        response = self._get(f"{self.base_url}/api/xbrl/companyfacts/CIK{cik:010d}.json")
+        if response.status_code != 200:
+            return None
+        return response.json()
+    
+    def _get_cik(self, ticker: str) -> Optional[int]:
+        """Get CIK number for ticker from the shared, daily-refreshed CIK index"""
+        try:
+            # Recorded per ticker so a fixture bundle doesn't depend on the
+            # local index file
+            return fixture_bundle.through(
+                'sec_cik', ticker.upper(), lambda: cik_index.lookup(ticker, self._fetch_company_tickers)
+            )
         except Exception as e:
             debug_print(f"Error getting CIK for {ticker}: {e}")
             return None
     
+    def _fetch_company_tickers(self) -> Optional[Dict[str, Any]]:
+        """Download SEC's ticker -> CIK file (only when the CIK index is stale)"""
+        tickers_url = f"{self.cik_retrieval_url}/files/company_tickers.json"
+        response = self._get(tickers_url)
+        
+        if response.status_code != 200:
+            debug_print(f"Failed to fetch tickers: {response.status_code}")
+            return None
+        
+        return response.json()
+    
     def get_management_data(self, ticker: str) -> Dict[str, Any]:
         """Get management data from SEC filings (DEF 14A proxy statements)"""
         try:
@@ -135,27 +212,12 @@ class SECEdgarProvider(SECDataProvider):
             if not cik:
                 return {'error': f'CIK not found for {ticker}'}
             
-            # Get company filings
-            filings_url = f"{self.base_url}/submissions/CIK{cik:010d}.json"
-            response = requests.get(filings_url, headers=self.headers)
-            time.sleep(self.rate_limit_delay)
-            
-            if response.status_code != 200:
-                return {'error': f'Failed to fetch filings: {response.status_code}'}
+            filings = self._get_filings(cik)
+            if not filings:
+                return {'error': 'Failed to fetch filings'}
             
-            data = response.json()
-            filings = data.get('filings', {}).get('recent', {})
-            
-            # Find recent proxy statements (DEF 14A)
-            proxy_filings = []
-            for i, form in enumerate(filings.get('form', [])):
-                if form == 'DEF 14A' and len(proxy_filings) < 2:
-                    proxy_filings.append({
-                        'form': form,
-                        'filing_date': filings['filingDate'][i],
-                        'accession_number': filings['accessionNumber'][i],
-                        'primary_document': filings['primaryDocument'][i]
-                    })
+            # Two most recent proxy statements (DEF 14A)
+            proxy_filings = filings.recent('DEF 14A', 2)
             
             if not proxy_filings:
                 return {'error': 'No recent proxy statements found'}
@@ -194,40 +256,18 @@ class SECEdgarProvider(SECDataProvider):
                 debug_print(f"[SEC_DEBUG] No 10-K filing found for {ticker}")
                 return None
             
-            debug_print(f"[SEC_DEBUG] Found 10-K filing for {ticker}: {filing_data['accession_number']}")
-            
-            # Construct URL to actual filing document - try multiple formats
-            accession = filing_data['accession_number'].replace('-', '')
-            primary_doc = filing_data['primary_document']
-            
-            # Try different URL formats that SEC uses
-            possible_urls = [
-                f"{self.base_url}/Archives/edgar/data/{cik}/{accession}/{primary_doc}",
-                f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{primary_doc}",
-                f"{self.base_url}/Archives/edgar/data/{cik}/{filing_data['accession_number']}/{primary_doc}"
-            ]
+            accession_number = filing_data['accession_number']
+            debug_print(f"[SEC_DEBUG] Found 10-K filing for {ticker}: {accession_number}")
             
-            content = None
-            
-            for doc_url in possible_urls:
-                debug_print(f"[SEC_DEBUG] Trying URL: {doc_url}")
-                response = requests.get(doc_url, headers=self.headers)
-                time.sleep(self.rate_limit_delay)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    debug_print(f"[SEC_DEBUG] Success with URL: {doc_url}")
-                    break
-                else:
-                    debug_print(f"[SEC_DEBUG] Failed with status {response.status_code}: {doc_url}")
-            
-            if not content:
+            # Each filing is parsed once - later runs read the stored section
+            business_section = fixture_bundle.through(
+                'sec_business', accession_number,
+                lambda: business_sections.get(accession_number, lambda: self._stream_business_section(cik, filing_data))
+            )
+            if business_section is None:
                 debug_print(f"[SEC_DEBUG] All URL formats failed for {ticker}")
                 return None
             
-            debug_print(f"[SEC_DEBUG] Document fetched successfully, size: {len(content)} chars")
-            business_section = self._extract_business_section(content)
-            
             debug_print(f"[SEC_DEBUG] Business section extracted: {len(business_section)} chars")
             
             return {
@@ -243,174 +283,80 @@ class SECEdgarProvider(SECDataProvider):
             traceback.debug_print_exc()
             return None
     
-    def _extract_business_section(self, content: str) -> str:
-        """Extract Item 1 - Business section from 10-K filing"""
-        import re
-        from html import unescape
-        
-        # Remove HTML tags and decode entities
-        text = re.sub(r'<[^>]+>', ' ', content)
-        text = unescape(text)
-        text = re.sub(r'\s+', ' ', text).strip()
+    def _stream_business_section(self, cik: int, filing_data: Dict[str, Any]) -> Optional[str]:
+        """Download the 10-K primary document only as far as the end of Item 1"""
+        # Construct URL to actual filing document - try multiple formats
+        accession = filing_data['accession_number'].replace('-', '')
+        primary_doc = filing_data['primary_document']
         
-        # Look for Item 1 Business section
-        patterns = [
-            r'Item\s*1[\s\.].*?Business.*?(?=Item\s*1A|Item\s*2|$)',
-            r'ITEM\s*1[\s\.].*?BUSINESS.*?(?=ITEM\s*1A|ITEM\s*2|$)',
-            r'Part\s*I.*?Item\s*1.*?Business.*?(?=Item\s*1A|Item\s*2|$)'
+        # Try different URL formats that SEC uses
+        possible_urls = [
+            f"{self.base_url}/Archives/edgar/data/{cik}/{accession}/{primary_doc}",
+            f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{primary_doc}",
+            f"{self.base_url}/Archives/edgar/data/{cik}/{filing_data['accession_number']}/{primary_doc}"
         ]
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                business_text = match.group(0)
-                # Limit to reasonable length (first 5000 chars)
-                return business_text[:5000] if len(business_text) > 5000 else business_text
-        
-        # Fallback: look for business-related keywords
-        business_keywords = ['products', 'services', 'operations', 'segments', 'revenue']
-        for keyword in business_keywords:
-            pattern = f'.*{keyword}.*'
-            matches = re.findall(pattern, text[:10000], re.IGNORECASE)
-            if matches:
-                return ' '.join(matches[:3])  # First 3 relevant sentences
+        for doc_url in possible_urls:
+            debug_print(f"[SEC_DEBUG] Trying URL: {doc_url}")
+            response = self._get(doc_url, stream=True)
+            try:
+                if response.status_code == 200:
+                    debug_print(f"[SEC_DEBUG] Success with URL: {doc_url}")
+                    return extract_business_section(self._iter_text(response))
+                debug_print(f"[SEC_DEBUG] Failed with status {response.status_code}: {doc_url}")
+            finally:
+                response.close()
         
-        return "Business description not found in filing"
+        return None
+    
+    @staticmethod
+    def _iter_text(response: requests.Response, chunk_size: int = 64 * 1024):
+        """Decoded text chunks of a streamed response"""
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+    
+    def _extract_business_section(self, content: str) -> str:
+        """Extract Item 1 - Business section from 10-K filing"""
+        return extract_business_section([content])
     
     def get_segment_revenue_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Extract segment revenue and operating income data from SEC filings"""
         try:
-            facts = self.get_filing_facts(ticker)
-            if not facts or 'facts' not in facts:
+            facts = self.get_company_facts(ticker)
+            if not facts:
                 return None
             
-            us_gaap = facts['facts'].get('us-gaap', {})
-            
-            # Look for segment-specific fields with dimension information
+            # companyfacts only carries undimensioned company totals - segment
+            # breakdowns (XBRL dimensions) aren't in it, so report the totals
             segments = []
             total_revenue = 0
             total_operating_income = 0
             
-            # Extract company totals first
+            # Extract company totals (most recent period, any form)
             revenue_keys = ['RevenueFromContractWithCustomerExcludingAssessedTax', 'Revenues']
             for key in revenue_keys:
-                if key in us_gaap and 'USD' in us_gaap[key].get('units', {}):
-                    recent_data = sorted(us_gaap[key]['units']['USD'], key=lambda x: x.get('end', ''), reverse=True)[:1]
-                    if recent_data:
-                        total_revenue = recent_data[0].get('val', 0)
-                        break
+                value = facts.latest(key)
+                if value is not None:
+                    total_revenue = value
+                    break
             
             operating_keys = ['OperatingIncomeLoss']
             for key in operating_keys:
-                if key in us_gaap and 'USD' in us_gaap[key].get('units', {}):
-                    recent_data = sorted(us_gaap[key]['units']['USD'], key=lambda x: x.get('end', ''), reverse=True)[:1]
-                    if recent_data:
-                        total_operating_income = recent_data[0].get('val', 0)
-                        break
-            
-            # Look for segment-specific revenue fields - use actual XBRL field names
-            segment_revenue_fields = [
-                'SegmentReportingInformationRevenues',
-                'SegmentReportingInformationOperatingIncomeLoss', 
-                'SegmentReportingSegmentRevenues',
-                'RevenueFromExternalCustomers',
-                'SegmentRevenues'
-            ]
-            
-            segment_income_fields = [
-                'SegmentReportingInformationOperatingIncomeLoss',
-                'SegmentReportingSegmentOperatingProfitLoss',
-                'SegmentOperatingIncome'
-            ]
-            
-            segment_data = {}
-            
-            debug_print(f"[SEC_DEBUG] Looking for segment data in {ticker}...")
-            
-            # Extract segment revenue data
-            for field_name in segment_revenue_fields:
-                if field_name in us_gaap:
-                    debug_print(f"[SEC_DEBUG] Found field: {field_name}")
-                    units = us_gaap[field_name].get('units', {})
-                    if 'USD' in units:
-                        debug_print(f"[SEC_DEBUG] USD data points: {len(units['USD'])}")
-                        for i, data_point in enumerate(units['USD'][:3]):  # Check first 3
-                            debug_print(f"[SEC_DEBUG] Data point {i}: keys = {list(data_point.keys())}")
-                            if 'segment' in data_point:
-                                debug_print(f"[SEC_DEBUG] Found segment: {data_point['segment']}")
-                            else:
-                                debug_print(f"[SEC_DEBUG] No segment dimension found")
+                value = facts.latest(key)
+                if value is not None:
+                    total_operating_income = value
+                    break
             
-            # Check if any segment fields exist at all
-            segment_field_names = [f for f in us_gaap.keys() if any(kw in f.lower() for kw in ['segment', 'reportable'])]
+            segment_field_names = [f for f in facts.concepts() if any(kw in f.lower() for kw in ['segment', 'reportable'])]
             debug_print(f"[SEC_DEBUG] All segment fields: {segment_field_names[:5]}...")  # Show first 5
             
-            # Extract segment revenue data
-            for field_name in segment_revenue_fields:
-                if field_name in us_gaap:
-                    units = us_gaap[field_name].get('units', {})
-                    if 'USD' in units:
-                        for data_point in units['USD']:
-                            # Look for segment dimension
-                            if 'segment' in data_point:
-                                segment_name = data_point['segment'].get('value', 'Unknown')
-                                value = data_point.get('val', 0)
-                                end_date = data_point.get('end', '')
-                                
-                                if segment_name not in segment_data:
-                                    segment_data[segment_name] = {}
-                                
-                                if 'revenue' not in segment_data[segment_name] or end_date > segment_data[segment_name].get('revenue_date', ''):
-                                    segment_data[segment_name]['revenue'] = value
-                                    segment_data[segment_name]['revenue_date'] = end_date
-            
-            # Extract segment operating income data
-            for field_name in segment_income_fields:
-                if field_name in us_gaap:
-                    units = us_gaap[field_name].get('units', {})
-                    if 'USD' in units:
-                        for data_point in units['USD']:
-                            if 'segment' in data_point:
-                                segment_name = data_point['segment'].get('value', 'Unknown')
-                                value = data_point.get('val', 0)
-                                end_date = data_point.get('end', '')
-                                
-                                if segment_name not in segment_data:
-                                    segment_data[segment_name] = {}
-                                
-                                if 'operating_income' not in segment_data[segment_name] or end_date > segment_data[segment_name].get('income_date', ''):
-                                    segment_data[segment_name]['operating_income'] = value
-                                    segment_data[segment_name]['income_date'] = end_date
-            
-            # Build segments list
-            for segment_name, data in segment_data.items():
-                segment_revenue = data.get('revenue', 0)
-                segment_income = data.get('operating_income')
-                
-                segment_info = {
-                    'segment_name': segment_name,
-                    'revenue': segment_revenue,
-                    'revenue_percentage': (segment_revenue / total_revenue * 100) if total_revenue > 0 else 0
-                }
-                
-                if segment_income is not None and segment_revenue > 0:
-                    operating_margin = (segment_income / segment_revenue) * 100
-                    segment_info['operating_income'] = segment_income
-                    segment_info['operating_margin'] = round(operating_margin, 2)
-                    
-                    if operating_margin > 20:
-                        segment_info['margin_profile'] = 'High'
-                    elif operating_margin > 10:
-                        segment_info['margin_profile'] = 'Medium'
-                    else:
-                        segment_info['margin_profile'] = 'Low'
-                else:
-                    segment_info['margin_profile'] = 'Unknown'
-                
-                segments.append(segment_info)
-            
-            # If no segment data found, return company-level data
-            if not segments and total_revenue > 0:
+            # Company-level data as a single segment
+            if total_revenue > 0:
                 overall_margin = None
                 margin_profile = 'Medium'
                 
@@ -0,0 +1,288 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ...utils.single_flight import SingleFlight
+
+
+class CompanyFacts:
+    """One company's XBRL facts as flat NumPy arrays with a concept index.
+
+    The companyfacts JSON nests taxonomy -> concept -> unit -> list of fact
+    dicts, and analyzers used to re-scan and re-sort those lists for every
+    number they needed. Here every fact is one row of a few parallel arrays
+    (period end, filed date, value, fiscal year/period, form), each
+    taxonomy:concept:unit series is a contiguous slice sorted by period end,
+    and `_slices` maps the series name to its slice. "Latest 10-K value of
+    NetIncomeLoss" is a dict lookup plus a search over a few dozen dates.
+    """
+
+    def __init__(self, cik: int, entity_name: str, keys: List[str], offsets: np.ndarray,
+                 end: np.ndarray, filed: np.ndarray, val: np.ndarray, fy: np.ndarray,
+                 fp: np.ndarray, form: np.ndarray, fiscal_periods: List[str], forms: List[str],
+                 version: Optional[str] = None):
+        self.cik = cik
+        self.entity_name = entity_name
+        self.keys = keys
+        self.offsets = offsets
+        self.end = end
+        self.filed = filed
+        self.val = val
+        self.fy = fy
+        self.fp = fp
+        self.form = form
+        self.fiscal_periods = fiscal_periods
+        self.forms = forms
+        # Accession of the latest periodic filing when these facts were fetched
+        self.version = version
+        self._slices = {key: (int(offsets[i]), int(offsets[i + 1])) for i, key in enumerate(keys)}
+        self._form_codes = {name: code for code, name in enumerate(forms)}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'CompanyFacts':
+        """Parse a companyfacts API document"""
+        keys, offsets = [], [0]
+        end, filed, val, fy, fp, form = [], [], [], [], [], []
+        fp_codes: Dict[str, int] = {}
+        form_codes: Dict[str, int] = {}
+
+        for taxonomy, concepts in data.get('facts', {}).items():
+            for concept, body in concepts.items():
+                for unit, items in body.get('units', {}).items():
+                    rows = [item for item in items if item.get('val') is not None and item.get('end')]
+                    if not rows:
+                        continue
+                    # Stable sort keeps EDGAR's order between facts for the same period
+                    rows.sort(key=lambda item: item['end'])
+                    for item in rows:
+                        end.append(item['end'])
+                        filed.append(item.get('filed') or item['end'])
+                        val.append(item['val'])
+                        fy.append(item.get('fy') or 0)
+                        fp.append(fp_codes.setdefault(item.get('fp') or '', len(fp_codes)))
+                        form.append(form_codes.setdefault(item.get('form') or '', len(form_codes)))
+                    keys.append(f"{taxonomy}:{concept}:{unit}")
+                    offsets.append(len(end))
+
+        return cls(
+            cik=int(data.get('cik') or 0),
+            entity_name=data.get('entityName') or '',
+            keys=keys,
+            offsets=np.array(offsets, dtype='int64'),
+            end=np.array(end, dtype='datetime64[D]'),
+            filed=np.array(filed, dtype='datetime64[D]'),
+            val=np.array(val, dtype='float64'),
+            fy=np.array(fy, dtype='int16'),
+            fp=np.array(fp, dtype='int16'),
+            form=np.array(form, dtype='int16'),
+            fiscal_periods=list(fp_codes),
+            forms=list(form_codes),
+        )
+
+    # --- queries -------------------------------------------------------
+
+    def concepts(self, taxonomy: str = 'us-gaap') -> List[str]:
+        """Concept names reported under `taxonomy`, in filing order"""
+        prefix = f"{taxonomy}:"
+        seen = dict.fromkeys(key.split(':')[1] for key in self.keys if key.startswith(prefix))
+        return list(seen)
+
+    def has(self, concept: str, unit: str = 'USD', taxonomy: str = 'us-gaap') -> bool:
+        return f"{taxonomy}:{concept}:{unit}" in self._slices
+
+    def series(self, concept: str, unit: str = 'USD', taxonomy: str = 'us-gaap',
+               form: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(period ends, values) of one concept, oldest first, optionally for one form type"""
+        rows = self._rows(concept, unit, taxonomy, form)
+        return self.end[rows], self.val[rows]
+
+    def latest(self, concept: str, unit: str = 'USD', taxonomy: str = 'us-gaap',
+               form: Optional[str] = None) -> Optional[float]:
+        """Value for the most recent period end, optionally for one form type ('10-K')"""
+        rows = self._rows(concept, unit, taxonomy, form)
+        if len(rows) == 0:
+            return None
+        ends = self.end[rows]
+        # First fact reported for the latest period, as EDGAR lists them
+        return float(self.val[rows[np.searchsorted(ends, ends[-1], side='left')]])
+
+    def latest_filed(self, unit: str = 'USD', taxonomy: str = 'us-gaap') -> Optional[str]:
+        """Most recent filing date across the company's `taxonomy` facts"""
+        suffix, prefix = f":{unit}", f"{taxonomy}:"
+        latest = None
+        for key, (start, stop) in self._slices.items():
+            if key.startswith(prefix) and key.endswith(suffix) and stop > start:
+                filed = self.filed[start:stop].max()
+                latest = filed if latest is None or filed > latest else latest
+        return str(latest) if latest is not None else None
+
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.offsets, self.end, self.filed, self.val, self.fy, self.fp, self.form))
+
+    def _rows(self, concept: str, unit: str, taxonomy: str, form: Optional[str]) -> np.ndarray:
+        start, stop = self._slices.get(f"{taxonomy}:{concept}:{unit}", (0, 0))
+        rows = np.arange(start, stop)
+        if form is not None:
+            code = self._form_codes.get(form)
+            rows = rows[self.form[start:stop] == code] if code is not None else rows[:0]
+        return rows
+
+    # --- persistence ---------------------------------------------------
+
+    def save(self, path: str):
+        meta = {'cik': self.cik, 'entity_name': self.entity_name,
+                'fiscal_periods': self.fiscal_periods, 'forms': self.forms, 'version': self.version}
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), keys=np.array('\n'.join(self.keys)),
+                     offsets=self.offsets, end=self.end, filed=self.filed, val=self.val,
+                     fy=self.fy, fp=self.fp, form=self.form)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'CompanyFacts':
+        with np.load(path, allow_pickle=False) as stored:
+            meta = json.loads(str(stored['meta']))
+            keys = str(stored['keys'])
+            return cls(
+                cik=meta['cik'], entity_name=meta['entity_name'],
+                keys=keys.split('\n') if keys else [],
+                offsets=stored['offsets'], end=stored['end'], filed=stored['filed'], val=stored['val'],
+                fy=stored['fy'], fp=stored['fp'], form=stored['form'],
+                fiscal_periods=meta['fiscal_periods'], forms=meta['forms'],
+                version=meta.get('version'),
+            )
+
+
+class FactsStore:
+    """On-disk store of parsed CompanyFacts, one .npz per CIK.
+
+    The companyfacts download (tens of MB of JSON for large filers) is parsed
+    once and written as compact arrays; later runs and other analyzers load
+    the arrays instead of downloading and re-parsing. Recently used companies
+    also stay in memory, and concurrent requests for one CIK share a single
+    download.
+
+    Callers that know the company's latest filing accession pass it as
+    `version`: a stored copy for the same accession is current however old it
+    is (facts only change when something is filed), and one for an older
+    accession is replaced straight away instead of waiting out the TTL.
+    """
+
+    def __init__(self, store_dir: str, ttl: float = 24 * 60 * 60, enabled: bool = True, max_in_memory: int = 256):
+        self.store_dir = store_dir
+        self.ttl = ttl
+        self.enabled = enabled
+        self.max_in_memory = max_in_memory
+        self._memory: 'OrderedDict[int, Tuple[float, CompanyFacts]]' = OrderedDict()
+        self._flight = SingleFlight()
+        self.lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'fetches': 0}
+
+    def get(self, cik: int, fetch: Callable[[], Optional[Dict[str, Any]]],
+            version: Optional[str] = None) -> Optional[CompanyFacts]:
+        """CompanyFacts for `cik`; `fetch` returns the companyfacts JSON (None on failure)"""
+        facts = self._from_memory(cik, version)
+        if facts is not None:
+            return facts
+        return self._flight.do((cik, version), lambda: self._load(cik, fetch, version))
+
+    def _load(self, cik: int, fetch: Callable[[], Optional[Dict[str, Any]]],
+              version: Optional[str]) -> Optional[CompanyFacts]:
+        # An earlier flight may have loaded it since the check in get()
+        facts = self._from_memory(cik, version)
+        if facts is not None:
+            return facts
+
+        path = self._path(cik)
+        fetched_at = None
+        if self.enabled:
+            try:
+                fetched_at = os.path.getmtime(path)
+                if version is not None or time.time() - fetched_at <= self.ttl:
+                    facts = CompanyFacts.load(path)
+                    if not self._is_current(fetched_at, facts, version):
+                        facts = None
+                    else:
+                        self._count('disk_hits')
+            except (OSError, ValueError, KeyError):
+                facts = None
+
+        if facts is None:
+            data = fetch()
+            if not data:
+                return None
+            facts = CompanyFacts.from_json(data)
+            facts.version = version
+            fetched_at = time.time()
+            self._count('fetches')
+            if self.enabled:
+                try:
+                    facts.save(path)
+                except OSError:
+                    pass
+
+        self._remember(cik, fetched_at, facts)
+        return facts
+
+    def put(self, cik: int, facts: CompanyFacts):
+        """Store facts obtained elsewhere (e.g. a bulk archive)"""
+        if self.enabled:
+            facts.save(self._path(cik))
+        self._remember(cik, time.time(), facts)
+
+    def invalidate(self, cik: int):
+        with self.lock:
+            self._memory.pop(cik, None)
+        try:
+            os.remove(self._path(cik))
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats, in_memory=len(self._memory))
+
+    def _is_current(self, fetched_at: float, facts: CompanyFacts, version: Optional[str]) -> bool:
+        if version is not None:
+            return facts.version == version
+        return time.time() - fetched_at <= self.ttl
+
+    def _from_memory(self, cik: int, version: Optional[str] = None) -> Optional[CompanyFacts]:
+        with self.lock:
+            entry = self._memory.get(cik)
+            if entry is None or not self._is_current(entry[0], entry[1], version):
+                return None
+            self._memory.move_to_end(cik)
+            self.stats['memory_hits'] += 1
+            return entry[1]
+
+    def _remember(self, cik: int, fetched_at: float, facts: CompanyFacts):
+        with self.lock:
+            self._memory[cik] = (fetched_at, facts)
+            self._memory.move_to_end(cik)
+            while len(self._memory) > self.max_in_memory:
+                self._memory.popitem(last=False)
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def _path(self, cik: int) -> str:
+        return os.path.join(self.store_dir, f"CIK{cik:010d}.npz")
+
+
+# Global store shared by every SECEdgarProvider in the process
+facts_store = FactsStore(
+    store_dir=os.path.join(os.getenv('SEC_CACHE_DIR', os.path.join('.cache', 'sec')), 'facts'),
+    ttl=float(os.getenv('SEC_FACTS_TTL_HOURS', '24')) * 60 * 60,
+    enabled=os.getenv('SEC_CACHE_ENABLED', 'true').lower() == 'true',
+)
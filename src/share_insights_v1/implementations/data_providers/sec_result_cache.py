@@ -0,0 +1,79 @@
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class FilingResultCache:
+    """SEC-derived analysis results keyed by the filing they were computed from.
+
+    Financial health, segment data and the SEC parts of the business-model
+    and industry analyses only change when a company files a new 10-K or
+    10-Q. Each result is stored with the accession number of the latest
+    periodic filing (SECEdgarProvider.get_filing_version) and returned as-is
+    while that accession is still the latest - so a daily batch recomputes
+    only the companies that filed since the last run.
+    """
+
+    def __init__(self, store_dir: str, enabled: bool = True):
+        self.store_dir = store_dir
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'computed': 0}
+
+    def get_or_compute(self, name: str, ticker: str, version: Optional[str], compute: Callable[[], Any]) -> Any:
+        """Result of `compute` for (name, ticker), reused while `version` is unchanged.
+
+        Without a version (no SEC coverage, provider without filing tracking)
+        the result is computed every time. None and {'error': ...} results
+        aren't stored.
+        """
+        if not self.enabled or not isinstance(version, str):
+            return compute()
+
+        path = self._path(name, ticker)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            if entry.get('version') == version:
+                self._count('hits')
+                return entry['value']
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+            pass
+
+        value = compute()
+        self._count('computed')
+        if value is not None and not (isinstance(value, dict) and 'error' in value):
+            self._save(path, {'version': version, 'value': value})
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+    def _save(self, path: str, entry: Dict[str, Any]):
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass  # recomputed next time
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def _path(self, name: str, ticker: str) -> str:
+        safe_ticker = ''.join(c if c.isalnum() or c in '-_' else '_' for c in ticker.upper())
+        return os.path.join(self.store_dir, name, f"{safe_ticker}.pkl")
+
+
+# Global cache shared by the SEC-backed analyzers
+filing_results = FilingResultCache(
+    store_dir=os.path.join(os.getenv('SEC_CACHE_DIR', os.path.join('.cache', 'sec')), 'results'),
+    enabled=os.getenv('SEC_CACHE_ENABLED', 'true').lower() == 'true',
+)
@@ -0,0 +1,217 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ...utils.single_flight import SingleFlight
+
+# Forms whose arrival changes a company's reported financials
+PERIODIC_FORMS = ('10-K', '10-Q', '10-K/A', '10-Q/A')
+
+
+class FilingIndex:
+    """A company's recent filings grouped by form type, newest first.
+
+    Built once from the `filings.recent` arrays of a submissions document, so
+    "latest 10-K" or "last two DEF 14As" is a dict read instead of a walk over
+    the parallel form/date/accession lists.
+    """
+
+    FIELDS = (
+        ('filing_date', 'filingDate'),
+        ('accession_number', 'accessionNumber'),
+        ('primary_document', 'primaryDocument'),
+    )
+
+    def __init__(self, by_form: Dict[str, List[Dict[str, Any]]], validators: Optional[Dict[str, str]] = None):
+        self.by_form = by_form
+        # Conditional-request headers (If-None-Match / If-Modified-Since) for
+        # revalidating the submissions document this index came from
+        self.validators = validators or {}
+
+    @classmethod
+    def from_submissions(cls, submissions: Dict[str, Any], validators: Optional[Dict[str, str]] = None) -> 'FilingIndex':
+        recent = submissions.get('filings', {}).get('recent', {})
+        columns = {name: recent.get(key, []) for name, key in cls.FIELDS}
+        by_form: Dict[str, List[Dict[str, Any]]] = {}
+        # EDGAR lists recent filings newest first - keep that order per form
+        for i, form in enumerate(recent.get('form', [])):
+            filing = {'form': form}
+            for name, values in columns.items():
+                filing[name] = values[i] if i < len(values) else None
+            by_form.setdefault(form, []).append(filing)
+        return cls(by_form, validators)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {'by_form': self.by_form, 'validators': self.validators}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'FilingIndex':
+        return cls(data['by_form'], data.get('validators'))
+
+    def latest(self, form: str) -> Optional[Dict[str, Any]]:
+        filings = self.by_form.get(form)
+        return dict(filings[0]) if filings else None
+
+    def recent(self, form: str, limit: int) -> List[Dict[str, Any]]:
+        return [dict(filing) for filing in self.by_form.get(form, [])[:limit]]
+
+    def latest_accession(self, forms=PERIODIC_FORMS) -> Optional[str]:
+        """Accession number of the newest periodic report - it changes exactly
+        when the company files a new 10-K/10-Q"""
+        filings = [self.by_form[form][0] for form in forms if self.by_form.get(form)]
+        if not filings:
+            return None
+        return max(filings, key=lambda filing: filing['filing_date'] or '')['accession_number']
+
+
+class SubmissionsCache:
+    """Process-wide, per-CIK cache of FilingIndex objects.
+
+    get_latest_10k, get_latest_10q, get_management_data and
+    get_business_description all need the same submissions document, and
+    several analyzers each build their own SECEdgarProvider. The first lookup
+    for a CIK downloads and indexes it; everyone else - including concurrent
+    analyzer threads, which wait on that one download - reads the index until
+    `ttl` expires. After that `fetch` can revalidate the expired index (see
+    stale()) and hand it back unchanged on a 304. Failed downloads aren't cached.
+
+    With a `store_dir` each index and its validators are also written to disk
+    (one JSON file per CIK), so the next process - tomorrow's batch - starts
+    with conditional requests instead of full downloads.
+    """
+
+    def __init__(self, ttl: float = 6 * 60 * 60, max_entries: int = 2048, store_dir: Optional[str] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.store_dir = store_dir
+        self._entries: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._flight = SingleFlight()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.fetches = 0
+        self.revalidated = 0
+
+    def get(self, cik: int, fetch: Callable[[], Union[FilingIndex, Dict[str, Any], None]]) -> Optional[FilingIndex]:
+        """FilingIndex for `cik`; `fetch` returns the submissions JSON, a ready
+        FilingIndex (e.g. the stale one, still current), or None on failure"""
+        index = self._lookup(cik)
+        if index is not None:
+            return index
+        return self._flight.do(cik, lambda: self._fetch(cik, fetch))
+
+    def _fetch(self, cik: int, fetch: Callable[[], Union[FilingIndex, Dict[str, Any], None]]) -> Optional[FilingIndex]:
+        # An earlier flight may have stored it since the check in get()
+        index = self._lookup(cik)
+        if index is not None:
+            return index
+        previous = self.stale(cik)
+        submissions = fetch()
+        if not submissions:
+            return None
+        if isinstance(submissions, FilingIndex):
+            index = submissions
+        else:
+            index = FilingIndex.from_submissions(submissions)
+        fetched_at = time.time()
+        with self.lock:
+            if index is previous:
+                self.revalidated += 1
+            else:
+                self.fetches += 1
+            self._remember(cik, fetched_at, index)
+        self._save(cik, fetched_at, index)
+        return index
+
+    def stale(self, cik: int) -> Optional[FilingIndex]:
+        """The cached index for `cik` regardless of age (for conditional requests)"""
+        entry = self._entry(cik)
+        return entry[1] if entry else None
+
+    def invalidate(self, cik: Optional[int] = None):
+        with self.lock:
+            if cik is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(cik, None)
+        if not self.store_dir:
+            return
+        try:
+            names = os.listdir(self.store_dir) if cik is None else [os.path.basename(self._path(cik))]
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(self.store_dir, name))
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'fetches': self.fetches,
+                    'revalidated': self.revalidated}
+
+    def _lookup(self, cik: int) -> Optional[FilingIndex]:
+        entry = self._entry(cik)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        with self.lock:
+            self.hits += 1
+        return entry[1]
+
+    def _entry(self, cik: int) -> Optional[tuple]:
+        """(fetched_at, index) from memory, or from disk on first use in this process"""
+        with self.lock:
+            entry = self._entries.get(cik)
+            if entry is not None:
+                self._entries.move_to_end(cik)
+                return entry
+        entry = self._load(cik)
+        if entry is not None:
+            with self.lock:
+                entry = self._entries.get(cik) or entry
+                self._remember(cik, *entry)
+        return entry
+
+    def _remember(self, cik: int, fetched_at: float, index: FilingIndex):
+        """Keep an index in memory (lock held)"""
+        self._entries[cik] = (fetched_at, index)
+        self._entries.move_to_end(cik)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, cik: int) -> Optional[tuple]:
+        if not self.store_dir:
+            return None
+        try:
+            with open(self._path(cik)) as f:
+                data = json.load(f)
+            return data['fetched_at'], FilingIndex.from_json(data['index'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, cik: int, fetched_at: float, index: FilingIndex):
+        if not self.store_dir:
+            return
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'fetched_at': fetched_at, 'index': index.to_json()}, f)
+            os.replace(tmp_path, self._path(cik))
+        except OSError:
+            pass  # downloaded in full again next run
+
+    def _path(self, cik: int) -> str:
+        return os.path.join(self.store_dir, f"CIK{cik:010d}.json")
+
+
+# Global instance shared by every SECEdgarProvider in the process
+submissions_cache = SubmissionsCache(
+    ttl=float(os.getenv('SEC_SUBMISSIONS_TTL_HOURS', '6')) * 60 * 60,
+    store_dir=(os.path.join(os.getenv('SEC_CACHE_DIR', os.path.join('.cache', 'sec')), 'submissions')
+               if os.getenv('SEC_CACHE_ENABLED', 'true').lower() == 'true' else None),
+)
@@ -0,0 +1,166 @@
+import threading
+import yfinance as yf
+from typing import Any, Callable, Dict, Optional
+from ...utils.rate_limit_tracker import rate_tracker
+from ...utils.dead_ticker_cache import is_empty_quote
+from ...utils.disk_cache import DiskCache, MISS, yahoo_cache
+from ...utils.price_store import PriceStore, period_days, price_store
+from ...utils.single_flight import yahoo_flight
+from ...utils import fixture_bundle
+
+
+class TickerSnapshot:
+    """Per-analysis view of one ticker's Yahoo Finance data.
+
+    One analysis run used to build a separate yf.Ticker in the provider and in
+    several analyzers, each re-pulling `.info` and the same statements. A
+    snapshot is created once per run (see AnalysisOrchestrator.analyze_stock)
+    and handed to every consumer through analysis_data['ticker_snapshot'].
+    Each resource is fetched lazily, at most once, and concurrent analyzer
+    threads asking for the same resource wait on a single fetch. Fetches are
+    also coalesced across snapshots (utils/single_flight.py), so concurrent API
+    requests or watchlist runs for the same hot ticker share one request.
+
+    Exposes the same attribute names as yf.Ticker (info, cashflow, income_stmt,
+    news, history(...), ...) so it can be passed anywhere a ticker object is
+    expected, e.g. DCFEngine.calculate_dcf.
+
+    Below the in-memory memo sits the persistent DiskCache (utils/disk_cache.py),
+    so a resource that is still fresh on disk - from an earlier run, a crashed
+    batch or another dashboard session - is not downloaded at all. Daily price
+    history for a period (history(period='1y')) lives in the PriceStore
+    (utils/price_store.py) instead, which only fetches bars it doesn't have.
+    """
+
+    # yf.Ticker properties served through the snapshot
+    RESOURCES = (
+        'info', 'cashflow', 'income_stmt', 'quarterly_income_stmt', 'balance_sheet',
+        'dividends', 'upgrades_downgrades', 'news',
+        'earnings_estimate', 'revenue_estimate', 'growth_estimates',
+    )
+
+    # yfinance's `financials` is the income statement under another name - map it
+    # so the provider's parallel statement fetch doesn't download it twice
+    ALIASES = {
+        'financials': 'income_stmt',
+        'quarterly_financials': 'quarterly_income_stmt',
+    }
+
+    def __init__(self, ticker: str, ticker_obj=None, cache: Optional[DiskCache] = None,
+                 prices: Optional[PriceStore] = None):
+        self.ticker = ticker
+        self._ticker_obj = ticker_obj
+        self._cache = cache if cache is not None else yahoo_cache
+        self._prices = prices if prices is not None else price_store
+        self._values: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @property
+    def yf_ticker(self):
+        """Underlying yf.Ticker, built on first use"""
+        with self._guard:
+            if self._ticker_obj is None:
+                self._ticker_obj = yf.Ticker(self.ticker)
+            return self._ticker_obj
+
+    def get(self, resource: str, loader: Optional[Callable[[], Any]] = None) -> Any:
+        """Return a resource, fetching it on first access.
+
+        `loader` defaults to reading the same-named yf.Ticker attribute. A failed
+        fetch is not memoized - the exception propagates to the caller (so rate
+        limit errors still reach RateLimitTracker) and the next access retries.
+        Date-window history requests (start=/end=) are memoized but never
+        persisted, since their keys don't repeat across runs. An empty quote
+        (what yfinance returns when the quote call fails) counts as a failed
+        fetch too: it is handed back but neither memoized nor cached, so the
+        next access asks Yahoo again.
+        """
+        resource = self.ALIASES.get(resource, resource)
+        if loader is None:
+            loader = lambda: getattr(self.yf_ticker, resource)
+
+        def load():
+            persist = 'start=' not in resource and 'end=' not in resource
+            value = self._cache.get(self.ticker, resource) if persist else MISS
+            if value is MISS or self._failed(resource, value):
+                rate_tracker.track_request(self.ticker)
+                value = loader()
+                rate_tracker.record_success()
+                if persist and not self._failed(resource, value):
+                    self._cache.set(self.ticker, resource, value)
+            return value
+
+        return self._memoize(resource, load)
+
+    def history(self, **kwargs) -> Any:
+        """Price history, memoized per distinct set of history() arguments.
+        Plain period requests are served from the PriceStore."""
+        key = self.history_key(**kwargs)
+        if set(kwargs) == {'period'} and period_days(kwargs['period']) is not None:
+            return self._memoize(key, lambda: self._prices.history(self.ticker, kwargs['period'], self._fetch_history))
+        return self.get(key, lambda: self.yf_ticker.history(**kwargs))
+
+    def _fetch_history(self, **kwargs) -> Any:
+        rate_tracker.track_request(self.ticker)
+        history = self.yf_ticker.history(**kwargs)
+        rate_tracker.record_success()
+        return history
+
+    @staticmethod
+    def history_key(**kwargs) -> str:
+        """Resource key for a history() call, e.g. 'history:period=1y'"""
+        return 'history:' + ','.join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+
+    def seed(self, resource: str, value: Any):
+        """Pre-load a resource fetched elsewhere (e.g. a batch-wide multi-ticker
+        price download) so the first access doesn't go to the network"""
+        with self._lock_for(resource):
+            self._values[resource] = value
+
+    def _memoize(self, resource: str, load: Callable[[], Any]) -> Any:
+        if resource in self._values:
+            return self._values[resource]
+
+        with self._lock_for(resource):
+            # Another thread may have finished the fetch while we waited
+            if resource in self._values:
+                return self._values[resource]
+            # ...or another snapshot of this ticker may be fetching it right now
+            key = (self.ticker.upper(), resource)
+            value = yahoo_flight.do(key, lambda: fixture_bundle.through('yahoo', key, load))
+            if not self._failed(resource, value):
+                self._values[resource] = value
+            return value
+
+    @staticmethod
+    def _failed(resource: str, value: Any) -> bool:
+        """Whether `value` is yfinance's stand-in for a fetch that didn't work"""
+        return resource == 'info' and is_empty_quote(value)
+
+    def is_loaded(self, resource: str) -> bool:
+        """Whether a resource has already been fetched for this snapshot"""
+        return self.ALIASES.get(resource, resource) in self._values
+
+    def _lock_for(self, resource: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(resource)
+            if lock is None:
+                lock = self._locks[resource] = threading.Lock()
+            return lock
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found normally - route yf.Ticker
+        # resource names through the memoized fetch
+        if name in TickerSnapshot.RESOURCES or name in TickerSnapshot.ALIASES:
+            return self.get(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+def snapshot_for(ticker: str, data: Optional[Dict[str, Any]] = None) -> TickerSnapshot:
+    """The run's shared snapshot from analysis_data, or a fresh one when an
+    analyzer is called standalone (tests, dashboard what-if runs)"""
+    snapshot = (data or {}).get('ticker_snapshot')
+    if snapshot is not None:
+        return snapshot
+    return TickerSnapshot(ticker)
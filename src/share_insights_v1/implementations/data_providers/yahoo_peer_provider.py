@@ -2,6 +2,11 @@ import yfinance as yf
 from typing import Dict, Any, List, Optional
 from ...interfaces.peer_comparison_provider import PeerComparisonProvider
 from ...models.peer_comparison import PeerMetrics
+from .ticker_snapshot import TickerSnapshot
+from .yahoo_provider import fetch_many
+from ...utils.rate_limit_tracker import rate_tracker
+from ...utils.market_calendar import region_for
+from ...utils import fixture_bundle
 
 class YahooPeerProvider(PeerComparisonProvider):
     """Yahoo Finance peer comparison data provider"""
@@ -46,15 +51,7 @@ class YahooPeerProvider(PeerComparisonProvider):
         `info.get('region')` itself is not usable here, it's been observed to
         return 'US' regardless of the company's actual listing.
         """
-        if market and market.endswith('_market'):
-            return market[:-len('_market')]
-
-        if ticker.endswith('.AX'):
-            return 'au'
-        elif ticker.endswith('.NZ'):
-            return 'nz'
-        else:
-            return 'us'
+        return region_for(ticker, market)
 
     def _screen_peers(self, ticker: str, sector: str, industry: str, market_cap: float, market: str) -> List[str]:
         """Live-query Yahoo's equity screener for same-region, same-industry peers"""
@@ -82,7 +79,14 @@ class YahooPeerProvider(PeerComparisonProvider):
                     # by raw market cap, so without this we'd always keep the biggest
                     # names in the band rather than the ones actually closest in size
                     # to the target
-                    result = yf.screen(query, count=50, sortField='intradaymarketcap', sortAsc=False)
+                    def screen():
+                        rate_tracker.track_request(ticker)
+                        result = yf.screen(query, count=50, sortField='intradaymarketcap', sortAsc=False)
+                        rate_tracker.record_success()
+                        return result
+
+                    screen_key = (region, classifier_field, classifier_value, cap_band if use_cap_band else None)
+                    result = fixture_bundle.through('yahoo_screen', screen_key, screen)
                     quotes = result.get('quotes', []) if result else []
                     candidates = [
                         (q.get('symbol'), q.get('marketCap'))
@@ -120,31 +124,27 @@ class YahooPeerProvider(PeerComparisonProvider):
         return peers[:5]  # Limit to top 5 peers
     
     def get_peer_metrics(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Get financial metrics for peer companies"""
-        
-        peer_data = {}
-        
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                
-                peer_data[ticker] = {
-                    'pe_ratio': info.get('trailingPE'),
-                    'ev_ebitda': info.get('enterpriseToEbitda'),
-                    'price_to_sales': info.get('priceToSalesTrailing12Months'),
-                    'price_to_book': info.get('priceToBook'),
-                    'roe': info.get('returnOnEquity'),
-                    'revenue_growth': info.get('revenueGrowth'),
-                    'profit_margin': info.get('profitMargins'),
-                    'market_cap': info.get('marketCap')
-                }
-                
-            except Exception as e:
-                print(f"Error fetching data for {ticker}: {e}")
-                peer_data[ticker] = {}
-        
-        return peer_data
+        """Get financial metrics for peer companies (quotes fetched concurrently)"""
+        return fetch_many(tickers, self._peer_metrics)
+    
+    def _peer_metrics(self, ticker: str) -> Dict[str, Any]:
+        try:
+            info = TickerSnapshot(ticker).info
+            
+            return {
+                'pe_ratio': info.get('trailingPE'),
+                'ev_ebitda': info.get('enterpriseToEbitda'),
+                'price_to_sales': info.get('priceToSalesTrailing12Months'),
+                'price_to_book': info.get('priceToBook'),
+                'roe': info.get('returnOnEquity'),
+                'revenue_growth': info.get('revenueGrowth'),
+                'profit_margin': info.get('profitMargins'),
+                'market_cap': info.get('marketCap')
+            }
+            
+        except Exception as e:
+            print(f"Error fetching data for {ticker}: {e}")
+            return {}
     
     def get_sector_averages(self, sector: str) -> Optional[Dict[str, float]]:
         """Get sector average metrics"""
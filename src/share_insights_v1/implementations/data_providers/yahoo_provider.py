@@ -1,9 +1,19 @@
+import os
 import yfinance as yf
 import logging
-from typing import Dict, Any
+import threading
+import pandas as pd
+from typing import Callable, Dict, Any, Iterable, List, Optional
 from ...interfaces.data_provider import IDataProvider
 from ...models.financial_metrics import FinancialMetrics
+from ...models.data_section import DataSection, resolve_sections
+from ...models.statement_table import StatementTable
 from ...utils.rate_limit_tracker import rate_tracker
+from ...utils.disk_cache import yahoo_cache
+from ...utils.price_store import period_days, price_store
+from ...utils.dead_ticker_cache import EMPTY_QUOTE_CONFIRMATIONS, dead_tickers, is_dead_error, is_empty_quote
+from ...utils import fixture_bundle
+from .ticker_snapshot import TickerSnapshot
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Suppress noisy yfinance/urllib3 logs (HTTP 401, 404, delisted warnings)
@@ -11,8 +21,219 @@ logging.getLogger('yfinance').setLevel(logging.CRITICAL)
 logging.getLogger('urllib3').setLevel(logging.CRITICAL)
 logging.getLogger('peewee').setLevel(logging.CRITICAL)
 
+# One bounded pool for the statement fetches in get_revenue_trend, shared by
+# every call - a pool per call meant five new threads per analysis, which
+# under concurrent API requests added up to hundreds
+statement_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('YAHOO_STATEMENT_WORKERS', '10')),
+    thread_name_prefix='yahoo-statements',
+)
+
+# Pool for the *_many bulk methods. Kept apart from statement_executor because
+# each bulk task itself waits on statement fetches.
+bulk_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('YAHOO_BULK_WORKERS', '8')),
+    thread_name_prefix='yahoo-bulk',
+)
+
+# Tickers submitted to bulk_executor at a time
+BULK_CHUNK = 50
+
+
+def fetch_many(tickers: List[str], fetch: Callable[[str], Any]) -> Dict[str, Any]:
+    """Run `fetch(ticker)` for every ticker on the shared bulk pool, a chunk at a
+    time. yfinance has no public multi-symbol quote call, so this is the bulk
+    path: requests still go through the shared Yahoo rate limiter, but the
+    chunk's round trips overlap instead of running back to back. Returns
+    {ticker: result} in input order (not completion order); a raised
+    exception becomes that ticker's {'error': ...}."""
+    tickers = list(dict.fromkeys(tickers))
+    results = {}
+    for start in range(0, len(tickers), BULK_CHUNK):
+        futures = {bulk_executor.submit(fetch, ticker): ticker for ticker in tickers[start:start + BULK_CHUNK]}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = {'error': str(e)}
+    return {ticker: results[ticker] for ticker in tickers}
+
+
 class YahooFinanceProvider(IDataProvider):
-    """Yahoo Finance data provider implementation"""
+    """Yahoo Finance data provider implementation.
+
+    Every public method accepts an optional TickerSnapshot so one analysis run
+    (provider calls plus analyzers) shares a single set of Yahoo fetches. Without
+    one, each call builds its own.
+    """
+
+    # Same arguments get_price_data passes to history(), so prefetched frames
+    # land under the key it reads
+    PRICE_HISTORY_PERIOD = '1y'
+    # Window batch prefetch downloads - long enough to also cover the 2y
+    # regression window BetaCalculator/precompute_betas read from the store
+    PREFETCH_PERIOD = '2y'
+
+    def __init__(self):
+        # Price frames from prefetch_price_history and snapshots warmed by the
+        # *_many methods (hand_off=True), consumed by create_snapshot
+        self._prefetched_prices: Dict[str, pd.DataFrame] = {}
+        self._prefetched_snapshots: Dict[str, TickerSnapshot] = {}
+        self._prefetch_lock = threading.Lock()
+
+    def create_snapshot(self, ticker: str) -> TickerSnapshot:
+        """Create the per-analysis snapshot shared by every consumer of one run"""
+        with self._prefetch_lock:
+            snapshot = self._prefetched_snapshots.pop(ticker, None)
+            prices = self._prefetched_prices.pop(ticker, None)
+        snapshot = snapshot or TickerSnapshot(ticker)
+        if prices is not None:
+            snapshot.seed(TickerSnapshot.history_key(period=self.PRICE_HISTORY_PERIOD), prices)
+        return snapshot
+
+    def prefetch_price_history(self, tickers: List[str]) -> int:
+        """Bring a whole batch chunk's daily bars up to date with one request.
+
+        Batch runs call this once per chunk of the input CSV. Tickers with no
+        stored bars share one multi-ticker download of the full period; tickers
+        whose stored bars are merely stale share one download of the missing
+        days. Each result goes through the PriceStore and is handed to its
+        analysis run via create_snapshot, so get_price_data (and everything
+        reading the run's snapshot) makes no per-ticker price calls.
+        Returns the number of tickers with prices ready.
+        """
+        if fixture_bundle.active_bundle() is not None:
+            # Recording/replaying: prices must go through each run's snapshot
+            # so they land in (or come from) the fixture bundle
+            return 0
+
+        period = self.PREFETCH_PERIOD
+        days = period_days(period)
+        tickers = [t for t in dict.fromkeys(tickers) if not dead_tickers.is_dead(t)]
+        states = {t: price_store.status(t, days) if price_store.enabled else 'missing' for t in tickers}
+
+        downloaded = {}
+        full = [t for t in tickers if states[t] == 'missing']
+        if full:
+            downloaded.update(self._download_prices(full, period=period))
+        stale = [t for t in tickers if states[t] == 'stale']
+        if stale:
+            start = min(price_store.resume_date(t) for t in stale)
+            downloaded.update(self._download_prices(stale, start=start))
+
+        ready = {}
+        for ticker in tickers:
+            if states[ticker] != 'fresh' and ticker not in downloaded:
+                continue  # download failed - the analysis run fetches on its own
+
+            def fetch(_ticker=ticker, **kwargs):
+                # Serve the chunk download when it is what the store asked for;
+                # only an adjusted-history reload falls back to a per-ticker call
+                kind = 'start' if states[_ticker] == 'stale' else 'period'
+                if kind in kwargs and _ticker in downloaded:
+                    return downloaded.pop(_ticker)
+                rate_tracker.track_request(_ticker)
+                return yf.Ticker(_ticker).history(**kwargs)
+
+            try:
+                prices = price_store.history(ticker, period, fetch)
+            except Exception as e:
+                self._record_error(ticker, e)
+                continue
+            if prices is not None and not prices.empty:
+                # Hand the run the 1y window get_price_data asks for
+                cutoff = prices.index[-1] - pd.Timedelta(days=period_days(self.PRICE_HISTORY_PERIOD))
+                ready[ticker] = prices.iloc[prices.index.searchsorted(cutoff, side='right'):]
+
+        with self._prefetch_lock:
+            self._prefetched_prices.update(ready)
+        return len(ready)
+
+    def get_financial_metrics_many(self, tickers: List[str], hand_off: bool = False,
+                                   sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Dict[str, Any]]:
+        """get_financial_metrics for many tickers concurrently (see fetch_many).
+
+        With hand_off=True each ticker's loaded snapshot is kept for its next
+        create_snapshot, so a batch that bulk-loads a chunk up front runs the
+        chunk's analyses without fetching the same quotes and statements again.
+        Pass the run's `sections` (AnalysisOrchestrator.data_requirements) so
+        the prefetch loads only what the analyses will read.
+        """
+        return self._many(tickers, lambda ticker, snapshot: self.get_financial_metrics(ticker, snapshot, sections), hand_off)
+
+    def get_professional_analyst_data_many(self, tickers: List[str], hand_off: bool = False) -> Dict[str, Dict[str, Any]]:
+        """get_professional_analyst_data for many tickers concurrently"""
+        return self._many(tickers, self.get_professional_analyst_data, hand_off)
+
+    def _many(self, tickers: List[str], method: Callable[..., Dict[str, Any]], hand_off: bool) -> Dict[str, Dict[str, Any]]:
+        snapshots = {}
+
+        def fetch(ticker):
+            # A fresh snapshot rather than create_snapshot - that would take the
+            # prefetched prices meant for the ticker's analysis run
+            snapshots[ticker] = snapshot = TickerSnapshot(ticker)
+            return method(ticker, snapshot=snapshot)
+
+        results = fetch_many(tickers, fetch)
+        if hand_off:
+            with self._prefetch_lock:
+                for ticker, snapshot in snapshots.items():
+                    if 'error' not in results.get(ticker, {}):
+                        self._prefetched_snapshots[ticker] = snapshot
+        return results
+
+    def _download_prices(self, tickers: List[str], **kwargs) -> Dict[str, pd.DataFrame]:
+        """One multi-ticker yf.download, split into per-ticker frames"""
+        try:
+            rate_tracker.track_request(f"prefetch[{len(tickers)}]")
+            data = yf.download(
+                tickers, group_by='ticker', auto_adjust=True, actions=True,
+                threads=True, progress=False, **kwargs
+            )
+            rate_tracker.record_success()
+        except Exception as e:
+            # Not fatal - each ticker falls back to its own history() call
+            rate_tracker.check_rate_limit_error(str(e), 'prefetch')
+            return {}
+        if data is None or data.empty:
+            return {}
+
+        frames = {}
+        for ticker in tickers:
+            prices = self._slice_download(data, ticker, single=len(tickers) == 1)
+            if prices is not None:
+                frames[ticker] = prices
+        return frames
+
+    @staticmethod
+    def _slice_download(data: pd.DataFrame, ticker: str, single: bool) -> Optional[pd.DataFrame]:
+        """One ticker's frame out of a group_by='ticker' download, or None if it failed"""
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                return None
+            prices = data[ticker]
+        elif single:
+            prices = data
+        else:
+            return None
+
+        # Rows are the union of every ticker's trading days - drop the ones
+        # this ticker has no bar for (other exchange's holidays, pre-listing)
+        prices = prices.dropna(subset=['Close']).copy()
+        prices.columns.name = None
+        return prices if not prices.empty else None
+
+    def invalidate_cache(self, ticker: str) -> int:
+        """Drop a ticker's disk-cached Yahoo data and stored price bars (e.g. after
+        an earnings release) so the next analysis re-downloads them. Returns the
+        number of disk cache entries removed."""
+        price_store.invalidate(ticker)
+        return yahoo_cache.invalidate(ticker)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Disk cache hit/miss counters and price store load counters for this process"""
+        return dict(yahoo_cache.get_stats(), price_store=price_store.get_stats())
+
     def get_revenue_trend(self, stock: yf.Ticker, info: Dict = None) -> Dict:
         """Get revenue trend from yfinance - optimized with parallel DataFrame fetching"""
         
@@ -20,25 +241,24 @@ class YahooFinanceProvider(IDataProvider):
         def fetch_dataframe(attr_name):
             return getattr(stock, attr_name)
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all DataFrame fetch operations in parallel
-            future_to_attr = {
-                executor.submit(fetch_dataframe, 'quarterly_income_stmt'): 'quarterly_income',
-                executor.submit(fetch_dataframe, 'income_stmt'): 'annual_income',
-                executor.submit(fetch_dataframe, 'cashflow'): 'cashflow',
-                executor.submit(fetch_dataframe, 'quarterly_financials'): 'quarterly_financials',
-                executor.submit(fetch_dataframe, 'financials'): 'annual_financials'
-            }
-            
-            # Collect results as they complete
-            dataframes = {}
-            for future in as_completed(future_to_attr):
-                attr_name = future_to_attr[future]
-                try:
-                    dataframes[attr_name] = future.result()
-                except Exception as e:
-                    print(f"Error fetching {attr_name}: {e}")
-                    dataframes[attr_name] = None
+        # Submit all DataFrame fetch operations to the shared statement pool
+        future_to_attr = {
+            statement_executor.submit(fetch_dataframe, 'quarterly_income_stmt'): 'quarterly_income',
+            statement_executor.submit(fetch_dataframe, 'income_stmt'): 'annual_income',
+            statement_executor.submit(fetch_dataframe, 'cashflow'): 'cashflow',
+            statement_executor.submit(fetch_dataframe, 'quarterly_financials'): 'quarterly_financials',
+            statement_executor.submit(fetch_dataframe, 'financials'): 'annual_financials'
+        }
+        
+        # Collect results as they complete
+        dataframes = {}
+        for future in as_completed(future_to_attr):
+            attr_name = future_to_attr[future]
+            try:
+                dataframes[attr_name] = future.result()
+            except Exception as e:
+                print(f"Error fetching {attr_name}: {e}")
+                dataframes[attr_name] = None
         
         # Extract DataFrames
         quarterly_income = dataframes.get('quarterly_income')
@@ -47,22 +267,22 @@ class YahooFinanceProvider(IDataProvider):
         quarterly_financials = dataframes.get('quarterly_financials')
         annual_financials = dataframes.get('annual_financials')
         
-        # Extract revenue data (serialize DataFrames to dicts for JSON compatibility)
-        def serialize_dataframe(df):
-            if df is None or df.empty:
-                return {}
-            df_dict = df.to_dict()
-            serialized = {}
-            for row_key, row_data in df_dict.items():
-                serialized[str(row_key)] = {str(col_key): (str(value) if hasattr(value, 'strftime') else value) for col_key, value in row_data.items()}
-            return serialized
+        # Keep statements as compact tables - the dict form is only built when
+        # the result is serialized (see serialize_statements)
+        tables = {}
+        def statement_table(df):
+            # A snapshot serves financials/quarterly_financials as the same frame
+            # as the income statements - build each table once
+            if id(df) not in tables:
+                tables[id(df)] = StatementTable.from_frame(df)
+            return tables[id(df)]
         
         revenue_data = {
-            'quarterly_income_stmt': serialize_dataframe(quarterly_income),
-            'annual_income_stmt': serialize_dataframe(annual_income),
-            'quarterly_financial_stmt': serialize_dataframe(quarterly_financials),
-            'annual_financial_stmt': serialize_dataframe(annual_financials),
-            'cashflow': serialize_dataframe(cashflow)
+            'quarterly_income_stmt': statement_table(quarterly_income),
+            'annual_income_stmt': statement_table(annual_income),
+            'quarterly_financial_stmt': statement_table(quarterly_financials),
+            'annual_financial_stmt': statement_table(annual_financials),
+            'cashflow': statement_table(cashflow)
         }
     
         # Annual revenue
@@ -90,29 +310,60 @@ class YahooFinanceProvider(IDataProvider):
         # Method 3: From info (current metrics) - use passed info parameter
         if info is None:
             info = stock.info
-        revenue_data['current_revenue'] = info.get('totalRevenue', 0)
-        revenue_data['revenue_growth'] = info.get('revenueGrowth', 0)
-        revenue_data['quarterly_revenue_growth'] = info.get('quarterlyRevenueGrowth', 0)
+        revenue_data.update(self._quote_revenue(info))
         
         return revenue_data
+
+    @staticmethod
+    def _quote_revenue(info: Dict) -> Dict:
+        """The revenue figures the quote itself carries"""
+        return {
+            'current_revenue': info.get('totalRevenue', 0),
+            'revenue_growth': info.get('revenueGrowth', 0),
+            'quarterly_revenue_growth': info.get('quarterlyRevenueGrowth', 0),
+        }
     
-    def get_financial_metrics(self, ticker: str) -> Dict[str, Any]:
-        """Get financial metrics from Yahoo Finance"""
+    def _record_error(self, ticker: str, error: Exception):
+        """Route a per-ticker failure to the rate limiter and the dead-ticker cache"""
+        if rate_tracker.check_rate_limit_error(str(error), ticker):
+            return  # a throttled request says nothing about the symbol
+        if is_dead_error(str(error)):
+            dead_tickers.record_dead(ticker, str(error))
+
+    def get_financial_metrics(self, ticker: str, snapshot: Optional[TickerSnapshot] = None,
+                              sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Any]:
+        """Get financial metrics from Yahoo Finance.
+
+        `sections` limits the fetch to what the run's analyzers read (see
+        IAnalyzer.data_requirements); None fetches everything. Skipped sections
+        leave their fields at the quote-derived values.
+        """
+        sections = resolve_sections(sections)
+        if dead_tickers.is_dead(ticker):
+            return {'error': f"{ticker} skipped: no Yahoo data on recent attempts (possibly delisted)"}
         try:
-            rate_tracker.track_request(ticker)
-            stock = yf.Ticker(ticker)
+            stock = snapshot or self.create_snapshot(ticker)
             info = stock.info
-            revenue_data = self.get_revenue_trend(stock, info)
-            cashflow = stock.cashflow
-            
-            fcf = 0
-            if not cashflow.empty and 'Free Cash Flow' in cashflow.index:
-                fcf_data = cashflow.loc['Free Cash Flow'].dropna()
-                if len(fcf_data) > 0:
-                    fcf = fcf_data.iloc[0]
+            if is_empty_quote(info):
+                dead_tickers.record_dead(ticker, 'empty quote', confirmations=EMPTY_QUOTE_CONFIRMATIONS)
+                return {'error': f"No quote data found for {ticker} (possibly delisted)"}
+            dead_tickers.record_alive(ticker)
+            if DataSection.STATEMENTS in sections:
+                revenue_data = self.get_revenue_trend(stock, info)
+                cashflow = stock.cashflow
+
+                fcf = 0
+                if not cashflow.empty and 'Free Cash Flow' in cashflow.index:
+                    fcf_data = cashflow.loc['Free Cash Flow'].dropna()
+                    if len(fcf_data) > 0:
+                        fcf = fcf_data.iloc[0]
+            else:
+                # The classifier still needs a free cash flow sign - take the
+                # quote's trailing figure instead of downloading the statements
+                revenue_data = self._quote_revenue(info)
+                fcf = info.get('freeCashflow') or 0
 
             # Extract dividend information
-            dividends = stock.dividends
             dividend_info = {
                 'dividend_yield': info.get('dividendYield', 0),
                 'dividend_rate': info.get('dividendRate', 0),
@@ -124,6 +375,7 @@ class YahooFinanceProvider(IDataProvider):
             }
             
             # Get recent dividend history
+            dividends = stock.dividends if DataSection.DIVIDENDS in sections else pd.Series(dtype=float)
             if not dividends.empty:
                 recent_dividends = dividends.tail(12)  # Last 12 dividend payments
                 dividend_info['recent_dividends'] = {str(k): v for k, v in recent_dividends.to_dict().items()}
@@ -203,21 +455,22 @@ class YahooFinanceProvider(IDataProvider):
                 **forward_metrics
             }
         except Exception as e:
-            rate_tracker.check_rate_limit_error(str(e), ticker)
+            self._record_error(ticker, e)
             return {'error': str(e)}
     
-    def get_price_data(self, ticker: str) -> Dict[str, Any]:
+    def get_price_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict[str, Any]:
         """Get price and technical data"""
+        if dead_tickers.is_dead(ticker):
+            return {'error': f"{ticker} skipped: no Yahoo data on recent attempts (possibly delisted)"}
         try:
-            rate_tracker.track_request(ticker)
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1y")
+            stock = snapshot or self.create_snapshot(ticker)
+            hist = stock.history(period=self.PRICE_HISTORY_PERIOD)
             
-            # Get last 30 days for chart
-            from datetime import datetime, timedelta
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            chart_hist = stock.history(start=start_date, end=end_date)
+            # Last 30 days for chart - sliced from the year already loaded
+            # rather than a second history() request
+            chart_hist = hist
+            if not hist.empty:
+                chart_hist = hist[hist.index >= hist.index[-1] - pd.Timedelta(days=30)]
             
             chart_data = {}
             if not chart_hist.empty:
@@ -236,12 +489,11 @@ class YahooFinanceProvider(IDataProvider):
             rate_tracker.check_rate_limit_error(str(e), ticker)
             return {'error': str(e)}
     
-    def get_professional_analyst_data(self, ticker: str) -> Dict:
+    def get_professional_analyst_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict:
         """Fetch ONLY analyst opinions and price targets (not financial metrics)"""
         data = {}
         try:
-            rate_tracker.track_request(ticker)
-            stock = yf.Ticker(ticker)
+            stock = snapshot or self.create_snapshot(ticker)
             info = stock.info
             
             # Price targets (analyst opinions)
@@ -287,11 +539,10 @@ class YahooFinanceProvider(IDataProvider):
         
         return data
     
-    def get_management_data(self, ticker: str) -> Dict[str, Any]:
+    def get_management_data(self, ticker: str, snapshot: Optional[TickerSnapshot] = None) -> Dict[str, Any]:
         """Get management data from Yahoo Finance"""
         try:
-            rate_tracker.track_request(ticker)
-            stock = yf.Ticker(ticker)
+            stock = snapshot or self.create_snapshot(ticker)
             info = stock.info
             
             # Extract available management-related data
@@ -9,6 +9,7 @@ from .xai_provider import XAIProvider
 from .plugin_manager import LLMPluginManager
 from .config_service import LLMConfigService
 from ...utils.debug_printer import debug_print
+from ...utils import fixture_bundle
 class LLMManager:
     """Manages multiple LLM providers with fallback and plugin support"""
     
@@ -95,6 +96,10 @@ class LLMManager:
     
     def generate_response(self, prompt: str, **kwargs) -> str:
         """Generate response using first available provider"""
+        key = (prompt, tuple(sorted(kwargs.items())))
+        return fixture_bundle.through('llm', key, lambda: self._generate_response(prompt, **kwargs))
+    
+    def _generate_response(self, prompt: str, **kwargs) -> str:
         if not self.providers:
             raise Exception("No LLM providers available")
         
@@ -140,11 +145,14 @@ class LLMManager:
     
     def generate_response_with_provider(self, prompt: str, provider_name: str, **kwargs) -> str:
         """Generate response using specific provider"""
-        provider = self.get_provider_by_name(provider_name)
-        if not provider:
-            raise Exception(f"Provider {provider_name} not available")
+        def generate():
+            provider = self.get_provider_by_name(provider_name)
+            if not provider:
+                raise Exception(f"Provider {provider_name} not available")
+            return provider.generate_response(prompt, **kwargs)
         
-        return provider.generate_response(prompt, **kwargs)
+        key = (provider_name, prompt, tuple(sorted(kwargs.items())))
+        return fixture_bundle.through('llm', key, generate)
     
     def set_primary_provider(self, provider_name: str, model_name: str = None):
         """Set a specific provider as primary, auto-instantiating if needed"""
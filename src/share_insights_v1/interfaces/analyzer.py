@@ -1,15 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet
+from ..models.data_section import DataSection, ALL_SECTIONS
 
 class IAnalyzer(ABC):
     """Interface for financial analysis methods"""
-    
+
     @abstractmethod
     def analyze(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform analysis and return results"""
         pass
-    
+
     @abstractmethod
     def is_applicable(self, company_type: str) -> bool:
         """Check if this analyzer applies to the company type"""
-        pass
\ No newline at end of file
+        pass
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Yahoo data sections this analyzer reads. Defaults to all of them -
+        analyzers that read less override it so a run fetches only what its
+        analyzers need."""
+        return ALL_SECTIONS
@@ -1,20 +1,70 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional
+from ..models.data_section import DataSection
 
 class IDataProvider(ABC):
     """Interface for financial data providers"""
     
+    def create_snapshot(self, ticker: str) -> Any:
+        """Create a per-analysis data snapshot shared by every consumer of one
+        analysis run. Providers without one return None and fetch per call."""
+        return None
+    
     @abstractmethod
-    def get_financial_metrics(self, ticker: str) -> Dict[str, Any]:
-        """Get basic financial metrics for a ticker"""
+    def get_financial_metrics(self, ticker: str, snapshot: Any = None,
+                              sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Any]:
+        """Get basic financial metrics for a ticker. `sections` names the data
+        the caller needs (None: everything); providers may fetch more."""
         pass
     
     @abstractmethod
-    def get_price_data(self, ticker: str) -> Dict[str, Any]:
+    def get_price_data(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
+        """Get price and technical data"""
+        pass
+
+    @abstractmethod
+    def get_professional_analyst_data(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
         """Get price and technical data"""
         pass
 
+    def get_financial_metrics_many(self, tickers: List[str], hand_off: bool = False,
+                                   sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Dict[str, Any]]:
+        """Financial metrics for many tickers, keyed by ticker; failures appear as
+        that ticker's {'error': ...}. Providers with a bulk path override this.
+        `hand_off` asks the provider to keep what it loaded for each ticker's
+        next create_snapshot; providers without snapshots ignore it. `sections`
+        as for get_financial_metrics."""
+        return {ticker: self.get_financial_metrics(ticker, sections=sections) for ticker in dict.fromkeys(tickers)}
+
+    def get_professional_analyst_data_many(self, tickers: List[str], hand_off: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Analyst data for many tickers, keyed by ticker (`hand_off` as above)"""
+        return {ticker: self.get_professional_analyst_data(ticker) for ticker in dict.fromkeys(tickers)}
+
+
+class IAsyncDataProvider(ABC):
+    """Awaitable counterpart of IDataProvider for asyncio callers (the API)"""
+
+    def create_snapshot(self, ticker: str) -> Any:
+        """Same per-analysis snapshot as IDataProvider.create_snapshot"""
+        return None
+
+    @abstractmethod
+    async def get_financial_metrics(self, ticker: str, snapshot: Any = None,
+                                    sections: Optional[Iterable[DataSection]] = None) -> Dict[str, Any]:
+        """Get basic financial metrics for a ticker"""
+        pass
+
     @abstractmethod
-    def get_professional_analyst_data(self, ticker: str) -> Dict[str, Any]:
+    async def get_price_data(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
         """Get price and technical data"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_professional_analyst_data(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
+        """Get analyst opinions and price targets"""
+        pass
+
+    @abstractmethod
+    async def get_management_data(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
+        """Get management and governance data"""
+        pass
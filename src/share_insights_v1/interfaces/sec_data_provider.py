@@ -20,6 +20,19 @@ class SECDataProvider(ABC):
         """Get company facts from SEC API"""
         pass
     
+    def get_company_facts(self, ticker: str):
+        """Company facts parsed into an indexed CompanyFacts. Providers with a
+        persistent store override this; the default parses get_filing_facts."""
+        from ..implementations.data_providers.sec_facts_store import CompanyFacts
+        facts = self.get_filing_facts(ticker)
+        return CompanyFacts.from_json(facts) if facts else None
+    
+    def get_filing_version(self, ticker: str) -> Optional[str]:
+        """Identifier of the company's latest periodic filing (e.g. its accession
+        number), used to reuse SEC-derived results until something new is filed.
+        None means results can't be reused."""
+        return None
+    
     @abstractmethod
     def get_segment_revenue_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get segment revenue data from SEC filings"""
@@ -5,6 +5,7 @@ from .financial_metrics import FinancialMetrics
 from .analysis_result import AnalysisResult, AnalysisType
 from .recommendation import Recommendation, RecommendationType
 from .quality_score import QualityScore
+from .data_section import DataSection, ALL_SECTIONS
 
 __all__ = [
     'Company',
@@ -14,5 +15,7 @@ __all__ = [
     'AnalysisType',
     'Recommendation',
     'RecommendationType',
-    'QualityScore'
+    'QualityScore',
+    'DataSection',
+    'ALL_SECTIONS'
 ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from enum import Enum
+from typing import FrozenSet, Iterable, Optional
+
+
+class DataSection(Enum):
+    """Groups of Yahoo data an analysis run can fetch.
+
+    Analyzers declare the sections they read (IAnalyzer.data_requirements)
+    and the orchestrator fetches the union for the analyzers it runs.
+    """
+    QUOTE = "quote"            # .info - always fetched, classification needs it
+    STATEMENTS = "statements"  # income statements and cashflow (revenue trend, FCF)
+    DIVIDENDS = "dividends"    # dividend payment history
+    PRICES = "prices"          # one year of daily bars
+    ANALYST = "analyst"        # upgrades/downgrades
+    NEWS = "news"              # Yahoo news articles
+
+
+ALL_SECTIONS: FrozenSet[DataSection] = frozenset(DataSection)
+
+
+def resolve_sections(sections: Optional[Iterable[DataSection]]) -> FrozenSet[DataSection]:
+    """Sections to fetch: None means everything, QUOTE is always included"""
+    if sections is None:
+        return ALL_SECTIONS
+    return frozenset(sections) | {DataSection.QUOTE}
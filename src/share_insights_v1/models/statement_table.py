@@ -0,0 +1,86 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class StatementTable(Mapping):
+    """One financial statement as a float matrix plus its row and column labels.
+
+    get_revenue_trend used to turn every statement DataFrame into nested
+    {period: {line_item: value}} dicts cell by cell, and those dicts rode along
+    in financial_metrics through every analyzer. A StatementTable keeps the
+    numbers in a single NumPy array (rows are line items, columns are periods,
+    newest first as yfinance returns them) and only builds the dict form when
+    something needs JSON - to_dict(), or serialize_statements() at the API
+    boundary.
+
+    It still reads like the old dict - table[period][line_item], keys(), `in`,
+    .get() - so existing consumers work unchanged, and analyzers can query
+    line items directly with row() and latest().
+    """
+
+    __slots__ = ('values', 'rows', 'columns', '_row_index', '_column_index')
+
+    def __init__(self, values: np.ndarray, rows: Sequence[str], columns: Sequence[str]):
+        self.values = values
+        self.rows = tuple(rows)
+        self.columns = tuple(columns)
+        self._row_index = {row: i for i, row in enumerate(self.rows)}
+        self._column_index = {column: i for i, column in enumerate(self.columns)}
+
+    @classmethod
+    def from_frame(cls, df: Optional[pd.DataFrame]) -> 'StatementTable':
+        """Build from a yfinance statement frame (line items x periods)"""
+        if df is None or df.empty:
+            return cls(np.empty((0, 0)), (), ())
+        values = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+        return cls(values, [str(row) for row in df.index], [str(column) for column in df.columns])
+
+    @property
+    def empty(self) -> bool:
+        return self.values.size == 0
+
+    def row(self, label: str) -> Optional[np.ndarray]:
+        """Values of one line item across periods (newest first), or None if absent"""
+        i = self._row_index.get(label)
+        return None if i is None else self.values[i]
+
+    def latest(self, label: str, default: Any = None) -> Any:
+        """Most recent reported value of a line item"""
+        values = self.row(label)
+        if values is None:
+            return default
+        reported = values[~np.isnan(values)]
+        return float(reported[0]) if len(reported) else default
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=list(self.rows), columns=list(self.columns))
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """The {period: {line_item: value}} form the API and dashboards expect"""
+        return {column: self[column] for column in self.columns}
+
+    def __getitem__(self, column: str) -> Dict[str, float]:
+        return dict(zip(self.rows, self.values[:, self._column_index[column]].tolist()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"StatementTable({len(self.rows)} line items x {len(self.columns)} periods)"
+
+
+def serialize_statements(data: Any) -> Any:
+    """Copy of `data` with every StatementTable replaced by its dict form"""
+    if isinstance(data, StatementTable):
+        return data.to_dict()
+    if isinstance(data, dict):
+        return {key: serialize_statements(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [serialize_statements(value) for value in data]
+    return data
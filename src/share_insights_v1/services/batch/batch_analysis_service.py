@@ -6,6 +6,12 @@ from typing import Dict, Any, List
 from ..orchestration.analysis_orchestrator import AnalysisOrchestrator
 from ..storage.analysis_storage_service import AnalysisStorageService
 from ...implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ...utils.disk_cache import yahoo_cache
+from ...utils.price_store import price_store
+from ...utils.dead_ticker_cache import dead_tickers
+from ...utils.beta_calculator import precompute_betas
+from ...utils.beta_engine import beta_engine
+from ...utils import fixture_bundle
 from...implementations.classifier import CompanyClassifier
 from ...implementations.calculators.quality_calculator import QualityScoreCalculator
 from ...implementations.analyzers.dcf_analyzer import DCFAnalyzer
@@ -20,6 +26,9 @@ from datetime import datetime
 
 class BatchAnalysisService:
     """Service to run batch analysis on multiple stocks from CSV"""
+
+    # Tickers per multi-ticker price download (see _prefetch_prices)
+    PRICE_PREFETCH_CHUNK = 200
     
     def __init__(self, save_to_db: bool = False, enable_detailed_news_analysis: bool  = True):
         self.data_provider = YahooFinanceProvider()
@@ -83,14 +92,21 @@ class BatchAnalysisService:
         from ...implementations.analyzers.industry_analysis_analyzer import IndustryAnalysisAnalyzer
         self.orchestrator.register_analyzer(AnalysisType.INDUSTRY_ANALYSIS, IndustryAnalysisAnalyzer(self.data_provider))
     
-    def process_csv(self, input_csv_path: str, output_csv_path: str, max_stocks: int = None, exchange: str = None, created_by: str = "system"):
-        """Process stocks from CSV and save results to CSV"""
+    def process_csv(self, input_csv_path: str, output_csv_path: str, max_stocks: int = None, exchange: str = None, created_by: str = "system",
+                    pruned_csv_path: str = None):
+        """Process stocks from CSV and save results to CSV.
+
+        `pruned_csv_path` also writes the input CSV minus every symbol the
+        dead-ticker cache knows has no Yahoo data, for use as the next run's input.
+        """
         
         df = pd.read_csv(input_csv_path)
         
         if max_stocks:
             df = df.head(max_stocks)
         
+        df = self._drop_dead_tickers(df)
+        
         total_stocks = len(df)
         print(f"Processing {total_stocks} stocks...")
         
@@ -119,6 +135,9 @@ class BatchAnalysisService:
         
         for idx, row in df.iterrows():
             
+            if count % self.PRICE_PREFETCH_CHUNK == 0:
+                self._prefetch_prices(df['Symbol'].iloc[count:count + self.PRICE_PREFETCH_CHUNK])
+            
             count += 1
             # Set before the try so a malformed Symbol value (e.g. NaN) can't leave
             # `ticker` unbound - the except block below references it, and an
@@ -179,6 +198,46 @@ class BatchAnalysisService:
         print(f"\nResults saved to {output_csv_path}")
         if self.failure_log_path:
             print(f"Failure log saved to {self.failure_log_path}")
+        yahoo_cache.print_stats()
+        price_store.print_stats()
+        beta_engine.drop_returns()
+        dead_tickers.flush()
+        dead_tickers.print_stats()
+        if pruned_csv_path:
+            dropped = dead_tickers.prune_universe(input_csv_path, pruned_csv_path)
+            print(f"✂️ Pruned universe saved to {pruned_csv_path} ({dropped} dead symbols removed)")
+        
+        bundle = fixture_bundle.active_bundle()
+        if bundle is not None:
+            bundle.write_manifest(input_file=input_csv_path, total_stocks=total_stocks, exchange=exchange,
+                                  created_at=datetime.now().isoformat())
+            print(f"🎞️ Fixture bundle ({bundle.mode}): {bundle.path}")
+    
+    def _prefetch_prices(self, symbols: pd.Series):
+        """Pull prices for a chunk of tickers in one download and regress the
+        chunk's betas in one pass, instead of per-ticker history() calls and
+        regressions inside each analysis"""
+        tickers = [str(s).strip().upper() for s in symbols if isinstance(s, str) and s.strip()]
+        if tickers:
+            ready = self.data_provider.prefetch_price_history(tickers)
+            print(f"\n📥 Prefetched prices for {ready}/{len(tickers)} tickers")
+            print(f"📐 Precomputed betas for {precompute_betas(tickers)} tickers")
+            self._prefetch_fundamentals(tickers)
+    
+    def _prefetch_fundamentals(self, tickers: List[str]):
+        """Load the chunk's fundamentals concurrently and hand each ticker's
+        snapshot to its analysis run"""
+        metrics = self.data_provider.get_financial_metrics_many(
+            tickers, hand_off=True, sections=self.orchestrator.data_requirements())
+        loaded = sum(1 for result in metrics.values() if 'error' not in result)
+        print(f"📥 Prefetched fundamentals for {loaded}/{len(tickers)} tickers")
+    
+    def _drop_dead_tickers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Leave out symbols Yahoo had no data for on recent runs (see DeadTickerCache)"""
+        dead = df['Symbol'].map(lambda s: isinstance(s, str) and dead_tickers.is_dead(s.strip()))
+        if dead.any():
+            print(f"⏭️ Skipping {int(dead.sum())} known-dead tickers")
+        return df[~dead].reset_index(drop=True)
     
     def _extract_csv_data(self, ticker: str, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant data for CSV output"""
@@ -8,6 +8,12 @@ import threading
 from ..orchestration.analysis_orchestrator import AnalysisOrchestrator
 from ..storage.analysis_storage_service import AnalysisStorageService
 from ...implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ...utils.disk_cache import yahoo_cache
+from ...utils.price_store import price_store
+from ...utils.dead_ticker_cache import dead_tickers
+from ...utils.beta_calculator import precompute_betas
+from ...utils.beta_engine import beta_engine
+from ...utils import fixture_bundle
 from...implementations.classifier import CompanyClassifier
 from ...implementations.calculators.quality_calculator import QualityScoreCalculator
 from ...implementations.analyzers.dcf_analyzer import DCFAnalyzer
@@ -22,6 +28,9 @@ from datetime import datetime, timezone
 
 class BatchAnalysisService:
     """Service to run batch analysis on multiple stocks from CSV"""
+
+    # Tickers per multi-ticker price download (see _prefetch_prices)
+    PRICE_PREFETCH_CHUNK = 200
     
     def __init__(self, save_to_db: bool = False, enable_detailed_news_analysis: bool = True, max_workers: int = 4):
         self.data_provider = YahooFinanceProvider()
@@ -39,8 +48,11 @@ class BatchAnalysisService:
         self.completed = 0
         self.failed = 0
         
+        # The quant CSV reads only the quote fields of financial_metrics (price,
+        # sector, industry) - fetch just what the registered analyzers need
         self.orchestrator = AnalysisOrchestrator(
-            self.data_provider, self.classifier, self.quality_calculator
+            self.data_provider, self.classifier, self.quality_calculator,
+            report_sections=AnalysisOrchestrator.CORE_SECTIONS
         )
         self.enable_detailed_news_analysis = enable_detailed_news_analysis
         self._register_analyzers()    
@@ -134,14 +146,21 @@ class BatchAnalysisService:
                 self._log_failure(ticker, "EXCEPTION", str(e))
             return ('failed', ticker, csv_row)
     
-    def process_csv(self, input_csv_path: str, output_csv_path: str, max_stocks: int = None, exchange: str = None, created_by: str = "system"):
-        """Process stocks from CSV using multiple threads"""
+    def process_csv(self, input_csv_path: str, output_csv_path: str, max_stocks: int = None, exchange: str = None, created_by: str = "system",
+                    pruned_csv_path: str = None):
+        """Process stocks from CSV using multiple threads.
+
+        `pruned_csv_path` also writes the input CSV minus every symbol the
+        dead-ticker cache knows has no Yahoo data, for use as the next run's input.
+        """
         
         df = pd.read_csv(input_csv_path, keep_default_na=False, na_values=[''])
         
         if max_stocks:
             df = df.head(max_stocks)
         
+        df = self._drop_dead_tickers(df)
+        
         total_stocks = len(df)
         print(f"Processing {total_stocks} stocks with {self.max_workers} threads...")
         
@@ -163,38 +182,45 @@ class BatchAnalysisService:
         self.completed = 0
         self.failed = 0
         
+        tickers = []
+        for idx, row in df.iterrows():
+            symbol = row['Symbol']
+            if pd.isna(symbol) or not isinstance(symbol, str) or not symbol.strip():
+                print(f"Skipping invalid symbol at row {idx}: {symbol}")
+                continue
+            tickers.append(symbol.strip().upper())
+        
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {}
-            for idx, row in df.iterrows():
-                symbol = row['Symbol']
-                if pd.isna(symbol) or not isinstance(symbol, str) or not symbol.strip():
-                    print(f"Skipping invalid symbol at row {idx}: {symbol}")
-                    continue
-                futures[executor.submit(self._process_single_stock, symbol.strip().upper())] = idx
-            
-            for future in as_completed(futures):
-                status, ticker, csv_row = future.result()
+            # Work through the CSV chunk by chunk: one multi-ticker price
+            # download per chunk, then the chunk's analyses in parallel
+            for start in range(0, len(tickers), self.PRICE_PREFETCH_CHUNK):
+                chunk = tickers[start:start + self.PRICE_PREFETCH_CHUNK]
+                self._prefetch_prices(chunk)
+                futures = [executor.submit(self._process_single_stock, ticker) for ticker in chunk]
                 
-                with self.csv_lock:
-                    self._append_to_csv(csv_row, output_csv_path)
-                
-                with self.progress_lock:
-                    if status == 'success':
-                        self.completed += 1
-                    else:
-                        self.failed += 1
+                for future in as_completed(futures):
+                    status, ticker, csv_row = future.result()
                     
-                    count = self.completed + self.failed
-                    if count >= 2 and count % 10 == 0:
-                        time_diff = datetime.now() - time_start
-                        time_per_stock = time_diff / count
-                        time_remaining = time_per_stock * (total_stocks - count)
-                        print(f"📊 Progress: {count}/{total_stocks} ({count*100//total_stocks}%) | Last: {ticker} | ETA: {time_remaining}")
-                    elif count == 1:
-                        print(f"📊 First stock processed: {ticker}")
+                    with self.csv_lock:
+                        self._append_to_csv(csv_row, output_csv_path)
                     
-                    if self.save_to_db and self.batch_job_id:
-                        self._update_batch_job_progress(self.completed, self.failed)
+                    with self.progress_lock:
+                        if status == 'success':
+                            self.completed += 1
+                        else:
+                            self.failed += 1
+                        
+                        count = self.completed + self.failed
+                        if count >= 2 and count % 10 == 0:
+                            time_diff = datetime.now() - time_start
+                            time_per_stock = time_diff / count
+                            time_remaining = time_per_stock * (total_stocks - count)
+                            print(f"📊 Progress: {count}/{total_stocks} ({count*100//total_stocks}%) | Last: {ticker} | ETA: {time_remaining}")
+                        elif count == 1:
+                            print(f"📊 First stock processed: {ticker}")
+                        
+                        if self.save_to_db and self.batch_job_id:
+                            self._update_batch_job_progress(self.completed, self.failed)
         
         if self.save_to_db and self.batch_job_id:
             self._complete_batch_job()
@@ -202,6 +228,44 @@ class BatchAnalysisService:
         print(f"\nResults saved to {output_csv_path}")
         if self.failure_log_path:
             print(f"Failure log saved to {self.failure_log_path}")
+        yahoo_cache.print_stats()
+        price_store.print_stats()
+        beta_engine.drop_returns()
+        dead_tickers.flush()
+        dead_tickers.print_stats()
+        if pruned_csv_path:
+            dropped = dead_tickers.prune_universe(input_csv_path, pruned_csv_path)
+            print(f"✂️ Pruned universe saved to {pruned_csv_path} ({dropped} dead symbols removed)")
+        
+        bundle = fixture_bundle.active_bundle()
+        if bundle is not None:
+            bundle.write_manifest(input_file=input_csv_path, total_stocks=total_stocks, exchange=exchange,
+                                  created_at=datetime.now().isoformat())
+            print(f"🎞️ Fixture bundle ({bundle.mode}): {bundle.path}")
+    
+    def _prefetch_prices(self, tickers: List[str]):
+        """Pull prices for a chunk of tickers in one download and regress the
+        chunk's betas in one pass, instead of per-ticker history() calls and
+        regressions inside each analysis"""
+        ready = self.data_provider.prefetch_price_history(tickers)
+        print(f"📥 Prefetched prices for {ready}/{len(tickers)} tickers")
+        print(f"📐 Precomputed betas for {precompute_betas(tickers)} tickers")
+        self._prefetch_fundamentals(tickers)
+    
+    def _prefetch_fundamentals(self, tickers: List[str]):
+        """Load the chunk's fundamentals concurrently and hand each ticker's
+        snapshot to its analysis run"""
+        metrics = self.data_provider.get_financial_metrics_many(
+            tickers, hand_off=True, sections=self.orchestrator.data_requirements())
+        loaded = sum(1 for result in metrics.values() if 'error' not in result)
+        print(f"📥 Prefetched fundamentals for {loaded}/{len(tickers)} tickers")
+    
+    def _drop_dead_tickers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Leave out symbols Yahoo had no data for on recent runs (see DeadTickerCache)"""
+        dead = df['Symbol'].map(lambda s: isinstance(s, str) and dead_tickers.is_dead(s.strip()))
+        if dead.any():
+            print(f"⏭️ Skipping {int(dead.sum())} known-dead tickers")
+        return df[~dead].reset_index(drop=True)
     
     def _extract_csv_data(self, ticker: str, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant data for CSV output"""
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from ...interfaces.data_provider import IDataProvider
 
@@ -24,10 +24,10 @@ class AnalystComparisonService:
     def __init__(self, data_provider: IDataProvider):
         self.data_provider = data_provider
     
-    def compare_analysis_results(self, ticker: str, analysis_results: Dict[str, Any]) -> List[ComparisonResult]:
+    def compare_analysis_results(self, ticker: str, analysis_results: Dict[str, Any], snapshot: Optional[Any] = None) -> List[ComparisonResult]:
         """Compare our analysis results against professional analyst consensus"""
         try:
-            analyst_data = self.data_provider.get_professional_analyst_data(ticker)
+            analyst_data = self.data_provider.get_professional_analyst_data(ticker, snapshot=snapshot)
             
             if 'error' in analyst_data or not analyst_data.get('target_price'):
                 return []
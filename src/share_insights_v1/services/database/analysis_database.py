@@ -3,6 +3,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import pandas as pd
+from ...models.statement_table import serialize_statements
 
 class AnalysisDatabase:
     """Database service for storing and retrieving stock analysis results"""
@@ -117,7 +118,7 @@ class AnalysisDatabase:
                 analyses.get('management_quality', {}).get('recommendation', ''),
                 analyses.get('analyst_consensus', {}).get('recommendation', ''),
                 analyses.get('industry_analysis', {}).get('recommendation', ''),
-                json.dumps(analysis_result, default=str),
+                json.dumps(serialize_statements(analysis_result), default=str),
                 analysis_result.get('execution_time_seconds', 0),
                 analysis_result.get('analyses_count', 0)
             ))
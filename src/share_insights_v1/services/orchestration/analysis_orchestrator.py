@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, Iterable, List
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
 from ...interfaces.analyzer import IAnalyzer
 from ...interfaces.data_provider import IDataProvider
@@ -6,6 +6,7 @@ from ...interfaces.classifier import ICompanyClassifier
 from ...interfaces.calculator import ICalculator
 from ...models.company import CompanyType, Company
 from ...models.analysis_result import AnalysisResult, AnalysisType
+from ...models.data_section import DataSection, ALL_SECTIONS
 from ..recommendation.recommendation_service import RecommendationService
 from ..comparison.analyst_comparison_service import AnalystComparisonService
 from ...utils.debug_printer import debug_print
@@ -13,11 +14,21 @@ from datetime import datetime
 
 class AnalysisOrchestrator:
     """Orchestrates multiple analyzers based on company type"""
+
+    # What a run needs besides its analyzers: the quote (classification,
+    # quality score) and analyst ratings (comparison with the professionals)
+    CORE_SECTIONS = frozenset({DataSection.QUOTE, DataSection.ANALYST})
     
-    def __init__(self, data_provider: IDataProvider, classifier: ICompanyClassifier, quality_calculator: ICalculator, debug_mode: bool = False):
+    def __init__(self, data_provider: IDataProvider, classifier: ICompanyClassifier, quality_calculator: ICalculator, debug_mode: bool = False,
+                 report_sections: Iterable[DataSection] = ALL_SECTIONS):
+        """`report_sections` is the data the run's report carries regardless of
+        the registered analyzers - everything by default, so the full
+        financial_metrics (dividend history, statements) stays in the result.
+        Callers that only want their analyzers' output pass CORE_SECTIONS."""
         self.data_provider = data_provider
         self.classifier = classifier
         self.quality_calculator = quality_calculator
+        self.report_sections = frozenset(report_sections) | self.CORE_SECTIONS
         self.recommendation_service = RecommendationService()
         self.comparison_service = AnalystComparisonService(data_provider)
         self.analyzers: Dict[AnalysisType, IAnalyzer] = {}
@@ -27,21 +38,46 @@ class AnalysisOrchestrator:
     def register_analyzer(self, analysis_type: AnalysisType, analyzer: IAnalyzer):
         """Register an analyzer for a specific analysis type"""
         self.analyzers[analysis_type] = analyzer
+
+    def data_requirements(self) -> FrozenSet[DataSection]:
+        """Data sections a run fetches: the report's plus every registered
+        analyzer's (IAnalyzer.data_requirements)"""
+        sections = set(self.report_sections)
+        for analyzer in self.analyzers.values():
+            if hasattr(analyzer, 'data_requirements'):
+                sections |= analyzer.data_requirements()
+            else:
+                sections |= ALL_SECTIONS
+        return frozenset(sections)
     
-    def analyze_stock(self, ticker: str) -> Dict[str, Any]:
-        """Run comprehensive analysis for a stock"""
+    def analyze_stock(self, ticker: str, snapshot: Any = None) -> Dict[str, Any]:
+        """Run comprehensive analysis for a stock.
+
+        `snapshot` lets the caller hand in one it already loaded (the API warms
+        it asynchronously); otherwise the data provider creates one.
+        """
         overall_start_time = datetime.now()
         try:
+            # One snapshot per run - the provider calls below and every analyzer
+            # (via analysis_data) share its Yahoo fetches instead of re-pulling them
+            if snapshot is None:
+                snapshot = self.data_provider.create_snapshot(ticker)
+
+            # Only fetch the sections the registered analyzers read
+            sections = self.data_requirements()
+
             # Get financial data
             start_time = datetime.now()
-            financial_metrics = self.data_provider.get_financial_metrics(ticker)
+            financial_metrics = self.data_provider.get_financial_metrics(ticker, snapshot=snapshot, sections=sections)
             end_time = datetime.now()
             time_taken = (end_time - start_time).total_seconds()
             # debug_print(f"[Analysis_Orchestrator]: {ticker}: Time Taken for Financial Metrics: {time_taken}")
             self.time_calculations['financial_metrics'] = time_taken
 
             start_time = datetime.now()
-            price_data = self.data_provider.get_price_data(ticker)
+            price_data = {}
+            if DataSection.PRICES in sections:
+                price_data = self.data_provider.get_price_data(ticker, snapshot=snapshot)
             end_time = datetime.now()
             time_taken = (end_time - start_time).total_seconds()
             # debug_print(f"[Analysis_Orchestrator]: {ticker}: Time Taken for Price Data: {time_taken}")
@@ -70,7 +106,8 @@ class AnalysisOrchestrator:
                 },
                 'company_type': company_type,
                 'current_price': financial_metrics.get('current_price', 0),
-                'quality_grade': quality_grade
+                'quality_grade': quality_grade,
+                'ticker_snapshot': snapshot
             }
             
             # Determine which analyses to run (only registered ones that are applicable)
@@ -169,7 +206,7 @@ class AnalysisOrchestrator:
                 results['final_recommendation'] = final_recommendation
                 
                 # Compare against professional analysts
-                analyst_comparisons = self.comparison_service.compare_analysis_results(ticker, results)
+                analyst_comparisons = self.comparison_service.compare_analysis_results(ticker, results, snapshot=snapshot)
                 if analyst_comparisons:
                     results['analyst_comparison'] = {
                         'comparisons': analyst_comparisons,
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import threading
+import time
+from ..utils.article_cache import ArticleCache, canonical_url
+
+
+def test_canonical_url_drops_tracking():
+    a = canonical_url('https://Finance.Yahoo.com/news/market-wrap-123.html?guccounter=1&.tsrc=rss#comments')
+    b = canonical_url('https://finance.yahoo.com/news/market-wrap-123.html/?utm_source=aapl')
+    assert a == b == 'https://finance.yahoo.com/news/market-wrap-123.html'
+    # Parameters that pick the article are kept
+    assert canonical_url('https://example.com/story?id=7') != canonical_url('https://example.com/story?id=8')
+    # Only exact tracking names - `from` and `frame` look like `fr` but pick content
+    assert canonical_url('https://example.com/story?fr=yhssrp&from=2025-06-01') == 'https://example.com/story?from=2025-06-01'
+    assert canonical_url('https://example.com/chart?frame=1') != canonical_url('https://example.com/chart?frame=2')
+    assert canonical_url('https://example.com/story?guce_referrer=abc&utm_medium=rss') == 'https://example.com/story'
+
+
+def test_one_download_across_tickers():
+    calls = []
+
+    def scrape():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'Stocks rallied on Friday...'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArticleCache(tmp)
+        # Two tickers' feeds link the same wrap at the same time
+        threads = [threading.Thread(target=cache.get, args=(url, scrape)) for url in (
+            'https://finance.yahoo.com/news/wrap.html?ncid=aapl', 'https://finance.yahoo.com/news/wrap.html?ncid=msft')]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # The next process reads the stored text
+        assert ArticleCache(tmp).cached('https://finance.yahoo.com/news/wrap.html') == 'Stocks rallied on Friday...'
+        assert len(calls) == 1
+        # Nothing is kept per URL once the download is done
+        assert cache._flight.get_stats()['in_flight'] == 0 and not hasattr(cache, '_locks')
+
+        # Failures aren't stored; expired entries are scraped again
+        assert cache.get('https://example.com/paywalled', lambda: None) is None
+        assert cache.cached('https://example.com/paywalled') is None
+        assert ArticleCache(tmp, ttl=-1).cached('https://finance.yahoo.com/news/wrap.html') is None
+
+
+def test_size_budget_evicts_oldest():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArticleCache(tmp, max_bytes=2500)
+        start = time.time() - 60
+        for i in range(5):
+            cache.get(f'https://example.com/{i}', lambda: 'x' * 1000)
+            # Distinct write times, oldest first
+            os.utime(cache._path(canonical_url(f'https://example.com/{i}')), (start + i, start + i))
+
+        stored = [i for i in range(5) if cache.cached(f'https://example.com/{i}') is not None]
+        assert stored == [3, 4]
+        assert cache.get_stats()['evicted'] == 3
+
+
+if __name__ == "__main__":
+    test_canonical_url_drops_tracking()
+    test_one_download_across_tickers()
+    test_size_budget_evicts_oldest()
+    print("All article cache tests passed")
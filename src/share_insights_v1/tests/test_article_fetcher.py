@@ -0,0 +1,121 @@
+import threading
+import time
+from ..implementations.analyzers import news_sentiment_analyzer as news_module
+from ..implementations.analyzers.news_sentiment_analyzer import NewsSentimentAnalyzer
+from ..utils.article_cache import ArticleCache
+from ..utils.article_fetcher import ArticleFetcher
+
+
+class SlowSite:
+    """Each fetch takes `delay` seconds; tracks peak concurrency per host"""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        host = url.split('/')[2]
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        if url.endswith('/bad'):
+            raise ValueError('unreadable')
+        return f"text of {url}"
+
+
+def test_fans_out_with_per_domain_cap():
+    site = SlowSite()
+    fetcher = ArticleFetcher(workers=8, per_domain=2, deadline=5)
+    urls = [f'https://news.example.com/{i}' for i in range(4)] + [f'https://other.example.org/{i}' for i in range(2)]
+
+    start = time.monotonic()
+    results = fetcher.fetch_all(urls + ['https://other.example.org/bad'], site)
+    elapsed = time.monotonic() - start
+
+    # 4 articles from one host at 2 at a time -> two rounds, the other host alongside
+    assert 0.2 <= elapsed < 0.35
+    assert site.peak['news.example.com'] == 2
+    assert results['https://news.example.com/3'] == 'text of https://news.example.com/3'
+    assert results['https://other.example.org/bad'] is None
+
+
+def test_deadline_bounds_the_whole_fan_out():
+    site = SlowSite(delay=0.3)
+    fetcher = ArticleFetcher(workers=8, per_domain=1, deadline=0.4)
+    urls = [f'https://news.example.com/{i}' for i in range(5)]
+
+    start = time.monotonic()
+    results = fetcher.fetch_all(urls, site)
+
+    assert time.monotonic() - start < 0.5
+    assert results['https://news.example.com/0'] is not None
+    assert sum(text is None for text in results.values()) == 4
+    assert sum(fetcher.get_stats().values()) == 5
+
+
+def test_busy_host_does_not_hold_workers():
+    site = SlowSite()
+    finished = {}
+    fetcher = ArticleFetcher(workers=2, per_domain=1, deadline=5)
+    start = time.monotonic()
+
+    def timed(url):
+        text = site(url)
+        finished[url] = time.monotonic() - start
+        return text
+
+    # Most links point at one host; the other host's article still starts at once
+    urls = [f'https://finance.yahoo.com/{i}' for i in range(3)] + ['https://other.example.org/0']
+    results = fetcher.fetch_all(urls, timed)
+
+    assert finished['https://other.example.org/0'] < 0.15
+    assert site.peak['finance.yahoo.com'] == 1
+    assert all(results.values())
+
+
+def test_late_queued_articles_are_never_fetched():
+    site = SlowSite(delay=0.3)
+    calls = []
+    fetcher = ArticleFetcher(workers=4, per_domain=1, deadline=0.1)
+    fetcher.fetch_all([f'https://news.example.com/{i}' for i in range(3)], lambda url: calls.append(url) or site(url))
+    time.sleep(0.4)
+    # Only the article already downloading ran; the queued ones were dropped
+    assert calls == ['https://news.example.com/0']
+    assert fetcher._active['news.example.com'] == 0
+
+
+class FakeSnapshot:
+    news = [
+        {'content': {'title': f'Story {i}', 'summary': f'Yahoo summary {i}', 'pubDate': f'2025-06-1{i}T10:00:00Z',
+                     'provider': {'displayName': 'Wire'}, 'canonicalUrl': {'url': f'https://news.example.com/{i}'}}}
+        for i in range(3)
+    ]
+
+
+def test_analyzer_falls_back_to_yahoo_summary():
+    analyzer = NewsSentimentAnalyzer(data_provider=None, llm_manager=object(), max_articles=3)
+    analyzer._fetch_article_content = lambda url: None if url.endswith('/1') else f'Full text of {url}'
+    original = news_module.article_cache
+    news_module.article_cache = ArticleCache('', enabled=False)  # keep off the shared store
+    try:
+        news = analyzer._get_recent_news('TEST', {}, FakeSnapshot())
+    finally:
+        news_module.article_cache = original
+
+    summaries = {item['title']: item['summary'] for item in news}
+    assert summaries['Story 2'] == 'Full text of https://news.example.com/2'
+    assert summaries['Story 1'] == 'Yahoo summary 1'
+
+
+if __name__ == "__main__":
+    test_fans_out_with_per_domain_cap()
+    test_deadline_bounds_the_whole_fan_out()
+    test_busy_host_does_not_hold_workers()
+    test_late_queued_articles_are_never_fetched()
+    test_analyzer_falls_back_to_yahoo_summary()
+    print("All article fetcher tests passed")
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from ..implementations.data_providers.async_yahoo_provider import AsyncYahooFinanceProvider
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from .test_ticker_snapshot import FakeTicker, NO_CACHE, NO_PRICES
+
+
+class FakeProvider(YahooFinanceProvider):
+    """YahooFinanceProvider whose snapshots read from one shared FakeTicker"""
+
+    def __init__(self):
+        super().__init__()
+        self.fake = FakeTicker()
+
+    def create_snapshot(self, ticker):
+        return TickerSnapshot(ticker, ticker_obj=self.fake, cache=NO_CACHE, prices=NO_PRICES)
+
+
+def test_warm_snapshot_loads_resources_once():
+    provider = AsyncYahooFinanceProvider(FakeProvider())
+
+    snapshot = asyncio.run(provider.warm_snapshot('TEST'))
+
+    # FakeTicker only has info, income_stmt and history - the rest fail and
+    # are left for the analysis run to retry
+    assert snapshot.is_loaded('info')
+    assert snapshot.is_loaded('income_stmt')
+    assert not snapshot.is_loaded('cashflow')
+    assert snapshot.history(period='1y') == [1, 2, 3]
+    assert provider.provider.fake.calls['info'] == 1
+
+
+def test_coroutines_share_one_snapshot_across_concurrent_requests():
+    provider = AsyncYahooFinanceProvider(FakeProvider())
+
+    async def run():
+        snapshot = provider.create_snapshot('TEST')
+        return await asyncio.gather(*[
+            provider.get_management_data('TEST', snapshot=snapshot) for _ in range(10)
+        ])
+
+    results = asyncio.run(run())
+
+    assert all(r['ticker'] == 'TEST' for r in results)
+    assert provider.provider.fake.calls['info'] == 1
+
+
+def test_io_runs_off_the_event_loop_thread():
+    provider = AsyncYahooFinanceProvider(FakeProvider())
+    seen = []
+
+    def record():
+        seen.append(threading.current_thread().name)
+
+    async def run():
+        await provider._run(record)
+        return threading.current_thread().name
+
+    loop_thread = asyncio.run(run())
+
+    assert seen[0] != loop_thread
+    assert seen[0].startswith('yahoo-io')
+
+
+if __name__ == "__main__":
+    test_warm_snapshot_loads_resources_once()
+    test_coroutines_share_one_snapshot_across_concurrent_requests()
+    test_io_runs_off_the_event_loop_thread()
+    print("All AsyncYahooFinanceProvider tests passed")
@@ -7,7 +7,7 @@ from datetime import datetime
 
 from ..services.batch.batch_analysis_service_quant import BatchAnalysisService
 
-def test_batch_analysis(filename="single", max_workers=4):
+def test_batch_analysis(filename="single", max_workers=4, prune=False):
     """Test batch analysis service with sample CSV"""
     
     # Initialize batch service with thread count
@@ -23,13 +23,15 @@ def test_batch_analysis(filename="single", max_workers=4):
     date = datetime.now().strftime("%Y%m%d%H%M%S")
     input_csv = os.path.join(input_csv_dir, f"{filename}.csv")
     output_csv = os.path.join(output_csv_dir, f"{filename}_{date}_analysis.csv")
+    pruned_csv = os.path.join(input_csv_dir, f"{filename}_pruned.csv") if prune else None
     
     print(f"Starting batch analysis with {max_workers} threads...")
     batch_service.process_csv(
         input_csv_path=input_csv,
         output_csv_path=output_csv,
         exchange=filename.upper(),
-        created_by="batch_user"
+        created_by="batch_user",
+        pruned_csv_path=pruned_csv
     )
     
     print(f"Results saved to {output_csv}")
@@ -46,8 +48,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Batch stock analysis')
     parser.add_argument('filename', nargs='?', default='single', help='CSV filename (without .csv)')
     parser.add_argument('--threads', '-t', type=int, default=4, help='Number of threads (default: 4)')
+    parser.add_argument('--prune', action='store_true', help='Also write <filename>_pruned.csv without known-dead tickers')
     
     args = parser.parse_args()
     
     print(f"Running batch analysis on {args.filename} with {args.threads} threads")
-    test_batch_analysis(args.filename, args.threads)
\ No newline at end of file
+    test_batch_analysis(args.filename, args.threads, args.prune)
\ No newline at end of file
@@ -0,0 +1,86 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+from ..utils.beta_engine import BetaEngine
+
+
+def make_universe(days=300, seed=7):
+    """Benchmark plus three stocks with known betas, one with missing bars"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2024-01-01', periods=days)
+    market_returns = rng.normal(0.0005, 0.01, days)
+    benchmark = pd.Series(100 * np.cumprod(1 + market_returns), index=dates)
+
+    prices = {}
+    for ticker, beta in [('LOW', 0.5), ('MKT', 1.0), ('HIGH', 1.8)]:
+        returns = beta * market_returns + rng.normal(0, 0.004, days)
+        prices[ticker] = 50 * np.cumprod(1 + returns)
+    prices = pd.DataFrame(prices, index=dates)
+    prices.iloc[:40, prices.columns.get_loc('HIGH')] = np.nan  # listed later
+    return prices, benchmark
+
+
+def per_ticker_beta(closes, benchmark):
+    """The pandas join + regression BetaCalculator used to run per stock"""
+    aligned = pd.concat([closes.pct_change(), benchmark.pct_change()], axis=1, join='inner').dropna()
+    cov = np.cov(aligned.iloc[:, 0], aligned.iloc[:, 1])
+    return cov[0, 1] / cov[1, 1], len(aligned)
+
+
+def test_matches_per_ticker_regression():
+    prices, benchmark = make_universe()
+    results = BetaEngine().compute(prices, benchmark)
+
+    for ticker in prices.columns:
+        beta, n = per_ticker_beta(prices[ticker], benchmark)
+        assert abs(results.at[ticker, 'beta'] - beta) < 1e-9
+        assert results.at[ticker, 'observations'] == n
+    assert abs(results.at['HIGH', 'beta'] - 1.8) < 0.1
+    assert results['valid'].all()
+
+
+def test_publish_and_lookup():
+    prices, benchmark = make_universe()
+    engine = BetaEngine()
+    engine.publish(engine.compute(prices, benchmark))
+
+    assert engine.lookup('mkt').valid
+    assert engine.lookup('MKT', period='5y') is None
+    assert engine.lookup('NOPE') is None
+
+
+def test_estimates_expire_at_the_next_close():
+    prices, benchmark = make_universe()
+    engine = BetaEngine()
+    new_york = ZoneInfo('America/New_York')
+    friday_evening = datetime(2025, 6, 13, 18, 0, tzinfo=new_york)
+    engine.publish(engine.compute(prices, benchmark), now=friday_evening)
+
+    # Still the same prices over the weekend and Monday's session...
+    assert engine.lookup('MKT', now=datetime(2025, 6, 16, 15, 0, tzinfo=new_york)) is not None
+    # ...but once Monday's close settles the regression is out of date
+    assert engine.lookup('MKT', now=datetime(2025, 6, 16, 17, 0, tzinfo=new_york)) is None
+
+    engine.compute(prices, benchmark, keep_returns=True)
+    engine.drop_returns()
+    assert engine.covariance().empty
+
+
+def test_covariance_matches_pandas():
+    prices, benchmark = make_universe()
+    engine = BetaEngine()
+    engine.compute(prices, benchmark, keep_returns=True)
+
+    expected = prices.pct_change(fill_method=None).iloc[1:].cov()
+    assert np.allclose(engine.covariance().to_numpy(), expected.to_numpy())
+    assert list(engine.covariance(['LOW', 'HIGH']).columns) == ['LOW', 'HIGH']
+
+
+if __name__ == "__main__":
+    test_matches_per_ticker_regression()
+    test_publish_and_lookup()
+    test_estimates_expire_at_the_next_close()
+    test_covariance_matches_pandas()
+    print("All BetaEngine tests passed")
@@ -0,0 +1,97 @@
+import time
+import pandas as pd
+from ..implementations.data_providers import yahoo_peer_provider, yahoo_provider
+from ..implementations.data_providers.yahoo_peer_provider import YahooPeerProvider
+from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider, fetch_many
+from ..interfaces.data_provider import IDataProvider
+
+
+class FakeSnapshot:
+    """Stands in for TickerSnapshot: each quote takes 50ms, 'BAD' raises"""
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self.upgrades_downgrades = pd.DataFrame()
+
+    @property
+    def info(self):
+        time.sleep(0.05)
+        if self.ticker == 'BAD':
+            raise ValueError('No data found, symbol may be delisted')
+        return {'symbol': self.ticker, 'targetMeanPrice': 100.0, 'numberOfAnalystOpinions': 12,
+                'trailingPE': 20.0, 'marketCap': 1e9}
+
+
+def test_fetch_many_runs_concurrently_and_keeps_errors():
+    def fetch(ticker):
+        time.sleep(0.05 if ticker != 'A' else 0.08)  # finishes last
+        if ticker == 'BAD':
+            raise RuntimeError('boom')
+        return {'ticker': ticker}
+
+    start = time.monotonic()
+    results = fetch_many(['A', 'B', 'C', 'D', 'BAD', 'A'], fetch)
+    assert time.monotonic() - start < 0.2  # five 50ms fetches, overlapped
+    assert results['A'] == {'ticker': 'A'}
+    assert results['BAD'] == {'error': 'boom'}
+    assert list(results) == ['A', 'B', 'C', 'D', 'BAD']  # input order, not completion order
+
+
+def test_analyst_data_many_and_hand_off():
+    original = yahoo_provider.TickerSnapshot
+    yahoo_provider.TickerSnapshot = FakeSnapshot
+    try:
+        provider = YahooFinanceProvider()
+        results = provider.get_professional_analyst_data_many(['AAPL', 'MSFT', 'BAD'], hand_off=True)
+
+        assert results['AAPL']['target_price'] == 100.0
+        assert results['MSFT']['analyst_count'] == 12
+        assert results['BAD'] == {}
+        # The analysis run picks up the loaded snapshot instead of starting over
+        snapshot = provider.create_snapshot('AAPL')
+        assert isinstance(snapshot, FakeSnapshot) and snapshot.ticker == 'AAPL'
+        assert provider.create_snapshot('AAPL') is not snapshot
+    finally:
+        yahoo_provider.TickerSnapshot = original
+
+
+def test_peer_metrics_fetched_concurrently():
+    original = yahoo_peer_provider.TickerSnapshot
+    yahoo_peer_provider.TickerSnapshot = FakeSnapshot
+    try:
+        start = time.monotonic()
+        peers = YahooPeerProvider().get_peer_metrics(['MSFT', 'GOOGL', 'META', 'BAD'])
+        assert time.monotonic() - start < 0.15
+        assert peers['MSFT']['pe_ratio'] == 20.0 and peers['META']['market_cap'] == 1e9
+        assert peers['BAD'] == {}
+    finally:
+        yahoo_peer_provider.TickerSnapshot = original
+
+
+class PlainProvider(IDataProvider):
+    """A provider with no bulk path or snapshots - only the required methods"""
+
+    def get_financial_metrics(self, ticker, snapshot=None, sections=None):
+        return {'current_price': 10.0}
+
+    def get_price_data(self, ticker, snapshot=None):
+        return {}
+
+    def get_professional_analyst_data(self, ticker, snapshot=None):
+        return {'analyst_count': 3}
+
+
+def test_default_bulk_methods_accept_hand_off():
+    # The batch services always pass hand_off=True
+    provider = PlainProvider()
+    assert provider.get_financial_metrics_many(['A', 'B', 'A'], hand_off=True) == {
+        'A': {'current_price': 10.0}, 'B': {'current_price': 10.0}}
+    assert provider.get_professional_analyst_data_many(['A'], hand_off=True) == {'A': {'analyst_count': 3}}
+
+
+if __name__ == "__main__":
+    test_fetch_many_runs_concurrently_and_keeps_errors()
+    test_analyst_data_many_and_hand_off()
+    test_peer_metrics_fetched_concurrently()
+    test_default_bulk_methods_accept_hand_off()
+    print("All bulk fundamentals tests passed")
@@ -0,0 +1,163 @@
+import asyncio
+from ..interfaces.analyzer import IAnalyzer
+from ..interfaces.data_provider import IDataProvider
+from ..implementations.data_providers.async_yahoo_provider import AsyncYahooFinanceProvider
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+from ..implementations.data_providers import yahoo_provider
+from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ..models.analysis_result import AnalysisType
+from ..models.data_section import ALL_SECTIONS, DataSection
+from ..services.orchestration.analysis_orchestrator import AnalysisOrchestrator
+from .test_async_yahoo_provider import FakeProvider
+from .test_ticker_snapshot import NO_CACHE, NO_PRICES
+
+
+class RecordingProvider(IDataProvider):
+    def __init__(self):
+        self.sections = None
+        self.price_calls = 0
+
+    def get_financial_metrics(self, ticker, snapshot=None, sections=None):
+        self.sections = sections
+        return {'market_cap': 1e9, 'sector': 'Technology', 'current_price': 10.0}
+
+    def get_price_data(self, ticker, snapshot=None):
+        self.price_calls += 1
+        return {'price_history': None}
+
+    def get_professional_analyst_data(self, ticker, snapshot=None):
+        return {}
+
+
+class StubAnalyzer(IAnalyzer):
+    def __init__(self, *sections):
+        self.sections = frozenset(sections)
+
+    def analyze(self, ticker, data):
+        return {'recommendation': 'Hold', 'confidence': 'Low'}
+
+    def is_applicable(self, company_type):
+        return True
+
+    def data_requirements(self):
+        return self.sections
+
+
+class LegacyAnalyzer(StubAnalyzer):
+    """An analyzer that never declared its requirements"""
+    data_requirements = IAnalyzer.data_requirements
+
+
+class StubClassifier:
+    def classify(self, ticker, metrics):
+        return 'mature_profitable'
+
+
+class StubQuality:
+    def calculate(self, metrics):
+        return {'grade': 'B'}
+
+
+def make_orchestrator(provider, **kwargs):
+    return AnalysisOrchestrator(provider, StubClassifier(), StubQuality(), **kwargs)
+
+
+def test_union_of_registered_analyzers():
+    orchestrator = make_orchestrator(RecordingProvider(), report_sections=AnalysisOrchestrator.CORE_SECTIONS)
+    orchestrator.register_analyzer(AnalysisType.TECHNICAL, StubAnalyzer(DataSection.PRICES))
+    orchestrator.register_analyzer(AnalysisType.ANALYST_CONSENSUS, StubAnalyzer(DataSection.QUOTE, DataSection.ANALYST))
+    assert orchestrator.data_requirements() == {DataSection.QUOTE, DataSection.ANALYST, DataSection.PRICES}
+
+    # Undeclared requirements mean everything
+    orchestrator.register_analyzer(AnalysisType.AI_INSIGHTS, LegacyAnalyzer())
+    assert orchestrator.data_requirements() == ALL_SECTIONS
+
+    # Without a narrower report the full metrics are always fetched
+    assert make_orchestrator(RecordingProvider()).data_requirements() == ALL_SECTIONS
+
+
+def test_run_fetches_only_planned_sections():
+    provider = RecordingProvider()
+    orchestrator = make_orchestrator(provider, report_sections=AnalysisOrchestrator.CORE_SECTIONS)
+    orchestrator.register_analyzer(AnalysisType.COMPETITIVE_POSITION, StubAnalyzer(DataSection.QUOTE))
+
+    result = orchestrator.analyze_stock('TEST', snapshot=object())
+
+    assert 'error' not in result
+    assert provider.sections == {DataSection.QUOTE, DataSection.ANALYST}
+    assert provider.price_calls == 0
+
+
+class QuoteOnlyTicker:
+    """A yf.Ticker whose statements and dividends must not be touched"""
+
+    def __init__(self):
+        self.pulled = []
+
+    @property
+    def info(self):
+        return {'symbol': 'TEST', 'regularMarketPrice': 10.0, 'totalRevenue': 5e8,
+                'revenueGrowth': 0.12, 'freeCashflow': 4e7, 'profitMargins': 0.2}
+
+    def __getattr__(self, name):
+        self.pulled.append(name)
+        raise AssertionError(f"{name} fetched outside the plan")
+
+
+def test_provider_skips_unplanned_sections():
+    fake = QuoteOnlyTicker()
+    snapshot = TickerSnapshot('TEST', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES)
+
+    metrics = YahooFinanceProvider().get_financial_metrics('TEST', snapshot=snapshot, sections={DataSection.QUOTE})
+
+    assert fake.pulled == []
+    assert metrics['free_cash_flow'] == 4e7
+    assert metrics['yearly_revenue_growth'] == 0.12
+    assert metrics['current_price'] == 10.0
+    assert 'recent_dividends' not in metrics['dividend_info']
+
+
+def test_bulk_prefetch_follows_plan():
+    fakes = []
+
+    def snapshot_for(ticker):
+        fakes.append(QuoteOnlyTicker())
+        return TickerSnapshot(ticker, ticker_obj=fakes[-1], cache=NO_CACHE, prices=NO_PRICES)
+
+    orchestrator = AnalysisOrchestrator(RecordingProvider(), None, None,
+                                        report_sections=AnalysisOrchestrator.CORE_SECTIONS)
+    orchestrator.register_analyzer(AnalysisType.TECHNICAL, StubAnalyzer(DataSection.PRICES))
+    original = yahoo_provider.TickerSnapshot
+    yahoo_provider.TickerSnapshot = snapshot_for
+    try:
+        metrics = YahooFinanceProvider().get_financial_metrics_many(
+            ['AAA', 'BBB'], sections=orchestrator.data_requirements())
+    finally:
+        yahoo_provider.TickerSnapshot = original
+
+    assert [fake.pulled for fake in fakes] == [[], []]
+    assert metrics['BBB']['current_price'] == 10.0
+
+    # Providers without a bulk path pass the plan through too
+    provider = RecordingProvider()
+    provider.get_financial_metrics_many(['AAA'], hand_off=True, sections={DataSection.QUOTE})
+    assert provider.sections == {DataSection.QUOTE}
+
+
+def test_warm_snapshot_follows_plan():
+    provider = AsyncYahooFinanceProvider(FakeProvider())
+
+    snapshot = asyncio.run(provider.warm_snapshot('TEST', sections={DataSection.PRICES}))
+
+    assert snapshot.is_loaded('info')
+    assert not snapshot.is_loaded('income_stmt')
+    assert 'income_stmt' not in provider.provider.fake.calls
+
+
+if __name__ == "__main__":
+    test_union_of_registered_analyzers()
+    test_run_fetches_only_planned_sections()
+    test_provider_skips_unplanned_sections()
+    test_bulk_prefetch_follows_plan()
+    test_warm_snapshot_follows_plan()
+    print("All data requirements tests passed")
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import time
+from ..implementations.data_providers import yahoo_provider
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ..models.data_section import DataSection
+from ..utils.dead_ticker_cache import DAY, DeadTickerCache, is_dead_error, is_empty_quote
+from ..utils.disk_cache import DiskCache
+from ..utils.price_store import PriceStore
+
+
+def test_backoff_doubles_and_caps():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = DeadTickerCache(os.path.join(cache_dir, 'dead.json'), base_ttl=DAY, max_ttl=3 * DAY)
+        expected = [1, 2, 3, 3]  # days: 1, 2, then capped at max_ttl
+        for days in expected:
+            before = time.time()
+            cache.record_dead('gone', 'possibly delisted')
+            retry_at = cache.dead_tickers()['GONE']['retry_at']
+            assert abs(retry_at - before - days * DAY) < 5
+
+        assert cache.is_dead('GONE')
+        assert cache.dead_tickers()['GONE']['failures'] == 4
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_persists_across_instances_and_expires():
+    cache_dir = tempfile.mkdtemp()
+    path = os.path.join(cache_dir, 'dead.json')
+    try:
+        cache = DeadTickerCache(path)
+        cache.record_dead('GONE', 'No data found for this date range, symbol may be delisted')
+        cache.flush()
+
+        assert DeadTickerCache(path).is_dead('gone')
+        assert not DeadTickerCache(path).is_dead('AAPL')
+
+        # Back-off window over - eligible for a retry
+        short = DeadTickerCache(os.path.join(cache_dir, 'short.json'), base_ttl=-1)
+        short.record_dead('GONE', 'quote not found')
+        assert not short.is_dead('GONE')
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_record_alive_forgets_symbol():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = DeadTickerCache(os.path.join(cache_dir, 'dead.json'))
+        cache.record_dead('BACK', 'possibly delisted')
+        cache.record_alive('back')
+        assert not cache.is_dead('BACK')
+        assert cache.get_stats()['tracked'] == 0
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_empty_quote_needs_a_repeat():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = DeadTickerCache(os.path.join(cache_dir, 'dead.json'), base_ttl=DAY)
+        # One stub quote may be a failed crumb call - keep looking the symbol up
+        cache.record_dead('AAPL', 'empty quote', confirmations=2)
+        assert not cache.is_dead('AAPL')
+        assert cache.dead_tickers() == {}
+        cache.record_alive('AAPL')
+
+        cache.record_dead('GONE', 'empty quote', confirmations=2)
+        before = time.time()
+        cache.record_dead('GONE', 'empty quote', confirmations=2)
+        assert cache.is_dead('GONE')
+        assert abs(cache.dead_tickers()['GONE']['retry_at'] - before - DAY) < 5
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+class FlakyTicker:
+    """yf.Ticker whose first quote call fails the way yfinance does - with the empty stub"""
+
+    def __init__(self):
+        self.quote_calls = 0
+
+    @property
+    def info(self):
+        self.quote_calls += 1
+        if self.quote_calls == 1:
+            return {'trailingPegRatio': None}
+        return {'symbol': 'AAPL', 'quoteType': 'EQUITY', 'currentPrice': 200.0}
+
+
+def test_empty_quote_is_asked_again_not_cached():
+    cache_dir = tempfile.mkdtemp()
+    original = yahoo_provider.dead_tickers
+    yahoo_provider.dead_tickers = DeadTickerCache(os.path.join(cache_dir, 'dead.json'))
+    try:
+        cache = DiskCache(cache_dir=os.path.join(cache_dir, 'yahoo'))
+        prices = PriceStore(store_dir='', enabled=False)
+        fake = FlakyTicker()
+        provider = YahooFinanceProvider()
+
+        # Batch prefetch and the analysis run each take their own snapshot
+        for _ in range(2):
+            snapshot = TickerSnapshot('AAPL', fake, cache=cache, prices=prices)
+            metrics = provider.get_financial_metrics('AAPL', snapshot, sections=[DataSection.QUOTE])
+
+        assert fake.quote_calls == 2
+        assert metrics.get('current_price') == 200.0
+        assert not yahoo_provider.dead_tickers.is_dead('AAPL')
+        assert yahoo_provider.dead_tickers.get_stats()['tracked'] == 0
+    finally:
+        yahoo_provider.dead_tickers = original
+        shutil.rmtree(cache_dir)
+
+
+def test_prune_universe_drops_dead_rows():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        universe = os.path.join(cache_dir, 'nasdaq.csv')
+        with open(universe, 'w') as f:
+            f.write("Symbol,Security Name\nAAPL,Apple Inc.\nGONE,Gone Corp\nMSFT,Microsoft\n")
+        cache = DeadTickerCache(os.path.join(cache_dir, 'dead.json'))
+        cache.record_dead('GONE', 'possibly delisted')
+
+        pruned = os.path.join(cache_dir, 'nasdaq_pruned.csv')
+        assert cache.prune_universe(universe, pruned) == 1
+        with open(pruned) as f:
+            assert f.read().splitlines() == ['Symbol,Security Name', 'AAPL,Apple Inc.', 'MSFT,Microsoft']
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_error_classification():
+    assert is_dead_error('$GONE: possibly delisted; no price data found (period=1y)')
+    assert is_dead_error('404 Client Error: Quote not found for symbol: GONE')
+    assert not is_dead_error('429 Too Many Requests')
+    assert is_empty_quote({'trailingPegRatio': None})
+    assert not is_empty_quote({'quoteType': 'EQUITY', 'symbol': 'AAPL'})
+
+
+if __name__ == "__main__":
+    test_backoff_doubles_and_caps()
+    test_persists_across_instances_and_expires()
+    test_record_alive_forgets_symbol()
+    test_empty_quote_needs_a_repeat()
+    test_empty_quote_is_asked_again_not_cached()
+    test_prune_universe_drops_dead_rows()
+    test_error_classification()
+    print("All DeadTickerCache tests passed")
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+from ..utils.disk_cache import DiskCache, MISS, data_class_for
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+
+
+class CountingTicker:
+    """Stands in for yf.Ticker and counts network pulls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def info(self):
+        self.calls += 1
+        return {'symbol': 'TEST', 'currentPrice': 10.0}
+
+    def history(self, **kwargs):
+        self.calls += 1
+        return [1, 2, 3]
+
+
+def test_round_trip_and_stats():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp)
+        assert cache.get('AAPL', 'cashflow') is MISS
+
+        cache.set('AAPL', 'cashflow', {'Free Cash Flow': [1, 2]})
+        assert cache.get('AAPL', 'cashflow') == {'Free Cash Flow': [1, 2]}
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['by_data_class']['statements'] == {'hits': 1, 'misses': 1}
+
+
+def test_ttl_per_data_class():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp, ttls={'quote': 0}, calendar=False)
+        cache.set('AAPL', 'info', {'currentPrice': 1})
+        cache.set('AAPL', 'income_stmt', {'Total Revenue': [1]})
+        time.sleep(0.01)
+
+        assert cache.get('AAPL', 'info') is MISS  # quote expired
+        assert cache.get('AAPL', 'income_stmt') is not MISS  # statements still fresh
+        assert data_class_for('history:period=1y') == 'prices'
+
+
+def test_invalidate_one_ticker():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp)
+        cache.set('AAPL', 'info', {'a': 1})
+        cache.set('AAPL', 'news', [])
+        cache.set('MSFT', 'info', {'b': 2})
+
+        assert cache.invalidate('AAPL') == 2
+        assert cache.get('AAPL', 'info') is MISS
+        assert cache.get('MSFT', 'info') == {'b': 2}
+
+
+def test_corrupt_entry_is_a_miss():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp)
+        cache.set('AAPL', 'info', {'a': 1})
+        with open(cache._path('AAPL', 'info'), 'wb') as f:
+            f.write(b'not a pickle')
+
+        assert cache.get('AAPL', 'info') is MISS
+
+
+def test_snapshot_reads_through_disk_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp)
+
+        first = CountingTicker()
+        TickerSnapshot('TEST', ticker_obj=first, cache=cache).info
+        assert first.calls == 1
+
+        # A new run (fresh snapshot) is served from disk
+        second = CountingTicker()
+        assert TickerSnapshot('TEST', ticker_obj=second, cache=cache).info['symbol'] == 'TEST'
+        assert second.calls == 0
+
+
+def test_dated_history_not_persisted():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(cache_dir=tmp)
+        TickerSnapshot('TEST', ticker_obj=CountingTicker(), cache=cache).history(start='2024-01-01', end='2024-02-01')
+
+        assert not os.path.exists(os.path.join(tmp, 'TEST'))
+
+
+if __name__ == "__main__":
+    test_round_trip_and_stats()
+    test_ttl_per_data_class()
+    test_invalidate_one_ticker()
+    test_corrupt_entry_is_a_miss()
+    test_snapshot_reads_through_disk_cache()
+    test_dated_history_not_persisted()
+    print("All DiskCache tests passed")
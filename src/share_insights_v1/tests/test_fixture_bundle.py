@@ -0,0 +1,93 @@
+import shutil
+import tempfile
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+from ..utils import fixture_bundle
+from ..utils.fixture_bundle import FixtureBundle, FixtureMissingError, RecordedError, use_bundle
+from .test_ticker_snapshot import FakeTicker, NO_CACHE, NO_PRICES
+
+
+class OfflineTicker:
+    """yf.Ticker stand-in that fails the test if replay goes to the network"""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"replay fetched {name} from the network")
+
+    def history(self, **kwargs):
+        raise AssertionError("replay fetched history from the network")
+
+
+def test_record_then_replay():
+    bundle_dir = tempfile.mkdtemp()
+    try:
+        calls = []
+        recorder = FixtureBundle(bundle_dir, mode='record')
+        assert recorder.call('sec', 'https://example/1', lambda: calls.append(1) or {'cik': 1}) == {'cik': 1}
+
+        replayer = FixtureBundle(bundle_dir, mode='replay')
+        assert replayer.call('sec', 'https://example/1', lambda: calls.append(1)) == {'cik': 1}
+        assert calls == [1]
+        assert replayer.get_stats() == {'sec.replayed': 1}
+    finally:
+        shutil.rmtree(bundle_dir)
+
+
+def test_missing_fixture_raises_instead_of_going_online():
+    bundle_dir = tempfile.mkdtemp()
+    try:
+        replayer = FixtureBundle(bundle_dir, mode='replay')
+        try:
+            replayer.call('llm', ('prompt', ()), lambda: 'live answer')
+            assert False, "expected FixtureMissingError"
+        except FixtureMissingError:
+            pass
+    finally:
+        shutil.rmtree(bundle_dir)
+
+
+def test_recorded_error_is_replayed():
+    bundle_dir = tempfile.mkdtemp()
+
+    def fail():
+        raise ConnectionError("503 from upstream")
+
+    try:
+        try:
+            FixtureBundle(bundle_dir, mode='record').call('article', 'https://news/1', fail)
+            assert False, "expected the original error while recording"
+        except ConnectionError:
+            pass
+
+        try:
+            FixtureBundle(bundle_dir, mode='replay').call('article', 'https://news/1', fail)
+            assert False, "expected RecordedError"
+        except RecordedError as e:
+            assert '503' in str(e)
+    finally:
+        shutil.rmtree(bundle_dir)
+
+
+def test_snapshot_replays_without_network():
+    bundle_dir = tempfile.mkdtemp()
+    try:
+        fake = FakeTicker()
+        use_bundle(FixtureBundle(bundle_dir, mode='record'))
+        recorded = TickerSnapshot('TEST', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES)
+        assert recorded.info['symbol'] == 'TEST'
+        assert recorded.history(period='1y') == [1, 2, 3]
+
+        use_bundle(FixtureBundle(bundle_dir, mode='replay'))
+        replayed = TickerSnapshot('TEST', ticker_obj=OfflineTicker(), cache=NO_CACHE, prices=NO_PRICES)
+        assert replayed.info == {'symbol': 'TEST', 'beta': 1.1}
+        assert replayed.history(period='1y') == [1, 2, 3]
+        assert fixture_bundle.active_bundle().get_stats() == {'yahoo.replayed': 2}
+    finally:
+        use_bundle(None)
+        shutil.rmtree(bundle_dir)
+
+
+if __name__ == "__main__":
+    test_record_then_replay()
+    test_missing_fixture_raises_instead_of_going_online()
+    test_recorded_error_is_replayed()
+    test_snapshot_replays_without_network()
+    print("All FixtureBundle tests passed")
@@ -0,0 +1,98 @@
+import os
+import pickle
+import tempfile
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from ..utils import disk_cache as disk_cache_module
+from ..utils.disk_cache import DiskCache, MISS
+from ..utils.market_calendar import calendar_fresh, in_session, last_settle, region_for
+
+NEW_YORK = ZoneInfo('America/New_York')
+SYDNEY = ZoneInfo('Australia/Sydney')
+DAY = 24 * 60 * 60
+
+
+def ts(year, month, day, hour, minute=0, tz=NEW_YORK):
+    return datetime(year, month, day, hour, minute, tzinfo=tz).timestamp()
+
+
+def test_region_and_sessions():
+    assert region_for('BHP.AX') == 'au' and region_for('AIR.NZ') == 'nz' and region_for('AAPL') == 'us'
+    assert region_for('BHP.AX', 'us_market') == 'us'
+
+    friday = datetime(2025, 6, 13, 15, 0, tzinfo=NEW_YORK)
+    assert in_session('us', friday)
+    assert not in_session('us', datetime(2025, 6, 13, 16, 45, tzinfo=NEW_YORK))  # settled
+    assert not in_session('us', datetime(2025, 6, 14, 12, 0, tzinfo=NEW_YORK))  # Saturday
+    # Monday before the open - the last settled close was Friday's
+    monday = datetime(2025, 6, 16, 8, 0, tzinfo=NEW_YORK)
+    assert last_settle('us', monday) == datetime(2025, 6, 13, 16, 30, tzinfo=NEW_YORK)
+
+
+def test_quotes_and_prices_last_until_the_open():
+    friday_evening = ts(2025, 6, 13, 18)
+    # Weekend and Monday pre-market re-runs reuse Friday evening's fetch
+    assert calendar_fresh('quote', 'AAPL', friday_evening, now=ts(2025, 6, 14, 12))
+    assert calendar_fresh('prices', 'AAPL', friday_evening, now=ts(2025, 6, 16, 9))
+    assert not calendar_fresh('prices', 'AAPL', friday_evening, now=ts(2025, 6, 16, 10))
+    # Fetched mid-session: the close changed it
+    assert not calendar_fresh('prices', 'AAPL', ts(2025, 6, 13, 14), now=ts(2025, 6, 13, 20))
+
+    # Each listing follows its own exchange: 8pm New York is the ASX morning session
+    asx_fetch = ts(2025, 6, 16, 17, tz=SYDNEY)
+    assert not calendar_fresh('prices', 'BHP.AX', asx_fetch, now=ts(2025, 6, 17, 11, tz=SYDNEY))
+    assert calendar_fresh('prices', 'BHP.AX', asx_fetch, now=ts(2025, 6, 17, 8, tz=SYDNEY))
+    assert not calendar_fresh('news', 'AAPL', friday_evening, now=ts(2025, 6, 14, 12))
+
+
+def test_statements_last_until_the_next_release():
+    now = ts(2025, 6, 14, 12)
+    upcoming = {'earningsTimestamp': now + 40 * DAY}
+    just_reported = {'earningsTimestamp': now - 5 * DAY}
+
+    assert calendar_fresh('statements', 'AAPL', now - 20 * DAY, upcoming, now=now)
+    # Older than the shortest gap back from the next release - may predate the last one
+    assert not calendar_fresh('statements', 'AAPL', now - 60 * DAY, upcoming, now=now)
+    # Fetched before (or right after) the release vs. once Yahoo had the new numbers
+    assert not calendar_fresh('statements', 'AAPL', now - 6 * DAY, just_reported, now=now)
+    assert calendar_fresh('statements', 'AAPL', now - 1 * DAY, just_reported, now=now)
+    assert not calendar_fresh('statements', 'AAPL', now - 1 * DAY, None, now=now)
+
+
+def test_disk_cache_consults_the_stored_quote():
+    seen = []
+    original = disk_cache_module.calendar_fresh
+    disk_cache_module.calendar_fresh = lambda *args: seen.append(args) or True
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DiskCache(cache_dir=tmp)
+            quote = {'market': 'us_market', 'earningsTimestamp': 1750000000}
+            week_ago = time.time() - 7 * DAY
+            for resource, value in (('info', quote), ('cashflow', {'Free Cash Flow': [1]}), ('news', [])):
+                _store(cache, 'AAPL', resource, value, week_ago)
+
+            assert cache.get('AAPL', 'cashflow') == {'Free Cash Flow': [1]}
+            assert cache.get('AAPL', 'news') is MISS  # no calendar rule for news
+            assert [args[0] for args in seen] == ['statements']
+            assert seen[0][3] == quote
+            assert cache.get_stats()['calendar_hits'] == 1
+
+            assert DiskCache(cache_dir=tmp, calendar=False).get('AAPL', 'cashflow') is MISS
+    finally:
+        disk_cache_module.calendar_fresh = original
+
+
+def _store(cache, ticker, resource, value, fetched_at):
+    """Write an entry as if it had been fetched at `fetched_at`"""
+    os.makedirs(cache._ticker_dir(ticker), exist_ok=True)
+    with open(cache._path(ticker, resource), 'wb') as f:
+        pickle.dump({'fetched_at': fetched_at, 'value': value}, f)
+
+
+if __name__ == "__main__":
+    test_region_and_sessions()
+    test_quotes_and_prices_last_until_the_open()
+    test_statements_last_until_the_next_release()
+    test_disk_cache_consults_the_stored_quote()
+    print("All market calendar tests passed")
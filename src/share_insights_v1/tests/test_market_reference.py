@@ -0,0 +1,54 @@
+import threading
+from datetime import datetime
+from ..implementations.data_providers import market_reference as market_reference_module
+from ..implementations.data_providers.market_reference import MarketReferenceData, MARKET_TZ, next_settle
+
+
+class FakeSnapshot:
+    """Stands in for TickerSnapshot and counts how often ^TNX is pulled"""
+    calls = 0
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        FakeSnapshot.calls += 1
+        return {'previousClose': 4.25}
+
+
+def test_next_settle_skips_to_following_close():
+    friday_morning = datetime(2025, 6, 13, 10, 0, tzinfo=MARKET_TZ)
+    friday_evening = datetime(2025, 6, 13, 18, 0, tzinfo=MARKET_TZ)
+
+    assert next_settle(friday_morning) == datetime(2025, 6, 13, 16, 30, tzinfo=MARKET_TZ)
+    assert next_settle(friday_evening) == datetime(2025, 6, 16, 16, 30, tzinfo=MARKET_TZ)
+
+
+def test_risk_free_rate_fetched_once_per_session():
+    original = market_reference_module.TickerSnapshot
+    market_reference_module.TickerSnapshot = FakeSnapshot
+    FakeSnapshot.calls = 0
+    try:
+        reference = MarketReferenceData()
+        threads = [threading.Thread(target=reference.risk_free_rate) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert reference.risk_free_rate() == 0.0425
+        assert FakeSnapshot.calls == 1
+        assert reference.get_stats()['fetches'] == 1
+
+        reference.invalidate()
+        reference.risk_free_rate()
+        assert FakeSnapshot.calls == 2
+    finally:
+        market_reference_module.TickerSnapshot = original
+
+
+if __name__ == "__main__":
+    test_next_settle_skips_to_following_close()
+    test_risk_free_rate_fetched_once_per_session()
+    print("All MarketReferenceData tests passed")
@@ -0,0 +1,89 @@
+import json
+from ..implementations.analyzers.news_sentiment_analyzer import NewsSentimentAnalyzer
+
+
+class FakeLLM:
+    """Records prompts and returns a canned response"""
+
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def generate_response(self, prompt):
+        self.prompts.append(prompt)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+NEWS = [
+    {'title': f'Story {i}', 'summary': f'Company reported results {i}', 'date': '2025-06-13',
+     'source': 'Wire', 'url': f'https://news.example.com/{i}'}
+    for i in range(1, 4)
+]
+
+
+def block(index, score):
+    return {'index': index, 'lead_fact': f'Event {index}', 'quantitative_evidence': '$50M',
+            'business_mechanism': 'Adds revenue', 'verbatim_quote': '', 'sentiment_score': score, 'confidence': 0.9}
+
+
+def test_one_call_for_all_articles():
+    response = "```json\n" + json.dumps({'articles': [block(3, -0.4), block(1, 0.6), block(2, 0.2)]}) + "\n```"
+    llm = FakeLLM(response)
+    analyzer = NewsSentimentAnalyzer(data_provider=None, llm_manager=llm, batch_sentiment=True)
+
+    report = analyzer._analyze_news_sentiment('TEST', NEWS)
+
+    assert len(llm.prompts) == 1
+    assert all(f'[ARTICLE {i}]' in llm.prompts[0] for i in range(1, 4))
+    # Results are matched by index, not by position in the response
+    assert [item.sentiment_score for item in report.recent_news] == [0.6, 0.2, -0.4]
+    assert report.recent_news[2].enhanced_facts['lead_fact'] == 'Event 3'
+
+
+def test_bad_entries_fall_back_per_article():
+    # Article 2's score is unreadable and the response is cut off before article 3
+    response = json.dumps({'articles': [block(1, 0.7), dict(block(2, 0), sentiment_score='n/a')]})[:-2] + ', {"index": 3, "lead'
+    analyzer = NewsSentimentAnalyzer(data_provider=None, llm_manager=FakeLLM(response), batch_sentiment=True)
+
+    results = analyzer._analyze_batch_sentiment(NEWS, 'TEST')
+
+    assert results[0]['score'] == 0.7 and results[0]['enhanced_facts']['lead_fact'] == 'Event 1'
+    for news, result in zip(NEWS[1:], results[1:]):
+        assert result == analyzer._get_fallback_sentiment(news['title'], news['summary'], 'TEST')
+
+    # A failed call sends every article to the fallback
+    failing = NewsSentimentAnalyzer(data_provider=None, llm_manager=FakeLLM(RuntimeError('timeout')), batch_sentiment=True)
+    assert len(failing._analyze_batch_sentiment(NEWS, 'TEST')) == 3
+
+
+def test_long_feeds_are_split_into_calls():
+    news = [dict(NEWS[0], title=f'Story {i}') for i in range(12)]
+    llm = FakeLLM(json.dumps({'articles': [block(i, 0.1) for i in range(1, 6)]}))
+    analyzer = NewsSentimentAnalyzer(data_provider=None, llm_manager=llm, batch_sentiment=True)
+
+    results = analyzer._analyze_batch_sentiment(news, 'TEST')
+
+    # 5 + 5 + 2 articles; the last call's extra blocks don't match any article
+    assert len(llm.prompts) == 3
+    assert '[ARTICLE 6]' not in llm.prompts[0] and 'Story 10' in llm.prompts[2]
+    assert [result['score'] for result in results] == [0.1] * 12
+
+
+def test_per_article_mode_unchanged():
+    llm = FakeLLM(json.dumps(block(1, 0.5)))
+    analyzer = NewsSentimentAnalyzer(data_provider=None, llm_manager=llm, batch_sentiment=False)
+
+    report = analyzer._analyze_news_sentiment('TEST', NEWS)
+
+    assert len(llm.prompts) == 3
+    assert [item.sentiment_score for item in report.recent_news] == [0.5, 0.5, 0.5]
+
+
+if __name__ == "__main__":
+    test_one_call_for_all_articles()
+    test_bad_entries_fall_back_per_article()
+    test_long_feeds_are_split_into_calls()
+    test_per_article_mode_unchanged()
+    print("All news batch sentiment tests passed")
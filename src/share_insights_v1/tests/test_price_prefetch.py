@@ -0,0 +1,55 @@
+import tempfile
+import numpy as np
+import pandas as pd
+from ..implementations.data_providers import yahoo_provider
+from ..implementations.data_providers.yahoo_provider import YahooFinanceProvider
+from ..utils.price_store import price_store
+
+
+def fake_download(tickers, **kwargs):
+    """Shape of yf.download(group_by='ticker'): one column block per ticker,
+    rows are the union of trading days (NaN where a ticker has no bar)"""
+    fake_download.calls += 1
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=250)
+    frames = {}
+    for i, ticker in enumerate(t for t in tickers if t != 'BAD'):
+        close = np.linspace(10, 20, len(dates)) * (i + 1)
+        frames[ticker] = pd.DataFrame({'Open': close, 'High': close, 'Low': close,
+                                       'Close': close, 'Volume': 1000}, index=dates)
+    frames['AAA'].iloc[:5] = np.nan  # listed a week later than the rest
+    return pd.concat(frames, axis=1)
+
+
+def test_prefetch_one_download_per_chunk():
+    original_download, original_dir = yahoo_provider.yf.download, price_store.store_dir
+    tmp = tempfile.TemporaryDirectory()
+    yahoo_provider.yf.download, price_store.store_dir = fake_download, tmp.name
+    fake_download.calls = 0
+    try:
+        provider = YahooFinanceProvider()
+        assert provider.prefetch_price_history(['AAA', 'BBB', 'BAD']) == 2
+        assert fake_download.calls == 1
+
+        # Analysis runs read their slice without any per-ticker request
+        price_data = provider.get_price_data('AAA', snapshot=provider.create_snapshot('AAA'))
+        assert len(price_data['price_history']) == 245
+        assert price_data['current_price'] == 20.0
+        assert 0 < len(price_data['chart_data']['prices']) <= 23
+
+        bbb = provider.get_price_data('BBB', snapshot=provider.create_snapshot('BBB'))
+        assert bbb['current_price'] == 40.0
+
+        # Slices are handed out once - later snapshots go through the normal path
+        assert not provider.create_snapshot('AAA').is_loaded('history:period=1y')
+
+        # Next chunk run: prices already stored and fresh, nothing downloaded
+        assert provider.prefetch_price_history(['AAA', 'BBB']) == 2
+        assert fake_download.calls == 1
+    finally:
+        yahoo_provider.yf.download, price_store.store_dir = original_download, original_dir
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    test_prefetch_one_download_per_chunk()
+    print("All price prefetch tests passed")
@@ -0,0 +1,90 @@
+import tempfile
+import numpy as np
+import pandas as pd
+from ..utils.price_store import PriceStore, period_days
+
+
+def make_bars(periods=300, bump=0.0):
+    """Daily bars ending today, tz-aware like yf.Ticker.history()"""
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=periods, tz='America/New_York')
+    close = np.arange(periods, dtype=float) + 100 + bump
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': 1000.0, 'Dividends': 0.0, 'Stock Splits': 0.0}, index=dates)
+
+
+class Fetcher:
+    """Stands in for yf.Ticker.history and records what the store asks for"""
+
+    def __init__(self, full, recent=None):
+        self.full, self.recent, self.calls = full, recent, []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.full if 'period' in kwargs else self.recent
+
+
+def test_full_load_then_zero_copy_reads():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp)
+        fetch = Fetcher(make_bars())
+
+        first = store.history('AAA', '1y', fetch)
+        second = store.history('AAA', '1y', fetch)
+
+        assert len(fetch.calls) == 1
+        assert list(first.columns) == list(PriceStore.COLUMNS)
+        assert first.index.tz is None
+        assert first['Close'].iloc[-1] == second['Close'].iloc[-1] == 399.0
+
+        base = np.asarray(second['Close'])
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+
+
+def test_stale_store_fetches_only_new_bars():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp, ttl=0, calendar=False)
+        stored = make_bars().iloc[:-2]
+        fetch = Fetcher(stored, recent=make_bars().iloc[-4:])
+
+        store.history('AAA', '1y', fetch)
+        frame = store.history('AAA', '1y', fetch)
+
+        assert 'start' in fetch.calls[1] and len(fetch.calls) == 2
+        assert frame['Close'].iloc[-1] == 399.0
+        assert store.get_stats()['bars_appended'] == 2
+
+
+def test_readjusted_history_triggers_full_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp, ttl=0, calendar=False)
+        fetch = Fetcher(make_bars(), recent=make_bars(bump=-5.0).iloc[-2:])
+
+        store.history('AAA', '1y', fetch)
+        store.history('AAA', '1y', fetch)
+
+        # incremental overlap mismatched (dividend re-adjustment) -> full reload
+        assert [list(c) for c in fetch.calls] == [['period'], ['start'], ['period']]
+
+
+def test_longer_period_than_stored_reloads():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp)
+        fetch = Fetcher(make_bars(periods=600))
+
+        store.history('AAA', '1y', fetch)
+        two_years = store.history('AAA', '2y', fetch)
+        one_year = store.history('AAA', '1y', fetch)
+
+        assert [c['period'] for c in fetch.calls] == ['1y', '2y']
+        assert len(two_years) > len(one_year)
+        assert period_days('6mo') == 186 and period_days('max') is None
+
+
+if __name__ == "__main__":
+    test_full_load_then_zero_copy_reads()
+    test_stale_store_fetches_only_new_bars()
+    test_readjusted_history_triggers_full_reload()
+    test_longer_period_than_stored_reloads()
+    print("All PriceStore tests passed")
@@ -0,0 +1,51 @@
+import threading
+import time
+from ..utils.rate_limiter import AdaptiveRateLimiter
+
+
+def make_limiter(**overrides):
+    settings = dict(name='test', rate=20.0, min_rate=1.0, max_rate=50.0, burst=1.0, cooldown=0.2)
+    settings.update(overrides)
+    return AdaptiveRateLimiter(**settings)
+
+
+def test_requests_paced_to_rate():
+    limiter = make_limiter()
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 1 from the burst, then 10 more at 20/s
+    assert time.monotonic() - start >= 0.45
+    metrics = limiter.get_metrics()
+    assert metrics['acquired'] == 11 and metrics['waiting'] == 0 and metrics['max_wait'] > 0
+
+
+def test_aimd_adjusts_rate():
+    limiter = make_limiter()
+    for _ in range(20):
+        limiter.on_success()
+    ramped = limiter.rate
+    assert 20.0 < ramped <= 50.0
+
+    assert limiter.on_rate_limited() is True
+    assert limiter.rate == ramped * 0.5
+    # Concurrent 429s from the same burst only back off once
+    assert limiter.on_rate_limited() is False
+    assert limiter.get_metrics()['rate_limited'] == 2
+
+
+def test_rate_limit_holds_callers_for_cooldown():
+    limiter = make_limiter()
+    limiter.on_rate_limited()
+    assert limiter.acquire() >= 0.19
+
+
+if __name__ == "__main__":
+    test_requests_paced_to_rate()
+    test_aimd_adjusts_rate()
+    test_rate_limit_holds_callers_for_cooldown()
+    print("All AdaptiveRateLimiter tests passed")
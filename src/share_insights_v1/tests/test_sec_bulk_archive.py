@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import zipfile
+from ..implementations.data_providers import sec_edgar_provider
+from ..implementations.data_providers.sec_bulk_archive import SECBulkArchive
+from ..implementations.data_providers.sec_edgar_provider import SECEdgarProvider
+from ..implementations.data_providers.sec_facts_store import FactsStore
+from ..implementations.data_providers.sec_submissions import submissions_cache
+
+CIK = 9990001
+
+FACTS = {
+    'cik': CIK, 'entityName': 'Synthetic Corp',
+    'facts': {'us-gaap': {'Revenues': {'units': {'USD': [
+        {'end': '2024-12-31', 'val': 1000.0, 'form': '10-K', 'filed': '2025-02-15', 'fy': 2024, 'fp': 'FY'},
+    ]}}}},
+}
+
+SUBMISSIONS = {
+    'cik': str(CIK), 'tickers': ['SYN'],
+    'filings': {'recent': {
+        'form': ['10-Q', '10-K'], 'filingDate': ['2025-05-01', '2025-02-15'],
+        'accessionNumber': ['0009990001-25-000002', '0009990001-25-000001'],
+        'primaryDocument': ['q1.htm', 'annual.htm'],
+    }},
+}
+
+
+def _write_archives(directory):
+    with zipfile.ZipFile(os.path.join(directory, 'companyfacts.zip'), 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f'CIK{CIK:010d}.json', json.dumps(FACTS))
+        archive.writestr('CIK0000000042.json', json.dumps({'cik': 42, 'facts': {}}))
+    with zipfile.ZipFile(os.path.join(directory, 'submissions.zip'), 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f'CIK{CIK:010d}.json', json.dumps(SUBMISSIONS))
+        archive.writestr(f'CIK{CIK:010d}-submissions-001.json', json.dumps({}))
+
+
+def test_member_reads():
+    with tempfile.TemporaryDirectory() as tmp:
+        assert SECBulkArchive.from_dir(tmp) is None
+        _write_archives(tmp)
+        archive = SECBulkArchive.from_dir(tmp)
+
+        assert archive.company_facts(CIK)['entityName'] == 'Synthetic Corp'
+        assert archive.submissions(CIK)['tickers'] == ['SYN']
+        assert archive.company_facts(12345) is None
+        assert sorted(archive.ciks()) == [42, CIK]
+        assert archive.get_stats() == {'reads': 2, 'misses': 1}
+        archive.close()
+
+
+def test_provider_serves_from_archive_without_http():
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_archives(tmp)
+        provider = SECEdgarProvider(bulk_archive=SECBulkArchive.from_dir(tmp))
+
+        def no_http(url):
+            raise AssertionError(f"unexpected HTTP request: {url}")
+        provider._get = no_http
+        provider._get_cik = lambda ticker: CIK
+
+        try:
+            assert provider.get_latest_10k('SYN')['primary_document'] == 'annual.htm'
+            assert provider.get_filing_facts('SYN')['entityName'] == 'Synthetic Corp'
+        finally:
+            submissions_cache.invalidate(CIK)
+            provider.bulk_archive.close()
+
+
+def test_provider_uses_http_for_a_missing_archive():
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_archives(tmp)
+        os.remove(os.path.join(tmp, 'submissions.zip'))
+        provider = SECEdgarProvider(bulk_archive=SECBulkArchive.from_dir(tmp))
+        requested = []
+
+        class Response:
+            status_code = 200
+            headers = {}
+
+            def json(self):
+                return SUBMISSIONS
+
+        def http(url, headers=None):
+            requested.append(url)
+            return Response()
+        provider._get = http
+        provider._get_cik = lambda ticker: CIK
+
+        try:
+            # Filings come from the API, facts still from companyfacts.zip
+            assert provider.get_latest_10k('SYN')['primary_document'] == 'annual.htm'
+            assert provider.get_filing_facts('SYN')['entityName'] == 'Synthetic Corp'
+            assert [url.rsplit('/', 1)[-1] for url in requested] == [f'CIK{CIK:010d}.json']
+            assert '/submissions/' in requested[0]
+        finally:
+            submissions_cache.invalidate(CIK)
+            provider.bulk_archive.close()
+
+
+def test_load_facts_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_archives(tmp)
+        archive = SECBulkArchive.from_dir(tmp)
+        store = FactsStore(os.path.join(tmp, 'facts'))
+
+        assert archive.load_facts_store(store, [CIK]) == 1
+        # Served from the store - the fetch callback is never needed
+        assert store.get(CIK, lambda: None).latest('Revenues', form='10-K') == 1000.0
+        assert FactsStore(os.path.join(tmp, 'facts')).get(CIK, lambda: None).entity_name == 'Synthetic Corp'
+        # Stamped with the latest 10-K/10-Q, which is what the provider asks for
+        assert store.get(CIK, lambda: None, version='0009990001-25-000002') is not None
+        archive.close()
+
+        # Without submissions.zip there is no version to stamp - nothing to preload
+        os.remove(os.path.join(tmp, 'submissions.zip'))
+        assert SECBulkArchive.from_dir(tmp).load_facts_store(store, [CIK]) == 0
+
+
+def test_preloaded_facts_used_by_provider():
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_archives(tmp)
+        archive = SECBulkArchive.from_dir(tmp)
+        original = sec_edgar_provider.facts_store
+        sec_edgar_provider.facts_store = FactsStore(os.path.join(tmp, 'facts'))
+        try:
+            archive.load_facts_store(sec_edgar_provider.facts_store, [CIK])
+            reads = archive.get_stats()['reads']
+            provider = SECEdgarProvider(bulk_archive=archive)
+            provider._get_cik = lambda ticker: CIK
+
+            assert provider.get_company_facts('SYN').entity_name == 'Synthetic Corp'
+            # Only the submissions member is read - the facts member isn't parsed again
+            assert archive.get_stats()['reads'] == reads + 1
+        finally:
+            sec_edgar_provider.facts_store = original
+            submissions_cache.invalidate(CIK)
+            archive.close()
+
+
+if __name__ == "__main__":
+    test_member_reads()
+    test_provider_serves_from_archive_without_http()
+    test_provider_uses_http_for_a_missing_archive()
+    test_load_facts_store()
+    test_preloaded_facts_used_by_provider()
+    print("All SEC bulk archive tests passed")
@@ -0,0 +1,70 @@
+import tempfile
+from ..implementations.data_providers.sec_business_section import (
+    BusinessSectionStore, extract_business_section, NOT_FOUND
+)
+
+BUSINESS = ' '.join(['We design, manufacture &amp; market smartphones and services.'] * 20)
+
+FILING = (
+    '<html><body><table>'
+    '<tr><td>Item 1.</td><td>Business</td><td>1</td></tr>'
+    '<tr><td>Item 1A.</td><td>Risk Factors</td><td>5</td></tr>'
+    '</table>'
+    '<p>PART I</p><h2>Item&nbsp;1. <b>Business</b></h2>'
+    f'<p>{BUSINESS}</p>'
+    '<h2>Item 1A. Risk Factors</h2>'
+    + '<p>Risk text.</p>' * 5000 +
+    '</body></html>'
+)
+
+
+def chunked(text, size=256, consumed=None):
+    for i in range(0, len(text), size):
+        if consumed is not None:
+            consumed.append(1)
+        yield text[i:i + size]
+
+
+def test_extracts_item_1_and_stops_reading():
+    consumed = []
+    section = extract_business_section(chunked(FILING, consumed=consumed))
+
+    assert section.startswith('Item 1. Business We design, manufacture & market smartphones')
+    assert section.endswith('services.')
+    assert 'Risk' not in section
+    # Stopped at Item 1A - the risk factors never streamed in
+    assert len(consumed) < len(FILING) // 256 // 10
+
+
+def test_limit_and_fallback():
+    section = extract_business_section(chunked(FILING), limit=100)
+    assert len(section) <= 100 and section.startswith('Item 1. Business')
+
+    assert extract_business_section(['<p>Our products are sold worldwide.</p>']) == 'Our products are sold worldwide.'
+    assert extract_business_section(['<p>Nothing relevant here.</p>']) == NOT_FOUND
+
+
+def test_store_extracts_each_filing_once():
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return 'Item 1. Business ...'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BusinessSectionStore(tmp)
+        assert store.get('0000320193-24-000123', extract) == 'Item 1. Business ...'
+        assert BusinessSectionStore(tmp).get('0000320193-24-000123', extract) == 'Item 1. Business ...'
+        assert len(calls) == 1
+
+        # Failed downloads aren't stored
+        assert store.get('0000320193-24-000999', lambda: None) is None
+        assert store.get('0000320193-24-000999', extract) is not None
+        assert store.get_stats() == {'hits': 0, 'extractions': 2}
+
+
+if __name__ == "__main__":
+    test_extracts_item_1_and_stops_reading()
+    test_limit_and_fallback()
+    test_store_extracts_each_filing_once()
+    print("All business section tests passed")
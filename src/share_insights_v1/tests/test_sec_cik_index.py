@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+from ..implementations.data_providers.sec_cik_index import CikIndex
+
+COMPANY_TICKERS = {
+    '0': {'cik_str': 320193, 'ticker': 'AAPL', 'title': 'Apple Inc.'},
+    '1': {'cik_str': 789019, 'ticker': 'MSFT', 'title': 'MICROSOFT CORP'},
+}
+
+
+class CountingFetch:
+    """Stands in for the company_tickers.json download"""
+
+    def __init__(self, data=COMPANY_TICKERS):
+        self.data = data
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.data
+
+
+def test_downloads_once_per_process_and_persists():
+    cache_dir = tempfile.mkdtemp()
+    path = os.path.join(cache_dir, 'cik_index.json')
+    try:
+        fetch = CountingFetch()
+        index = CikIndex(path)
+        assert index.lookup('aapl', fetch) == 320193
+        assert index.lookup('MSFT', fetch) == 789019
+        assert index.lookup('NOPE', fetch) is None
+        assert fetch.calls == 1
+
+        # A new process reads the stored copy instead of downloading
+        assert CikIndex(path).lookup('AAPL', fetch) == 320193
+        assert fetch.calls == 1
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+def test_refreshes_when_stale_and_keeps_old_copy_on_failure():
+    cache_dir = tempfile.mkdtemp()
+    path = os.path.join(cache_dir, 'cik_index.json')
+    try:
+        CikIndex(path).lookup('AAPL', CountingFetch())
+
+        expired = CikIndex(path, ttl=-1)
+        failing = CountingFetch(data=None)
+        assert expired.lookup('AAPL', failing) == 320193
+        assert failing.calls == 1
+
+        refreshed = CountingFetch(data={'0': {'cik_str': 1, 'ticker': 'NEW'}})
+        assert expired.lookup('NEW', refreshed) == 1
+        assert expired.get_stats()['tickers'] == 1
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    test_downloads_once_per_process_and_persists()
+    test_refreshes_when_stale_and_keeps_old_copy_on_failure()
+    print("All CikIndex tests passed")
@@ -0,0 +1,120 @@
+import os
+import tempfile
+from ..implementations.data_providers.sec_facts_store import CompanyFacts, FactsStore
+
+
+def _fact(end, val, form='10-K', filed=None, fy=2024, fp='FY'):
+    return {'end': end, 'val': val, 'form': form, 'filed': filed or end, 'fy': fy, 'fp': fp}
+
+
+COMPANY_FACTS = {
+    'cik': 320193,
+    'entityName': 'Apple Inc.',
+    'facts': {
+        'dei': {
+            'EntityCommonStockSharesOutstanding': {'units': {'shares': [_fact('2025-01-01', 15e9, '10-Q')]}},
+        },
+        'us-gaap': {
+            'Revenues': {'units': {'USD': [
+                _fact('2024-09-28', 391.0, filed='2024-11-01'),
+                _fact('2021-09-25', 365.8),
+                _fact('2023-09-30', 383.3),
+                _fact('2022-09-24', 394.3),
+                _fact('2024-12-28', 124.3, '10-Q', filed='2025-01-31'),
+            ]}},
+            'NetIncomeLoss': {'units': {'USD': [
+                # Same period reported twice - the first listed wins, as before
+                _fact('2024-09-28', 93.7),
+                _fact('2024-09-28', 90.0),
+                _fact('2023-09-30', 97.0),
+            ]}},
+            'EarningsPerShareBasic': {'units': {'USD/shares': [_fact('2024-09-28', 6.11)]}},
+        },
+    },
+}
+
+
+def test_latest_and_series():
+    facts = CompanyFacts.from_json(COMPANY_FACTS)
+
+    assert facts.cik == 320193 and facts.entity_name == 'Apple Inc.'
+    assert facts.concepts() == ['Revenues', 'NetIncomeLoss', 'EarningsPerShareBasic']
+    assert facts.has('Revenues') and not facts.has('EarningsPerShareBasic')
+    assert facts.latest('Revenues') == 124.3
+    assert facts.latest('Revenues', form='10-K') == 391.0
+    assert facts.latest('NetIncomeLoss', form='10-K') == 93.7
+    assert facts.latest('EarningsPerShareBasic', unit='USD/shares') == 6.11
+    assert facts.latest('GrossProfit') is None
+    assert facts.latest('Revenues', form='20-F') is None
+
+    ends, values = facts.series('Revenues', form='10-K')
+    assert [str(e) for e in ends] == ['2021-09-25', '2022-09-24', '2023-09-30', '2024-09-28']
+    assert values.tolist() == [365.8, 394.3, 383.3, 391.0]
+    assert facts.latest_filed() == '2025-01-31'
+
+
+def test_save_load_round_trip():
+    facts = CompanyFacts.from_json(COMPANY_FACTS)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'facts.npz')
+        facts.save(path)
+        loaded = CompanyFacts.load(path)
+
+    assert loaded.keys == facts.keys
+    assert loaded.entity_name == 'Apple Inc.'
+    assert loaded.latest('Revenues', form='10-K') == 391.0
+    assert loaded.series('Revenues')[1].tolist() == facts.series('Revenues')[1].tolist()
+
+
+def test_store_fetches_once_then_serves_disk():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return COMPANY_FACTS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FactsStore(tmp)
+        assert store.get(320193, fetch).latest('NetIncomeLoss') == 93.7
+        assert store.get(320193, fetch) is not None
+        assert os.path.exists(os.path.join(tmp, 'CIK0000320193.npz'))
+
+        # A new process reads the stored arrays instead of downloading
+        fresh = FactsStore(tmp)
+        assert fresh.get(320193, fetch).latest('Revenues', form='10-K') == 391.0
+        assert fresh.get_stats()['disk_hits'] == 1
+        assert len(calls) == 1
+
+        # Stale copies and failed downloads
+        assert FactsStore(tmp, ttl=-1).get(320193, lambda: None) is None
+        store.invalidate(320193)
+        assert not os.path.exists(os.path.join(tmp, 'CIK0000320193.npz'))
+
+
+def test_filing_version_overrides_ttl():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return COMPANY_FACTS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        FactsStore(tmp).get(320193, fetch, version='0000320193-24-000123')
+
+        # Same filing: current however old the stored copy is
+        expired = FactsStore(tmp, ttl=-1)
+        assert expired.get(320193, fetch, version='0000320193-24-000123').version == '0000320193-24-000123'
+        assert len(calls) == 1
+
+        # A new filing replaces it straight away, well within the TTL
+        fresh = FactsStore(tmp)
+        assert fresh.get(320193, fetch, version='0000320193-25-000007').version == '0000320193-25-000007'
+        assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    test_latest_and_series()
+    test_save_load_round_trip()
+    test_store_fetches_once_then_serves_disk()
+    test_filing_version_overrides_ttl()
+    print("All SEC facts store tests passed")
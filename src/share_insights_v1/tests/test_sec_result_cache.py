@@ -0,0 +1,68 @@
+import tempfile
+from ..implementations.analyzers import financial_health_analyzer
+from ..implementations.analyzers.financial_health_analyzer import FinancialHealthAnalyzer
+from ..implementations.data_providers.sec_facts_store import CompanyFacts
+from ..implementations.data_providers.sec_result_cache import FilingResultCache
+from .test_sec_facts_store import COMPANY_FACTS
+
+
+def test_reused_until_version_changes():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'overall_grade': 'B', 'run': len(calls)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FilingResultCache(tmp)
+        assert cache.get_or_compute('financial_health', 'AAPL', 'acc-1', compute)['run'] == 1
+        assert FilingResultCache(tmp).get_or_compute('financial_health', 'AAPL', 'acc-1', compute)['run'] == 1
+        assert cache.get_or_compute('financial_health', 'AAPL', 'acc-2', compute)['run'] == 2
+        # No version (no SEC coverage) - never cached
+        assert cache.get_or_compute('financial_health', 'AAPL', None, compute)['run'] == 3
+        assert len(calls) == 3
+
+
+def test_errors_not_cached():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FilingResultCache(tmp)
+        cache.get_or_compute('industry_sec_data', 'BRK.B', 'acc-1', lambda: {'error': 'timeout'})
+        assert cache.get_or_compute('industry_sec_data', 'BRK.B', 'acc-1', lambda: {'ok': True}) == {'ok': True}
+
+
+class FakeSECProvider:
+    def __init__(self):
+        self.version = 'acc-1'
+        self.facts_loads = 0
+
+    def get_filing_version(self, ticker):
+        return self.version
+
+    def get_company_facts(self, ticker):
+        self.facts_loads += 1
+        return CompanyFacts.from_json(COMPANY_FACTS)
+
+
+def test_financial_health_skips_sec_parsing_without_new_filing():
+    provider = FakeSECProvider()
+    analyzer = FinancialHealthAnalyzer(provider)
+    original = financial_health_analyzer.filing_results
+    with tempfile.TemporaryDirectory() as tmp:
+        financial_health_analyzer.filing_results = FilingResultCache(tmp)
+        try:
+            first = analyzer.analyze('AAPL', {})
+            assert analyzer.analyze('AAPL', {}) == first
+            assert provider.facts_loads == 1
+
+            provider.version = 'acc-2'
+            analyzer.analyze('AAPL', {})
+            assert provider.facts_loads == 2
+        finally:
+            financial_health_analyzer.filing_results = original
+
+
+if __name__ == "__main__":
+    test_reused_until_version_changes()
+    test_errors_not_cached()
+    test_financial_health_skips_sec_parsing_without_new_filing()
+    print("All filing result cache tests passed")
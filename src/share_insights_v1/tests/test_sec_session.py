@@ -0,0 +1,110 @@
+import threading
+import time
+from ..implementations.data_providers.sec_edgar_provider import SECEdgarProvider, sec_session
+from ..implementations.data_providers.sec_submissions import submissions_cache
+from ..utils.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def json(self):
+        return self.body
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.urls = []
+        self.request_headers = []
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, **kwargs):
+        with self.lock:
+            self.urls.append(url)
+            self.request_headers.append(headers)
+            status = self.statuses.pop(0) if self.statuses else 200
+            if isinstance(status, FakeResponse):
+                return status
+            return FakeResponse(status)
+
+
+def make_provider(statuses=(), **limiter_settings):
+    settings = dict(name='sec-test', rate=10.0, min_rate=1.0, max_rate=10.0, burst=1.0, cooldown=0.1)
+    settings.update(limiter_settings)
+    provider = SECEdgarProvider()
+    provider.session = FakeSession(statuses)
+    provider.limiter = AdaptiveRateLimiter(**settings)
+    return provider
+
+
+def test_providers_share_one_session():
+    assert SECEdgarProvider().session is sec_session is SECEdgarProvider().session
+    assert sec_session.headers['User-Agent'].startswith('StockAnalysisFramework')
+
+
+def test_no_wait_under_budget():
+    provider = make_provider()
+    start = time.monotonic()
+    provider._get('https://data.sec.gov/a')
+    time.sleep(0.12)
+    provider._get('https://data.sec.gov/b')
+    # Two requests spaced beyond 1/rate - neither sleeps
+    assert time.monotonic() - start < 0.2
+    assert provider.limiter.get_metrics()['max_wait'] == 0
+
+
+def test_threads_paced_globally():
+    provider = make_provider()
+    start = time.monotonic()
+    threads = [threading.Thread(target=provider._get, args=(f'https://data.sec.gov/{i}',)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 1 immediately, then 5 more at 10/s
+    assert time.monotonic() - start >= 0.45
+    assert len(provider.session.urls) == 6
+
+
+def test_rate_limited_response_retried_once():
+    provider = make_provider(statuses=[429, 200])
+    assert provider._get('https://data.sec.gov/x').status_code == 200
+    assert provider.session.urls == ['https://data.sec.gov/x'] * 2
+    assert provider.limiter.get_metrics()['rate_limited'] == 1
+
+
+def test_submissions_revalidated_with_etag():
+    cik = 9990002
+    submissions = {'filings': {'recent': {
+        'form': ['10-K'], 'filingDate': ['2025-02-01'],
+        'accessionNumber': ['0009990002-25-000001'], 'primaryDocument': ['a.htm'],
+    }}}
+    provider = make_provider(statuses=[FakeResponse(200, submissions, {'ETag': '"abc"'}), 304])
+    provider._get_cik = lambda ticker: cik
+    original_ttl = submissions_cache.ttl
+    try:
+        assert provider.get_filing_version('SYN') == '0009990002-25-000001'
+        submissions_cache.ttl = -1
+        # Expired: one conditional request, 304 keeps the same index
+        assert provider.get_filing_version('SYN') == '0009990002-25-000001'
+        assert provider.session.request_headers == [None, {'If-None-Match': '"abc"'}]
+    finally:
+        submissions_cache.ttl = original_ttl
+        submissions_cache.invalidate(cik)
+
+
+if __name__ == "__main__":
+    test_providers_share_one_session()
+    test_no_wait_under_budget()
+    test_threads_paced_globally()
+    test_rate_limited_response_retried_once()
+    test_submissions_revalidated_with_etag()
+    print("All SEC session tests passed")
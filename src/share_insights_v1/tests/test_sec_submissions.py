@@ -0,0 +1,100 @@
+import tempfile
+import threading
+import time
+from ..implementations.data_providers.sec_submissions import FilingIndex, SubmissionsCache
+
+SUBMISSIONS = {
+    'filings': {'recent': {
+        'form': ['10-Q', '8-K', 'DEF 14A', '10-K', '10-Q', 'DEF 14A', 'DEF 14A', '10-K'],
+        'filingDate': ['2025-08-01', '2025-07-15', '2025-01-10', '2024-11-01', '2024-08-02', '2024-01-12', '2023-01-13', '2023-11-03'],
+        'accessionNumber': [f'0000320193-25-{i:06d}' for i in range(8)],
+        'primaryDocument': [f'doc{i}.htm' for i in range(8)],
+    }}
+}
+
+
+def test_filing_index_latest_and_recent():
+    index = FilingIndex.from_submissions(SUBMISSIONS)
+
+    assert index.latest('10-K') == {
+        'form': '10-K', 'filing_date': '2024-11-01',
+        'accession_number': '0000320193-25-000003', 'primary_document': 'doc3.htm',
+    }
+    assert index.latest('10-Q')['filing_date'] == '2025-08-01'
+    assert [f['filing_date'] for f in index.recent('DEF 14A', 2)] == ['2025-01-10', '2024-01-12']
+    assert index.latest('S-1') is None
+
+
+def test_one_fetch_per_cik_across_threads():
+    cache = SubmissionsCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return SUBMISSIONS
+
+    threads = [threading.Thread(target=cache.get, args=(320193, fetch)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache.get(320193, fetch).latest('10-K')['primary_document'] == 'doc3.htm'
+    assert len(calls) == 1
+
+
+def test_expiry_and_failed_fetch_not_cached():
+    cache = SubmissionsCache(ttl=-1)
+    calls = []
+    fetch = lambda: calls.append(1) or SUBMISSIONS
+    cache.get(1, fetch)
+    cache.get(1, fetch)
+    assert len(calls) == 2
+
+    cache = SubmissionsCache()
+    assert cache.get(2, lambda: None) is None
+    assert cache.get(2, lambda: SUBMISSIONS) is not None
+
+
+def test_latest_accession_and_revalidation():
+    index = FilingIndex.from_submissions(SUBMISSIONS, validators={'If-None-Match': '"v1"'})
+    # Newest 10-K/10-Q - the 8-K and proxies don't count
+    assert index.latest_accession() == '0000320193-25-000000'
+    assert FilingIndex.from_submissions({}).latest_accession() is None
+
+    cache = SubmissionsCache(ttl=-1)
+    cache.get(3, lambda: index)
+    assert cache.stale(3) is index
+    # An expired entry confirmed unchanged (e.g. HTTP 304) is kept as is
+    assert cache.get(3, lambda: cache.stale(3)) is index
+    assert cache.get_stats()['revalidated'] == 1
+
+
+def test_validators_survive_a_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        index = FilingIndex.from_submissions(SUBMISSIONS, validators={'If-None-Match': '"v1"'})
+        SubmissionsCache(store_dir=tmp).get(4, lambda: index)
+
+        # Next day's batch: a new process, the entry is past its TTL
+        cache = SubmissionsCache(ttl=-1, store_dir=tmp)
+        previous = cache.stale(4)
+        assert previous.validators == {'If-None-Match': '"v1"'}
+        assert previous.latest_accession() == '0000320193-25-000000'
+        # A 304 hands the stored index back
+        assert cache.get(4, lambda: previous) is previous
+        assert cache.get_stats()['revalidated'] == 1
+        # Within the TTL the stored copy is served without a fetch
+        assert SubmissionsCache(store_dir=tmp).get(4, lambda: None).latest('10-K')['primary_document'] == 'doc3.htm'
+
+        cache.invalidate(4)
+        assert SubmissionsCache(store_dir=tmp).stale(4) is None
+
+
+if __name__ == "__main__":
+    test_filing_index_latest_and_recent()
+    test_one_fetch_per_cik_across_threads()
+    test_expiry_and_failed_fetch_not_cached()
+    test_latest_accession_and_revalidation()
+    test_validators_survive_a_restart()
+    print("All SubmissionsCache tests passed")
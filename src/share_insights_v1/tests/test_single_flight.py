@@ -0,0 +1,64 @@
+import threading
+import time
+from ..utils.single_flight import SingleFlight
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+from .test_ticker_snapshot import FakeTicker, NO_CACHE, NO_PRICES
+
+
+def run_concurrently(target, n=8):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls, results = [], []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {'symbol': 'AAPL'}
+
+    run_concurrently(lambda: results.append(flight.do(('AAPL', 'info'), fetch)))
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.get_stats() == {'executed': 1, 'shared': 7, 'in_flight': 0}
+
+
+def test_error_shared_then_retried():
+    flight = SingleFlight()
+    errors = []
+
+    def failing():
+        time.sleep(0.1)
+        raise RuntimeError('Too Many Requests')
+
+    def call():
+        try:
+            flight.do('key', failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    run_concurrently(call, n=4)
+    assert len(errors) == 4 and flight.get_stats()['executed'] == 1
+
+    # Nothing is cached once the call finishes
+    assert flight.do('key', lambda: 'ok') == 'ok'
+
+
+def test_snapshots_of_same_ticker_coalesce():
+    fake = FakeTicker()
+    run_concurrently(lambda: TickerSnapshot('HOT', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES).info)
+
+    assert fake.calls['info'] == 1
+
+
+if __name__ == "__main__":
+    test_concurrent_callers_share_one_call()
+    test_error_shared_then_retried()
+    test_snapshots_of_same_ticker_coalesce()
+    print("All SingleFlight tests passed")
@@ -0,0 +1,66 @@
+import json
+import math
+import numpy as np
+import pandas as pd
+from ..api.models import AnalysisResponse
+from ..models.statement_table import StatementTable, serialize_statements
+
+
+def make_income_statement():
+    periods = pd.to_datetime(['2024-09-30', '2023-09-30', '2022-09-30'])
+    return pd.DataFrame(
+        {periods[0]: [391.0, 180.7, 93.7], periods[1]: [383.3, 169.1, np.nan], periods[2]: [394.3, 170.8, 99.8]},
+        index=['Total Revenue', 'Gross Profit', 'Net Income'],
+    )
+
+
+def test_dict_access_matches_old_serialized_form():
+    df = make_income_statement()
+    table = StatementTable.from_frame(df)
+
+    # What get_revenue_trend's per-cell serializer used to produce
+    legacy = {str(col): {str(row): value for row, value in values.items()} for col, values in df.to_dict().items()}
+
+    assert list(table.keys()) == list(legacy.keys())
+    assert table['2024-09-30 00:00:00'] == legacy['2024-09-30 00:00:00']
+    assert '2023-09-30 00:00:00' in table
+    assert math.isnan(table['2023-09-30 00:00:00']['Net Income'])
+    assert table.get('missing', {}) == {}
+
+
+def test_row_queries():
+    table = StatementTable.from_frame(make_income_statement())
+
+    assert table.row('Total Revenue').tolist() == [391.0, 383.3, 394.3]
+    assert table.latest('Gross Profit') == 180.7
+    assert table.row('EBITDA') is None
+    assert table.latest('EBITDA', 0) == 0
+
+
+def test_empty_frame():
+    table = StatementTable.from_frame(pd.DataFrame())
+    assert table.empty
+    assert not table
+    assert table.to_dict() == {}
+
+
+def test_serialized_only_at_api_boundary():
+    table = StatementTable.from_frame(make_income_statement())
+    metrics = {'current_price': 227.5, 'revenue_data_statements': {'annual_income_stmt': table, 'annual_revenue': {}}}
+
+    serialized = serialize_statements(metrics)
+    assert json.dumps(serialized['revenue_data_statements']['annual_income_stmt']) == json.dumps(table.to_dict())
+    assert metrics['revenue_data_statements']['annual_income_stmt'] is table
+
+    response = AnalysisResponse(ticker='AAPL', company_type='mature_profitable', analyses={}, financial_metrics=metrics)
+    payload = json.loads(response.model_dump_json())
+    statement = payload['financial_metrics']['revenue_data_statements']['annual_income_stmt']
+    assert statement['2024-09-30 00:00:00']['Total Revenue'] == 391.0
+
+
+if __name__ == "__main__":
+    test_dict_access_matches_old_serialized_form()
+    test_row_queries()
+    test_empty_frame()
+    test_serialized_only_at_api_boundary()
+    print("All StatementTable tests passed")
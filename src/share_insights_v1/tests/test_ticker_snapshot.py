@@ -0,0 +1,105 @@
+import threading
+import time
+from ..implementations.data_providers.ticker_snapshot import TickerSnapshot, snapshot_for
+from ..utils.disk_cache import DiskCache
+from ..utils.price_store import PriceStore
+
+# Keep these tests off the shared on-disk cache and price store
+NO_CACHE = DiskCache(cache_dir='', enabled=False)
+NO_PRICES = PriceStore(store_dir='', enabled=False)
+
+
+class FakeTicker:
+    """Stands in for yf.Ticker and counts how often each resource is pulled"""
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def _count(self, name):
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(0.05)  # widen the race window for the concurrency test
+
+    @property
+    def info(self):
+        self._count('info')
+        return {'symbol': 'TEST', 'beta': 1.1}
+
+    @property
+    def income_stmt(self):
+        self._count('income_stmt')
+        return {'Total Revenue': [100, 90]}
+
+    def history(self, **kwargs):
+        self._count(f"history:{sorted(kwargs.items())}")
+        return [1, 2, 3]
+
+
+def test_resources_fetched_once_across_threads():
+    fake = FakeTicker()
+    snapshot = TickerSnapshot('TEST', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES)
+
+    threads = [threading.Thread(target=lambda: snapshot.info) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert fake.calls['info'] == 1
+    assert snapshot.info['symbol'] == 'TEST'
+    assert fake.calls['info'] == 1
+
+
+def test_financials_alias_shares_income_statement():
+    fake = FakeTicker()
+    snapshot = TickerSnapshot('TEST', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES)
+
+    assert snapshot.financials is snapshot.income_stmt
+    assert fake.calls['income_stmt'] == 1
+
+
+def test_history_memoized_per_arguments():
+    fake = FakeTicker()
+    snapshot = TickerSnapshot('TEST', ticker_obj=fake, cache=NO_CACHE, prices=NO_PRICES)
+
+    snapshot.history(period='1y')
+    snapshot.history(period='1y')
+    snapshot.history(period='2y')
+
+    assert len(fake.calls) == 2
+
+
+def test_failed_fetch_is_retried():
+    attempts = []
+
+    def flaky_loader():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError('Too Many Requests')
+        return {'ok': True}
+
+    snapshot = TickerSnapshot('TEST', ticker_obj=FakeTicker(), cache=NO_CACHE, prices=NO_PRICES)
+    try:
+        snapshot.get('info', flaky_loader)
+        assert False, 'first fetch should raise'
+    except RuntimeError:
+        pass
+
+    assert snapshot.get('info', flaky_loader) == {'ok': True}
+    assert len(attempts) == 2
+
+
+def test_snapshot_for_prefers_shared_snapshot():
+    shared = TickerSnapshot('TEST', ticker_obj=FakeTicker(), cache=NO_CACHE, prices=NO_PRICES)
+    assert snapshot_for('TEST', {'ticker_snapshot': shared}) is shared
+    assert snapshot_for('TEST', {}) is not shared
+
+
+if __name__ == "__main__":
+    test_resources_fetched_once_across_threads()
+    test_financials_alias_shares_income_statement()
+    test_history_memoized_per_arguments()
+    test_failed_fetch_is_retried()
+    test_snapshot_for_prefers_shared_snapshot()
+    print("All TickerSnapshot tests passed")
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .single_flight import SingleFlight
+
+# Query parameters that only track the click - the same article is linked
+# from several tickers' feeds with different values. Names match exactly;
+# only the utm_* and guce_* families match by prefix.
+TRACKING_PARAMS = frozenset(('guccounter', 'ncid', '.tsrc', 'soc_src', 'soc_trk', 'yptr', 'fr'))
+TRACKING_PREFIXES = ('utm_', 'guce_')
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """One key per article: lower-case scheme and host, no fragment, no
+    tracking parameters, no trailing slash"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k)]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+class ArticleCache:
+    """Extracted news article text on disk, keyed by canonical URL.
+
+    Market wraps and sector pieces show up in many tickers' feeds; in a batch
+    each one is downloaded and parsed once and every other ticker reads the
+    stored text. Entries expire after `ttl` seconds, and once the store grows
+    past `max_bytes` the least recently written articles are dropped.
+    Concurrent requests for the same article share one download.
+    """
+
+    def __init__(self, store_dir: str, ttl: int = 7 * 24 * 60 * 60, max_bytes: int = 200 * 1024 * 1024,
+                 enabled: bool = True):
+        self.store_dir = store_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._size: Optional[int] = None  # bytes on disk, scanned on first write
+        self.stats = {'hits': 0, 'fetches': 0, 'evicted': 0}
+
+    def cached(self, url: str) -> Optional[str]:
+        """Stored text for the article if present and fresh, without fetching"""
+        if not self.enabled:
+            return None
+        path = self._path(canonical_url(url))
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return None
+        self._count('hits')
+        return text
+
+    def get(self, url: str, fetch: Callable[[], Optional[str]]) -> Optional[str]:
+        """Stored text for the article; `fetch` scrapes it (None on failure)"""
+        text = self.cached(url)
+        if text is not None:
+            return text
+        key = canonical_url(url)
+        return self._flight.do(key, lambda: self._fetch(key, url, fetch))
+
+    def _fetch(self, key: str, url: str, fetch: Callable[[], Optional[str]]) -> Optional[str]:
+        # An earlier flight may have stored it since the check in get()
+        text = self.cached(url)
+        if text is not None:
+            return text
+
+        text = fetch()
+        if text is None:
+            return None  # paywalls and timeouts are retried next time
+        self._count('fetches')
+        if self.enabled:
+            self._save(self._path(key), text)
+        return text
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+    def _save(self, path: str, text: str):
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            self._grow(os.path.getsize(path))
+        except OSError:
+            pass  # scraped again next time
+
+    def _grow(self, added: int):
+        with self.lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._entries())
+            else:
+                self._size += added
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then the oldest, down to 80% of the budget (lock held)"""
+        now = time.time()
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._size <= self.max_bytes * 0.8 and now - entry.stat().st_mtime <= self.ttl:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._size -= size
+            self.stats['evicted'] += 1
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.store_dir) if entry.name.endswith('.txt')]
+        except OSError:
+            return []
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.store_dir, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.txt")
+
+
+# Global cache shared by every NewsSentimentAnalyzer in the process
+article_cache = ArticleCache(
+    store_dir=os.getenv('NEWS_CACHE_DIR', os.path.join('.cache', 'articles')),
+    ttl=int(float(os.getenv('NEWS_CACHE_TTL_HOURS', '168')) * 60 * 60),
+    max_bytes=int(float(os.getenv('NEWS_CACHE_MAX_MB', '200')) * 1024 * 1024),
+    enabled=os.getenv('NEWS_CACHE_ENABLED', 'true').lower() == 'true',
+)
@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ARTICLE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def _make_session(pool_size: int) -> requests.Session:
+    """Keep-alive session for news sites - most articles come from a handful
+    of hosts, so connections are reused across articles and tickers"""
+    session = requests.Session()
+    session.headers.update(ARTICLE_HEADERS)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ArticleFetcher:
+    """Scrapes news articles concurrently inside a time budget.
+
+    Each URL is fetched on a shared, bounded pool, at most `per_domain` at a
+    time per host so one news site never sees a burst from a batch. Articles
+    for a busy host wait in that host's queue rather than in a pool worker,
+    so other hosts' articles never queue behind them. The caller gets
+    whatever finished by the deadline; articles still queued or downloading
+    map to None and the caller falls back to Yahoo's summary.
+    """
+
+    def __init__(self, workers: int = 8, per_domain: int = 2, deadline: float = 12.0):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='article')
+        self.per_domain = per_domain
+        self.deadline = deadline
+        self._active: Dict[str, int] = {}  # downloads running per host
+        self._waiting: Dict[str, Deque[Tuple]] = {}  # jobs queued per host
+        self._guard = threading.Lock()
+        self._local = threading.local()
+        self.stats = {'fetched': 0, 'late': 0}
+
+    def fetch_all(self, urls: Iterable[str], fetch: Callable[[str], Optional[str]],
+                  deadline: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """fetch(url) for every URL, keyed by URL; None for failures and for
+        anything not done within `deadline` seconds (default: self.deadline)"""
+        budget = self.deadline if deadline is None else deadline
+        ends_at = time.monotonic() + budget
+        futures = {}
+        for url in dict.fromkeys(urls):
+            future = Future()
+            futures[future] = url
+            self._dispatch((url, fetch, ends_at, future))
+        done, late = wait(futures, timeout=budget)
+        for future in late:
+            future.cancel()  # still queued - dropped when its host frees up
+
+        results = dict.fromkeys(futures.values())
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception:
+                pass  # same as an unreadable article
+        with self._guard:
+            self.stats['fetched'] += len(done)
+            self.stats['late'] += len(late)
+        return results
+
+    def time_left(self, default: float) -> float:
+        """Seconds until the deadline of the fetch running on this thread, at
+        most `default` - keeps a download from holding its host slot long
+        after nobody is waiting for it"""
+        ends_at = getattr(self._local, 'ends_at', None)
+        if ends_at is None:
+            return default
+        return max(0.5, min(default, ends_at - time.monotonic()))
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._guard:
+            return dict(self.stats)
+
+    def _dispatch(self, job: Tuple):
+        """Start `job` if its host has a free slot, otherwise queue it"""
+        domain = urlparse(job[0]).netloc.lower()
+        with self._guard:
+            if self._active.get(domain, 0) >= self.per_domain:
+                self._waiting.setdefault(domain, deque()).append(job)
+                return
+            self._active[domain] = self._active.get(domain, 0) + 1
+        self.executor.submit(self._run, domain, job)
+
+    def _run(self, domain: str, job: Tuple):
+        while job is not None:
+            url, fetch, ends_at, future = job
+            # Cancelled (past its deadline) while queued - skip without a request
+            if future.set_running_or_notify_cancel():
+                self._local.ends_at = ends_at
+                try:
+                    future.set_result(fetch(url))
+                except Exception as e:
+                    future.set_exception(e)
+                finally:
+                    self._local.ends_at = None
+            # Hand the slot straight to the host's next queued article
+            with self._guard:
+                waiting = self._waiting.get(domain)
+                job = waiting.popleft() if waiting else None
+                if job is None:
+                    self._active[domain] -= 1
+
+
+# Process-wide pool and session shared by every NewsSentimentAnalyzer
+article_fetcher = ArticleFetcher(
+    workers=int(os.getenv('NEWS_SCRAPE_WORKERS', '8')),
+    per_domain=int(os.getenv('NEWS_SCRAPE_PER_DOMAIN', '2')),
+    deadline=float(os.getenv('NEWS_SCRAPE_DEADLINE', '12')),
+)
+article_session = _make_session(int(os.getenv('NEWS_SCRAPE_WORKERS', '8')))
@@ -1,8 +1,10 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from .debug_printer import debug_print
+from .beta_engine import beta_engine
+from .price_store import period_days, price_store
+from . import fixture_bundle
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -12,10 +14,13 @@ class BetaCalculator:
     Comprehensive beta calculation with multiple fallback strategies
     """
     
-    def __init__(self, ticker_symbol, market_index='^GSPC'):
+    def __init__(self, ticker_symbol, market_index='^GSPC', ticker=None):
+        """`ticker` may be an already-built yf.Ticker or TickerSnapshot (e.g. the
+        one DCF is running against) so beta lookups reuse its fetched .info"""
+        from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
         self.ticker_symbol = ticker_symbol.upper()
         self.market_index = market_index
-        self.ticker = yf.Ticker(ticker_symbol)
+        self.ticker = ticker if ticker is not None else TickerSnapshot(ticker_symbol)
         
     def get_beta_with_fallbacks(self, period_years=2):
         """
@@ -77,46 +82,39 @@ class BetaCalculator:
         Calculate beta from historical price data using regression
         """
         try:
-            # Get historical data
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=years*365)
+            # Batch runs precompute betas for a whole chunk (precompute_betas)
+            period = f"{years}y"
+            estimate = beta_engine.lookup(self.ticker_symbol, self.market_index, period)
             
-            # Download stock and market data
-            stock_data = yf.download(self.ticker_symbol, start=start_date, end=end_date, progress=False)
-            market_data = yf.download(self.market_index, start=start_date, end=end_date, progress=False)
-            
-            if stock_data.empty or market_data.empty:
-                debug_print(f"  No price data available for beta calculation")
-                return None
-            
-            # Calculate returns
-            stock_returns = stock_data['Adj Close'].pct_change().dropna()
-            market_returns = market_data['Adj Close'].pct_change().dropna()
-            
-            # Align dates
-            aligned_data = pd.concat([stock_returns, market_returns], axis=1, join='inner')
-            aligned_data.columns = ['stock', 'market']
-            aligned_data = aligned_data.dropna()
+            if estimate is None:
+                from ..implementations.data_providers.ticker_snapshot import TickerSnapshot
+                from ..implementations.data_providers.market_reference import market_reference
+
+                # Get historical data - period-based history (rather than a
+                # start/end window) so the stock comes from the price store and
+                # the index from the shared reference data; closes are already
+                # dividend/split adjusted
+                stock_data = TickerSnapshot(self.ticker_symbol).history(period=period)
+                market_closes = market_reference.closes(self.market_index, period)
+                
+                if stock_data.empty or market_closes.empty:
+                    debug_print(f"  No price data available for beta calculation")
+                    return None
+                
+                results = beta_engine.compute(stock_data[['Close']].rename(columns={'Close': self.ticker_symbol}), market_closes)
+                beta_engine.publish(results, self.market_index, period)
+                estimate = beta_engine.lookup(self.ticker_symbol, self.market_index, period)
             
-            if len(aligned_data) < min_data_points:
-                debug_print(f"  Insufficient data points: {len(aligned_data)} < {min_data_points}")
+            if estimate.observations < min_data_points:
+                debug_print(f"  Insufficient data points: {estimate.observations} < {min_data_points}")
                 return None
             
-            # Calculate beta using regression
-            covariance = np.cov(aligned_data['stock'], aligned_data['market'])[0, 1]
-            market_variance = np.var(aligned_data['market'])
-            
-            if market_variance == 0:
+            if not np.isfinite(estimate.beta):
                 debug_print(f"  Market variance is zero")
                 return None
             
-            beta = covariance / market_variance
-            
-            # Calculate R-squared for quality check
-            correlation = np.corrcoef(aligned_data['stock'], aligned_data['market'])[0, 1]
-            r_squared = correlation ** 2
-            
-            debug_print(f"  Calculated beta: {beta:.3f} (R²: {r_squared:.3f}, n={len(aligned_data)})")
+            beta, r_squared = estimate.beta, estimate.r_squared
+            debug_print(f"  Calculated beta: {beta:.3f} (R²: {r_squared:.3f}, n={estimate.observations})")
             
             # Quality check - reject if R-squared is too low
             if r_squared < 0.1:  # Less than 10% explanatory power
@@ -347,6 +345,35 @@ class BetaCalculator:
             debug_print(f"Beta unlevering failed: {e}")
             return self.get_beta_with_fallbacks()
 
+def precompute_betas(tickers, market_index='^GSPC', years=2):
+    """
+    Regress a whole batch chunk against the benchmark in one pass and publish
+    the results, so each stock's BetaCalculator finds its beta precomputed.
+    Prices are read from the price store, already topped up by the batch prefetch.
+    Returns the number of tickers with a usable beta.
+    """
+    from ..implementations.data_providers.market_reference import market_reference
+    
+    # Only what's already stored - a ticker the prefetch couldn't load falls
+    # back to its own regression rather than a download here
+    if fixture_bundle.active_bundle() is not None:
+        return 0  # store contents aren't part of a recorded run
+    
+    period = f"{years}y"
+    closes = {}
+    for ticker in tickers:
+        history = price_store.read(ticker, period_days(period)) if price_store.enabled else None
+        if history is not None and not history.empty:
+            closes[ticker] = history['Close']
+    
+    benchmark = market_reference.closes(market_index, period)
+    if not closes or benchmark.empty:
+        return 0
+    
+    results = beta_engine.compute(pd.DataFrame(closes), benchmark, keep_returns=True)
+    beta_engine.publish(results, market_index, period)
+    return int(results['valid'].sum())
+
 def get_robust_beta(ticker_symbol, market_index='^GSPC', period_years=2):
     """
     Simple wrapper function for easy integration with existing DCF code
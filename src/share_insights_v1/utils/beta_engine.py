@@ -0,0 +1,155 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .market_calendar import last_settle
+
+
+@dataclass
+class BetaEstimate:
+    """Price-regression beta for one ticker"""
+    beta: float
+    r_squared: float
+    observations: int
+    valid: bool  # enough observations and explanatory power to be trusted
+
+
+class BetaEngine:
+    """Beta, R² and covariance for a whole universe in a few matrix operations.
+
+    `compute` takes a dates x tickers price matrix and the benchmark series and
+    regresses every column at once. Missing bars (listings, halts, exchange
+    holidays) are masked per ticker, so each beta uses exactly the dates that
+    ticker and the benchmark both traded - the same pairwise alignment the
+    per-stock pandas regression did, without a join per stock.
+
+    Batch runs publish each chunk's results; BetaCalculator (and through it
+    WACC) looks them up instead of regressing ticker by ticker. Published
+    estimates belong to the US session whose close they include and are
+    dropped once the next session settles, like the reference series in
+    market_reference.
+    """
+
+    def __init__(self, min_observations: int = 50, min_r_squared: float = 0.1):
+        self.min_observations = min_observations
+        self.min_r_squared = min_r_squared
+        self._estimates: Dict[Tuple[str, str, str], BetaEstimate] = {}
+        self._session: Optional[datetime] = None  # settled close the estimates include
+        self._returns: List[pd.DataFrame] = []
+        self.lock = threading.Lock()
+
+    def compute(self, prices: pd.DataFrame, benchmark: pd.Series, keep_returns: bool = False) -> pd.DataFrame:
+        """Betas for every column of `prices` against `benchmark`.
+
+        Returns a frame indexed by ticker with beta, r_squared, observations and
+        valid columns. `keep_returns` retains the returns matrix for covariance().
+        """
+        returns = prices.sort_index().pct_change(fill_method=None).iloc[1:]
+        market = benchmark.sort_index().pct_change(fill_method=None).reindex(returns.index)
+
+        keep = market.notna().to_numpy()
+        x = returns.to_numpy(dtype='float64')[keep]
+        m = market.to_numpy(dtype='float64')[keep][:, None]
+
+        # Per-ticker sums over the dates that ticker has a return for
+        mask = ~np.isnan(x)
+        x = np.where(mask, x, 0.0)
+        mm = np.where(mask, m, 0.0)
+        n = mask.sum(axis=0).astype('float64')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sum_x, sum_m = x.sum(axis=0), mm.sum(axis=0)
+            cov = (x * mm).sum(axis=0) - sum_x * sum_m / n
+            var_m = (mm * mm).sum(axis=0) - sum_m ** 2 / n
+            var_x = (x * x).sum(axis=0) - sum_x ** 2 / n
+            beta = cov / var_m
+            r_squared = cov ** 2 / (var_m * var_x)
+
+        results = pd.DataFrame({
+            'beta': beta,
+            'r_squared': r_squared,
+            'observations': n.astype(int),
+        }, index=prices.columns)
+        results['valid'] = (
+            (results['observations'] >= self.min_observations)
+            & (results['r_squared'] >= self.min_r_squared)
+            & np.isfinite(results['beta'])
+        )
+
+        if keep_returns:
+            with self.lock:
+                self._returns.append(returns)
+        return results
+
+    def publish(self, results: pd.DataFrame, benchmark: str = '^GSPC', period: str = '2y',
+                now: Optional[datetime] = None):
+        """Make computed betas available to lookup() until the next settled close"""
+        estimates = {
+            (str(ticker).upper(), benchmark, period):
+                BetaEstimate(float(row.beta), float(row.r_squared), int(row.observations), bool(row.valid))
+            for ticker, row in results.iterrows()
+        }
+        with self.lock:
+            self._roll(now)
+            self._estimates.update(estimates)
+
+    def lookup(self, ticker: str, benchmark: str = '^GSPC', period: str = '2y',
+               now: Optional[datetime] = None) -> Optional[BetaEstimate]:
+        """Precomputed estimate, or None if this ticker hasn't been computed
+        since the last settled close"""
+        with self.lock:
+            self._roll(now)
+            return self._estimates.get((ticker.upper(), benchmark, period))
+
+    def covariance(self, tickers: Optional[List[str]] = None, annualize: bool = False) -> pd.DataFrame:
+        """Pairwise-complete return covariance across computed tickers.
+
+        The full matrix is N x N - pass `tickers` for a portfolio-sized slice
+        when the universe is large.
+        """
+        with self.lock:
+            chunks = list(self._returns)
+        if not chunks:
+            return pd.DataFrame()
+        returns = pd.concat(chunks, axis=1)
+        returns = returns.loc[:, ~returns.columns.duplicated(keep='last')]
+        if tickers is not None:
+            returns = returns[[t for t in tickers if t in returns.columns]]
+
+        x = returns.to_numpy(dtype='float64')
+        mask = (~np.isnan(x)).astype('float64')
+        x = np.where(mask > 0, x, 0.0)
+
+        # Sums over dates both tickers traded: N_ij, Σx_i, Σx_j, Σx_i·x_j
+        n = mask.T @ mask
+        sum_i = x.T @ mask
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = (x.T @ x - sum_i * sum_i.T / n) / (n - 1)
+        if annualize:
+            cov = cov * 252
+        return pd.DataFrame(cov, index=returns.columns, columns=returns.columns)
+
+    def drop_returns(self):
+        """Release the returns matrices kept for covariance() (end of a batch)"""
+        with self.lock:
+            self._returns.clear()
+
+    def clear(self):
+        with self.lock:
+            self._estimates.clear()
+            self._returns.clear()
+
+    def _roll(self, now: Optional[datetime]):
+        """Drop estimates from before the last settled close (lock held)"""
+        session = last_settle('us', now or datetime.now(timezone.utc))
+        if session != self._session:
+            self._estimates.clear()
+            self._session = session
+
+
+# Global instance shared by batch runs and BetaCalculator
+beta_engine = BetaEngine()
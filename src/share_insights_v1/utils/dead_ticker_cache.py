@@ -0,0 +1,181 @@
+import csv
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Yahoo error text that means the symbol itself is gone, not that a request failed
+DEAD_ERROR_PATTERNS = (
+    'possibly delisted', 'may be delisted', 'no data found', 'no price data found',
+    'quote not found', 'no timezone found',
+)
+
+# Keys every live Yahoo quote carries - an info dict with none of them is the
+# stub yfinance returns for unknown symbols
+QUOTE_KEYS = ('quoteType', 'symbol', 'shortName', 'longName', 'regularMarketPrice')
+
+# yfinance returns the same stub for live symbols when the quote call fails
+# (expired crumb, throttling), so an empty quote only counts once it repeats
+EMPTY_QUOTE_CONFIRMATIONS = 2
+
+DAY = 24 * 60 * 60
+
+
+def is_dead_error(error_msg: str) -> bool:
+    """True if a Yahoo error says the symbol doesn't exist (rather than e.g. a 429)"""
+    message = error_msg.lower()
+    return any(pattern in message for pattern in DEAD_ERROR_PATTERNS)
+
+
+def is_empty_quote(info: Optional[Dict[str, Any]]) -> bool:
+    """True if `info` is yfinance's placeholder for a symbol with no quote"""
+    return not info or not any(info.get(key) for key in QUOTE_KEYS)
+
+
+class DeadTickerCache:
+    """Persistent negative cache of symbols Yahoo has no data for.
+
+    Exchange dumps carry delisted and renamed symbols that fail every run.
+    Each failure is remembered in a JSON file with a retry time that backs off
+    exponentially - one day after the first miss, doubling per repeat, capped
+    at `max_ttl` - so providers and batch runs skip the symbol until then
+    instead of spending requests (and rate-limit budget) on it. A symbol that
+    comes back is dropped from the cache on its first successful fetch.
+    """
+
+    def __init__(self, path: str, base_ttl: float = DAY, max_ttl: float = 30 * DAY,
+                 enabled: bool = True, save_interval: float = 5.0):
+        self.path = path
+        self.base_ttl = base_ttl
+        self.max_ttl = max_ttl
+        self.enabled = enabled
+        self.save_interval = save_interval
+        self.lock = threading.Lock()
+        self.skipped = 0
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._last_save = 0.0
+
+    def is_dead(self, ticker: str) -> bool:
+        """True while `ticker` is inside its back-off window"""
+        if not self.enabled:
+            return False
+        with self.lock:
+            entry = self._load().get(ticker.upper())
+            dead = entry is not None and entry['retry_at'] > time.time()
+            if dead:
+                self.skipped += 1
+            return dead
+
+    def record_dead(self, ticker: str, reason: str, confirmations: int = 1):
+        """Remember a failed lookup and push the next retry out.
+
+        The symbol is only skipped once it has failed `confirmations` times in
+        a row; until then the miss is tracked but the next lookup goes ahead.
+        """
+        if not self.enabled or not ticker:
+            return
+        now = time.time()
+        with self.lock:
+            entries = self._load()
+            entry = entries.get(ticker.upper(), {'failures': 0, 'first_seen': now})
+            entry['failures'] += 1
+            entry['last_seen'] = now
+            entry['reason'] = reason[:200]
+            if entry['failures'] < confirmations:
+                entry['retry_at'] = now
+            else:
+                entry['retry_at'] = now + min(self.max_ttl, self.base_ttl * 2 ** (entry['failures'] - confirmations))
+            entries[ticker.upper()] = entry
+            self._dirty = True
+            self._save_if_due()
+
+    def record_alive(self, ticker: str):
+        """Forget a symbol that returned data again"""
+        if not self.enabled:
+            return
+        with self.lock:
+            if self._load().pop(ticker.upper(), None) is not None:
+                self._dirty = True
+                self._save_if_due()
+
+    def dead_tickers(self) -> Dict[str, Dict[str, Any]]:
+        """Symbols currently inside their back-off window"""
+        now = time.time()
+        with self.lock:
+            return {t: dict(e) for t, e in self._load().items() if e['retry_at'] > now}
+
+    def prune_universe(self, input_csv_path: str, output_csv_path: str, symbol_column: str = 'Symbol') -> int:
+        """Copy a universe CSV without its known-dead rows. Returns rows dropped."""
+        dead = self.dead_tickers()
+        dropped = 0
+        with open(input_csv_path, newline='') as src, open(output_csv_path, 'w', newline='') as dst:
+            reader = csv.DictReader(src)
+            writer = csv.DictWriter(dst, fieldnames=reader.fieldnames)
+            writer.writeheader()
+            for row in reader:
+                if str(row.get(symbol_column, '')).strip().upper() in dead:
+                    dropped += 1
+                    continue
+                writer.writerow(row)
+        return dropped
+
+    def flush(self):
+        """Write pending changes to disk"""
+        with self.lock:
+            if self._dirty:
+                self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            now = time.time()
+            entries = self._load()
+            return {
+                'known_dead': sum(1 for e in entries.values() if e['retry_at'] > now),
+                'tracked': len(entries),
+                'skipped': self.skipped,
+            }
+
+    def print_stats(self):
+        """Print a one-line summary (used at the end of batch runs)"""
+        stats = self.get_stats()
+        print(f"🪦 Dead tickers: {stats['known_dead']} known, {stats['skipped']} lookups skipped")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save_if_due(self):
+        # Dead symbols arrive in bursts during a batch - write at most every
+        # save_interval seconds (flush() writes the rest)
+        if time.time() - self._last_save >= self.save_interval:
+            self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or '.'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return  # A read-only disk just means the cache isn't persisted
+        self._dirty = False
+        self._last_save = time.time()
+
+
+# Global instance shared by the Yahoo provider and batch services
+dead_tickers = DeadTickerCache(
+    path=os.getenv('DEAD_TICKER_CACHE_PATH', os.path.join('.cache', 'dead_tickers.json')),
+    base_ttl=float(os.getenv('DEAD_TICKER_BASE_TTL_DAYS', '1')) * DAY,
+    max_ttl=float(os.getenv('DEAD_TICKER_MAX_TTL_DAYS', '30')) * DAY,
+    enabled=os.getenv('DEAD_TICKER_CACHE_ENABLED', 'true').lower() == 'true',
+)
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .market_calendar import calendar_fresh
+
+# Sentinel for "not in cache" - None is a legitimate cached value for some resources
+MISS = object()
+
+# Freshness per data class, in seconds. Statements and dividends only change
+# quarterly; quotes (info carries the live price) and news go stale in minutes.
+DEFAULT_TTLS = {
+    'quote': 15 * 60,
+    'prices': 60 * 60,
+    'news': 30 * 60,
+    'analyst': 6 * 60 * 60,
+    'dividends': 24 * 60 * 60,
+    'statements': 24 * 60 * 60,
+}
+
+# Data classes that can outlive their TTL on the market calendar
+CALENDAR_CLASSES = ('quote', 'prices', 'statements')
+
+# Yahoo resource name -> data class
+RESOURCE_CLASSES = {
+    'info': 'quote',
+    'news': 'news',
+    'dividends': 'dividends',
+    'cashflow': 'statements',
+    'income_stmt': 'statements',
+    'quarterly_income_stmt': 'statements',
+    'balance_sheet': 'statements',
+    'upgrades_downgrades': 'analyst',
+    'earnings_estimate': 'analyst',
+    'revenue_estimate': 'analyst',
+    'growth_estimates': 'analyst',
+}
+
+
+def data_class_for(resource: str) -> str:
+    """Map a snapshot resource name (e.g. 'cashflow', 'history:period=1y') to its data class"""
+    if resource.startswith('history:'):
+        return 'prices'
+    return RESOURCE_CLASSES.get(resource, 'quote')
+
+
+class DiskCache:
+    """Persistent, ticker-keyed cache for Yahoo Finance responses.
+
+    One pickle file per (ticker, resource) under cache_dir/<TICKER>/, each
+    stamped with its fetch time and checked against its data class's TTL on
+    read. Writes are atomic (temp file + rename) so a crashed batch never
+    leaves a half-written entry behind, and a re-run picks up where it left off
+    without re-downloading fundamentals that are still fresh.
+    """
+
+    def __init__(self, cache_dir: str, ttls: Optional[Dict[str, int]] = None, enabled: bool = True,
+                 calendar: bool = True):
+        self.cache_dir = cache_dir
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.enabled = enabled
+        self.calendar = calendar
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.errors = 0
+        self.calendar_hits = 0
+        self.lock = threading.Lock()
+
+    def get(self, ticker: str, resource: str) -> Any:
+        """Return the cached value, or MISS if absent, expired or unreadable"""
+        if not self.enabled:
+            return MISS
+
+        data_class = data_class_for(resource)
+        entry = self._read(self._path(ticker, resource))
+        if entry is None or not self._fresh(ticker, resource, data_class, entry):
+            self._count(self.misses, data_class)
+            return MISS
+
+        self._count(self.hits, data_class)
+        return entry['value']
+
+    def set(self, ticker: str, resource: str, value: Any) -> None:
+        """Store a freshly fetched value. Failures only cost a future cache miss."""
+        if not self.enabled or value is None:
+            return
+
+        path = self._path(ticker, resource)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'fetched_at': time.time(), 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+
+    def get_or_fetch(self, ticker: str, resource: str, loader: Callable[[], Any]) -> Any:
+        """Cached value if fresh, otherwise call loader and cache its result"""
+        value = self.get(ticker, resource)
+        if value is MISS:
+            value = loader()
+            self.set(ticker, resource, value)
+        return value
+
+    def invalidate(self, ticker: str) -> int:
+        """Drop every cached resource for one ticker. Returns the number of entries removed."""
+        ticker_dir = self._ticker_dir(ticker)
+        if not os.path.isdir(ticker_dir):
+            return 0
+        removed = len([f for f in os.listdir(ticker_dir) if f.endswith('.pkl')])
+        shutil.rmtree(ticker_dir, ignore_errors=True)
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, overall and per data class"""
+        with self.lock:
+            total_hits = sum(self.hits.values())
+            total_misses = sum(self.misses.values())
+            lookups = total_hits + total_misses
+            return {
+                'enabled': self.enabled,
+                'hits': total_hits,
+                'misses': total_misses,
+                'hit_rate': round(total_hits / lookups, 3) if lookups else 0.0,
+                'write_errors': self.errors,
+                'calendar_hits': self.calendar_hits,
+                'by_data_class': {
+                    data_class: {'hits': self.hits.get(data_class, 0), 'misses': self.misses.get(data_class, 0)}
+                    for data_class in sorted(set(self.hits) | set(self.misses))
+                }
+            }
+
+    def print_stats(self):
+        """Print a one-line cache summary (used at the end of batch runs)"""
+        stats = self.get_stats()
+        print(f"💾 Yahoo cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"(hit rate {stats['hit_rate']:.0%}, {stats['calendar_hits']} past TTL while unchanged)")
+
+    def _fresh(self, ticker: str, resource: str, data_class: str, entry: Dict[str, Any]) -> bool:
+        """Within its TTL, or past it but unchanged since (market closed, no
+        earnings release - see utils/market_calendar.py)"""
+        if time.time() - entry['fetched_at'] <= self.ttls.get(data_class, 0):
+            return True
+        if not self.calendar or data_class not in CALENDAR_CLASSES:
+            return False
+        # The exchange and earnings date come from the ticker's cached quote,
+        # however old - both change far less often than the quote's prices
+        quote = entry['value'] if resource == 'info' else self._stored_quote(ticker)
+        if calendar_fresh(data_class, ticker, entry['fetched_at'], quote if isinstance(quote, dict) else None):
+            with self.lock:
+                self.calendar_hits += 1
+            return True
+        return False
+
+    def _stored_quote(self, ticker: str) -> Optional[Dict[str, Any]]:
+        entry = self._read(self._path(ticker, 'info'))
+        return entry['value'] if entry is not None else None
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt/incompatible entry (e.g. written by a different pandas
+            # version) - treat as a miss so it gets overwritten
+            return None
+
+    def _count(self, counter: Dict[str, int], data_class: str):
+        with self.lock:
+            counter[data_class] += 1
+
+    def _ticker_dir(self, ticker: str) -> str:
+        return os.path.join(self.cache_dir, re.sub(r'[^A-Za-z0-9.\-^=]', '_', ticker.upper()))
+
+    def _path(self, ticker: str, resource: str) -> str:
+        readable = re.sub(r'[^A-Za-z0-9_]', '_', resource)[:40]
+        digest = hashlib.md5(resource.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self._ticker_dir(ticker), f"{readable}_{digest}.pkl")
+
+
+# Global instance shared by every TickerSnapshot
+yahoo_cache = DiskCache(
+    cache_dir=os.getenv('YAHOO_CACHE_DIR', os.path.join('.cache', 'yahoo')),
+    enabled=os.getenv('YAHOO_CACHE_ENABLED', 'true').lower() == 'true',
+    calendar=os.getenv('YAHOO_CACHE_CALENDAR', 'true').lower() == 'true'
+)
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+
+
+class FixtureMissingError(Exception):
+    """Replay asked for a response the bundle never recorded"""
+
+
+class RecordedError(Exception):
+    """A failure captured while recording, re-raised on replay"""
+
+
+class FixtureBundle:
+    """Directory of recorded external responses for offline, repeatable runs.
+
+    In 'record' mode every call passed through it runs for real and its
+    result (or exception) is saved as bundle/<source>/<digest>.pkl. In 'replay'
+    mode the same calls are answered from disk without touching the network;
+    a call that was never recorded raises FixtureMissingError rather than
+    quietly going online.
+
+    Sources are the external boundaries: 'yahoo' (TickerSnapshot resources),
+    'yahoo_screen' (peer screener), 'sec' (EDGAR HTTP), 'article' (news page
+    scraping) and 'llm' (LLMManager prompts).
+    """
+
+    MODES = ('record', 'replay')
+
+    def __init__(self, path: str, mode: str = 'replay'):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.stats = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def call(self, source: str, key: Any, fn: Callable[[], Any]) -> Any:
+        file_path = self._path(source, key)
+
+        if self.mode == 'replay':
+            try:
+                with open(file_path, 'rb') as f:
+                    entry = pickle.load(f)
+            except FileNotFoundError:
+                self._count(f"{source}.missing")
+                raise FixtureMissingError(f"No recorded {source} response for {key!r} in {self.path}")
+            self._count(f"{source}.replayed")
+            if entry.get('error') is not None:
+                raise RecordedError(entry['error'])
+            return entry['value']
+
+        try:
+            value = fn()
+        except Exception as e:
+            self._save(file_path, {'key': repr(key), 'value': None, 'error': str(e)})
+            self._count(f"{source}.recorded")
+            raise
+        self._save(file_path, {'key': repr(key), 'value': value, 'error': None})
+        self._count(f"{source}.recorded")
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+    def write_manifest(self, **details):
+        """Record what the bundle was captured for (tickers, date, counts)"""
+        manifest = dict(details, mode=self.mode, counts=self.get_stats())
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2, default=str)
+
+    def _save(self, file_path: str, entry: Dict[str, Any]):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, file_path)
+
+    def _path(self, source: str, key: Any) -> str:
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.path, source, f"{digest}.pkl")
+
+    def _count(self, name: str):
+        with self.lock:
+            self.stats[name] += 1
+
+
+# Process-wide active bundle - None means talk to the network as usual
+_active_bundle: Optional[FixtureBundle] = None
+
+
+def use_bundle(bundle: Optional[FixtureBundle]):
+    """Route every external call through `bundle` (None switches recording/replay off)"""
+    global _active_bundle
+    _active_bundle = bundle
+
+
+def active_bundle() -> Optional[FixtureBundle]:
+    return _active_bundle
+
+
+def through(source: str, key: Any, fn: Callable[[], Any]) -> Any:
+    """Run an external call, recording or replaying it if a bundle is active"""
+    bundle = _active_bundle
+    if bundle is None:
+        return fn()
+    return bundle.call(source, key, fn)
+
+
+# FIXTURE_MODE=record|replay turns a bundle on for any entry point (batch
+# scripts, API, tests) without code changes
+if os.getenv('FIXTURE_MODE', '').lower() in FixtureBundle.MODES:
+    use_bundle(FixtureBundle(os.getenv('FIXTURE_BUNDLE_DIR', os.path.join('fixtures', 'bundle')),
+                             mode=os.getenv('FIXTURE_MODE').lower()))
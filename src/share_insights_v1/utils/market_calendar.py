@@ -0,0 +1,99 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
+
+# Trading sessions per Yahoo screener region: timezone, open and close (local).
+# Holidays aren't modelled - a holiday counts as a session, which only means
+# the plain TTL decides that day.
+EXCHANGES = {
+    'us': (ZoneInfo('America/New_York'), (9, 30), (16, 0)),
+    'au': (ZoneInfo('Australia/Sydney'), (10, 0), (16, 0)),
+    'nz': (ZoneInfo('Pacific/Auckland'), (10, 0), (16, 45)),
+}
+
+# Closing prices settle (closing auction, late prints) shortly after the bell
+SETTLE_MINUTES = 30
+
+# Yahoo's statements lag the earnings release by a day or two
+STATEMENT_LAG = 3 * 24 * 60 * 60
+
+# Shorter than any real gap between two quarterly releases - used to bound the
+# release we can't see (Yahoo shows one earnings date, past or upcoming)
+MIN_REPORTING_GAP = 75 * 24 * 60 * 60
+
+
+def region_for(ticker: str, market: str = '') -> str:
+    """Yahoo region of a listing: from info['market'] (e.g. 'au_market') when
+    known, otherwise guessed from the ticker suffix"""
+    if market and market.endswith('_market'):
+        return market[:-len('_market')]
+
+    if ticker.endswith('.AX'):
+        return 'au'
+    elif ticker.endswith('.NZ'):
+        return 'nz'
+    else:
+        return 'us'
+
+
+def _session(region: str, day: datetime):
+    """(open, settled close) of the session on `day`'s local date"""
+    _, (open_h, open_m), (close_h, close_m) = EXCHANGES[region]
+    opens = day.replace(hour=open_h, minute=open_m, second=0, microsecond=0)
+    settles = day.replace(hour=close_h, minute=close_m, second=0, microsecond=0) + timedelta(minutes=SETTLE_MINUTES)
+    return opens, settles
+
+
+def in_session(region: str, at: datetime) -> bool:
+    """True from the open until closing prices have settled, on weekdays"""
+    local = at.astimezone(EXCHANGES[region][0])
+    if local.weekday() >= 5:
+        return False
+    opens, settles = _session(region, local)
+    return opens <= local < settles
+
+
+def last_settle(region: str, at: datetime) -> datetime:
+    """Most recent settled close at or before `at`, skipping weekends"""
+    local = at.astimezone(EXCHANGES[region][0])
+    _, settles = _session(region, local)
+    if settles > local:
+        settles -= timedelta(days=1)
+    while settles.weekday() >= 5:
+        settles -= timedelta(days=1)
+    return settles
+
+
+def calendar_fresh(data_class: str, ticker: str, fetched_at: float, quote: Optional[Dict[str, Any]] = None,
+                   now: Optional[float] = None) -> bool:
+    """Whether an entry past its TTL can still be served because it can't have changed.
+
+    Quotes and prices fetched after the exchange's last settled close stay
+    valid until the next open - overnight and weekend re-runs are served from
+    the cache. Statements stay valid until the next earnings release (plus
+    STATEMENT_LAG), from `quote['earningsTimestamp']`. Other data classes have
+    only their TTL.
+    """
+    quote = quote or {}
+    now = time.time() if now is None else now
+
+    if data_class in ('quote', 'prices'):
+        region = region_for(ticker, quote.get('market') or '')
+        if region not in EXCHANGES:
+            return False
+        moment = datetime.fromtimestamp(now, EXCHANGES[region][0])
+        return not in_session(region, moment) and fetched_at >= last_settle(region, moment).timestamp()
+
+    if data_class == 'statements':
+        earnings_at = quote.get('earningsTimestamp')
+        if not isinstance(earnings_at, (int, float)):
+            return False
+        if earnings_at > now:
+            # Upcoming release - the previous one was at least this long before it
+            earnings_at -= MIN_REPORTING_GAP
+        elif now - earnings_at > MIN_REPORTING_GAP:
+            return False  # the next release may be out already
+        return fetched_at >= earnings_at + STATEMENT_LAG
+
+    return False
@@ -0,0 +1,234 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .disk_cache import DEFAULT_TTLS
+from .market_calendar import calendar_fresh
+
+# history() period strings -> calendar days
+PERIOD_DAYS = {'d': 1, 'wk': 7, 'mo': 31, 'y': 366}
+
+
+def period_days(period: str) -> Optional[int]:
+    """Calendar days covered by a history() period like '1y' or '6mo'; None if unsupported"""
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', str(period))
+    if not match:
+        return None
+    return int(match.group(1)) * PERIOD_DAYS[match.group(2)]
+
+
+class PriceStore:
+    """Local daily-bar store, one set of NumPy files per ticker.
+
+    cache_dir/<TICKER>/dates.npy holds bar dates (datetime64[D], exchange-local)
+    and bars.npy a float64 (n, 5) Open/High/Low/Close/Volume matrix. Reads map
+    both files with mmap_mode='r' and wrap them in a DataFrame without copying,
+    so every reader of a ticker shares the same pages.
+
+    After the first load only bars newer than the last stored date are
+    fetched. The incremental request starts one bar early and compares that
+    overlapping close: a mismatch means Yahoo re-adjusted history (dividend or
+    split) and the ticker is reloaded in full.
+    """
+
+    COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+    def __init__(self, store_dir: str, ttl: int = DEFAULT_TTLS['prices'], enabled: bool = True,
+                 calendar: bool = True):
+        self.store_dir = store_dir
+        self.ttl = ttl
+        self.enabled = enabled
+        self.calendar = calendar
+        self.stats = defaultdict(int)
+        self.lock = threading.Lock()
+        self._ticker_locks: Dict[str, threading.Lock] = {}
+
+    def history(self, ticker: str, period: str, fetch: Callable[..., pd.DataFrame]) -> pd.DataFrame:
+        """Daily bars covering `period`, topping up the store through `fetch`.
+
+        `fetch` takes yf.Ticker.history() keyword arguments - period= for a full
+        load, start= for an incremental one.
+        """
+        days = period_days(period)
+        if not self.enabled or days is None:
+            return fetch(period=period)
+
+        with self._lock_for(ticker):
+            state = self.status(ticker, days)
+            if state == 'stale':
+                self._count('incremental_loads')
+                if not self.append(ticker, fetch(start=self.resume_date(ticker))):
+                    state = 'missing'
+            if state == 'missing':
+                self._count('full_loads')
+                frame = self.normalize(fetch(period=period))
+                if not self.replace(ticker, frame, days):
+                    return frame
+            self._count('reads')
+            stored = self.read(ticker, days)
+            return stored if stored is not None else self.normalize(fetch(period=period))
+
+    def status(self, ticker: str, days: int) -> str:
+        """'fresh' (serve as-is), 'stale' (needs newer bars) or 'missing' (needs a full load)"""
+        meta = self._read_meta(ticker)
+        if meta is None:
+            return 'missing'
+        wanted_from = np.datetime64('today', 'D') - np.timedelta64(days, 'D')
+        if np.datetime64(meta['covered_from'], 'D') > wanted_from:
+            return 'missing'  # stored window is shorter than the one asked for
+        if time.time() - meta['fetched_at'] > self.ttl and not (
+                self.calendar and calendar_fresh('prices', ticker, meta['fetched_at'])):
+            return 'stale'
+        return 'fresh'
+
+    def read(self, ticker: str, days: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Zero-copy view of the stored bars (optionally only the last `days`), or None"""
+        try:
+            dates = np.load(self._file(ticker, 'dates.npy'), mmap_mode='r')
+            bars = np.load(self._file(ticker, 'bars.npy'), mmap_mode='r')
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        if len(dates) != len(bars):
+            return None  # interrupted write - caller reloads
+
+        start = 0
+        if days is not None:
+            start = int(np.searchsorted(dates, np.datetime64('today', 'D') - np.timedelta64(days, 'D')))
+        return pd.DataFrame(bars[start:], index=pd.DatetimeIndex(dates[start:]),
+                            columns=list(self.COLUMNS), copy=False)
+
+    def resume_date(self, ticker: str) -> str:
+        """Start date for an incremental fetch - the second-to-last stored bar,
+        so the first returned bar overlaps a settled close"""
+        dates = np.load(self._file(ticker, 'dates.npy'), mmap_mode='r')
+        return str(dates[max(len(dates) - 2, 0)])
+
+    def append(self, ticker: str, frame: pd.DataFrame) -> bool:
+        """Merge newer bars onto the stored ones. Returns False if the ticker
+        needs a full reload (nothing stored, or history was re-adjusted)."""
+        frame = self.normalize(frame)
+        stored = self.read(ticker)
+        meta = self._read_meta(ticker)
+        if stored is None or meta is None:
+            return False
+        if frame.empty:
+            return self._write(ticker, stored, meta['covered_from'])
+
+        first = frame.index[0]
+        if first in stored.index:
+            # Overlapping bar must match what's stored, otherwise Yahoo has
+            # re-adjusted past prices and every stored bar is off
+            if not np.isclose(stored.at[first, 'Close'], frame['Close'].iloc[0], rtol=1e-4):
+                return False
+        elif first <= stored.index[-1]:
+            return False
+
+        kept = stored[stored.index < first]
+        self._count('bars_appended', len(frame.index.difference(stored.index)))
+        return self._write(ticker, pd.concat([kept, frame]), meta['covered_from'])
+
+    def replace(self, ticker: str, frame: pd.DataFrame, days: int) -> bool:
+        """Store a full load covering the last `days` calendar days"""
+        frame = self.normalize(frame)
+        if frame.empty:
+            return False  # unknown/delisted ticker - nothing worth keeping
+        covered_from = str(np.datetime64('today', 'D') - np.timedelta64(days, 'D'))
+        return self._write(ticker, frame, covered_from)
+
+    def invalidate(self, ticker: str) -> bool:
+        """Drop a ticker's stored bars"""
+        ticker_dir = self._ticker_dir(ticker)
+        if not os.path.isdir(ticker_dir):
+            return False
+        shutil.rmtree(ticker_dir, ignore_errors=True)
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Read/load counters for this process"""
+        with self.lock:
+            return dict(self.stats)
+
+    def print_stats(self):
+        """Print a one-line store summary (used at the end of batch runs)"""
+        stats = self.get_stats()
+        print(f"📈 Price store: {stats.get('reads', 0)} reads, {stats.get('full_loads', 0)} full loads, "
+              f"{stats.get('incremental_loads', 0)} incremental (+{stats.get('bars_appended', 0)} bars)")
+
+    @classmethod
+    def normalize(cls, frame: pd.DataFrame) -> pd.DataFrame:
+        """history()/download() frame -> OHLCV float64 indexed by naive exchange-local date"""
+        if frame is None or frame.empty:
+            return pd.DataFrame(columns=list(cls.COLUMNS), index=pd.DatetimeIndex([]), dtype='float64')
+        index = frame.index
+        if getattr(index, 'tz', None) is not None:
+            index = index.tz_localize(None)
+        out = pd.DataFrame(frame[list(cls.COLUMNS)].to_numpy(dtype='float64'),
+                           index=pd.DatetimeIndex(index).normalize(), columns=list(cls.COLUMNS))
+        out = out.dropna(subset=['Close'])
+        return out[~out.index.duplicated(keep='last')].sort_index()
+
+    def _write(self, ticker: str, frame: pd.DataFrame, covered_from: str) -> bool:
+        ticker_dir = self._ticker_dir(ticker)
+        try:
+            os.makedirs(ticker_dir, exist_ok=True)
+            # Bars and dates first, meta last - a reader only trusts the arrays
+            # once their lengths agree, and status() needs meta to skip a fetch
+            self._atomic_save(ticker_dir, 'bars.npy', frame[list(self.COLUMNS)].to_numpy(dtype='float64'))
+            self._atomic_save(ticker_dir, 'dates.npy', frame.index.values.astype('datetime64[D]'))
+            meta = {'fetched_at': time.time(), 'covered_from': covered_from}
+            fd, tmp_path = tempfile.mkstemp(dir=ticker_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, os.path.join(ticker_dir, 'meta.json'))
+            return True
+        except OSError:
+            self._count('write_errors')
+            return False
+
+    @staticmethod
+    def _atomic_save(ticker_dir: str, name: str, array: np.ndarray):
+        fd, tmp_path = tempfile.mkstemp(dir=ticker_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_path, os.path.join(ticker_dir, name))
+
+    def _read_meta(self, ticker: str) -> Optional[Dict]:
+        try:
+            with open(self._file(ticker, 'meta.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self.lock:
+            lock = self._ticker_locks.get(ticker)
+            if lock is None:
+                lock = self._ticker_locks[ticker] = threading.Lock()
+            return lock
+
+    def _count(self, name: str, n: int = 1):
+        with self.lock:
+            self.stats[name] += n
+
+    def _ticker_dir(self, ticker: str) -> str:
+        return os.path.join(self.store_dir, re.sub(r'[^A-Za-z0-9.\-^=]', '_', ticker.upper()))
+
+    def _file(self, ticker: str, name: str) -> str:
+        return os.path.join(self._ticker_dir(ticker), name)
+
+
+# Global instance shared by every TickerSnapshot
+price_store = PriceStore(
+    store_dir=os.getenv('PRICE_STORE_DIR', os.path.join('.cache', 'prices')),
+    enabled=os.getenv('PRICE_STORE_ENABLED', 'true').lower() == 'true',
+    calendar=os.getenv('YAHOO_CACHE_CALENDAR', 'true').lower() == 'true'
+)
@@ -1,9 +1,15 @@
 import time
 from collections import defaultdict
 import threading
+from .rate_limiter import AdaptiveRateLimiter, yahoo_limiter
 
 class RateLimitTracker:
-    def __init__(self):
+    """Counts Yahoo requests and errors, and paces requests through the
+    adaptive limiter: track_request() waits for a token before each request,
+    record_success() and check_rate_limit_error() feed the rate up or down."""
+
+    def __init__(self, limiter: AdaptiveRateLimiter = yahoo_limiter):
+        self.limiter = limiter
         self.request_count = 0
         self.rate_limit_errors = 0
         self.all_errors = []
@@ -14,6 +20,8 @@ class RateLimitTracker:
         self.rate_limit_lock = threading.Lock()
     
     def track_request(self, ticker=""):
+        """Call immediately before a Yahoo request - blocks until the limiter allows it"""
+        self.limiter.acquire()
         self.request_count += 1
         current_time = time.time()
         self.request_times.append(current_time)
@@ -22,10 +30,15 @@ class RateLimitTracker:
         
         if self.request_count % 100 == 0:
             recent_rate = self._calculate_recent_rate()
-            print(f"🔄 YFinance: {self.request_count} requests, Rate: {recent_rate:.1f}/min, Errors: {self.rate_limit_errors}")
+            print(f"🔄 YFinance: {self.request_count} requests, Rate: {recent_rate:.1f}/min, "
+                  f"Limit: {self.limiter.rate * 60:.0f}/min, Errors: {self.rate_limit_errors}")
+    
+    def record_success(self):
+        """Call after a Yahoo request succeeds - lets the limiter ramp back up"""
+        self.limiter.on_success()
     
     def check_rate_limit_error(self, error_msg: str, ticker: str = "") -> bool:
-        """Check for rate limit error and pause if detected. Returns True if rate limited."""
+        """Check for rate limit error and back off if detected. Returns True if rate limited."""
         # Log all errors for analysis
         self.all_errors.append(f"{ticker}: {error_msg}")
         self.error_patterns[error_msg.lower()[:50]] += 1
@@ -35,22 +48,16 @@ class RateLimitTracker:
         if any(indicator in error_msg.lower() for indicator in rate_limit_indicators):
             with self.rate_limit_lock:
                 self.rate_limit_errors += 1
-                current_time = time.time()
-                
-                # Only pause if we haven't paused recently (avoid multiple threads all pausing)
-                if current_time - self.last_rate_limit_time > 30:
-                    self.last_rate_limit_time = current_time
-                    wait_time = 60
-                    print(f"\n⚠️ RATE LIMIT HIT! Pausing all threads for {wait_time}s...")
-                    print(f"   Total rate limit errors: {self.rate_limit_errors}")
-                    print(f"   Ticker: {ticker}, Error: {error_msg}")
-                    time.sleep(wait_time)
-                    print(f"✅ Resuming after {wait_time}s pause\n")
-                else:
-                    # Another thread already paused recently, just wait a bit
-                    time.sleep(5)
-                
-                return True
+                self.last_rate_limit_time = time.time()
+            
+            # The limiter holds every thread for its cooldown and halves the
+            # request rate - no sleeping in whichever thread saw the 429
+            if self.limiter.on_rate_limited():
+                print(f"\n⚠️ RATE LIMIT HIT! Backing off to {self.limiter.rate * 60:.0f} requests/min "
+                      f"({self.limiter.cooldown:.0f}s cooldown)")
+                print(f"   Total rate limit errors: {self.rate_limit_errors}")
+                print(f"   Ticker: {ticker}, Error: {error_msg}")
+            return True
         else:
             # Check for internal throttling patterns
             # Only log unexpected errors, suppress common non-critical ones
@@ -67,7 +74,8 @@ class RateLimitTracker:
             'all_errors': self.all_errors[-10:],  # Last 10 errors
             'request_rate_per_min': self._calculate_recent_rate(),
             'top_error_patterns': dict(sorted(self.error_patterns.items(), key=lambda x: x[1], reverse=True)[:5]),
-            'ticker_request_counts': dict(self.ticker_requests)
+            'ticker_request_counts': dict(self.ticker_requests),
+            'limiter': self.limiter.get_metrics()
         }
     
     def _calculate_recent_rate(self):
@@ -85,6 +93,9 @@ class RateLimitTracker:
         print(f"Total Requests: {self.request_count}")
         print(f"Current Rate: {self._calculate_recent_rate():.1f} requests/minute")
         print(f"Rate Limit Errors: {self.rate_limit_errors}")
+        metrics = self.limiter.get_metrics()
+        print(f"Limiter: {metrics['current_rate'] * 60:.0f}/min allowed, avg wait {metrics['avg_wait']:.2f}s, "
+              f"max wait {metrics['max_wait']:.1f}s, {metrics['waiting']} queued")
         print(f"Other Errors: {len(self.all_errors) - self.rate_limit_errors}")
         
         if self.error_patterns:
@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+from typing import Any, Dict
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to the server (AIMD).
+
+    Every outgoing request calls acquire() first; callers queue for a token
+    instead of bursting. Each success nudges the rate up additively (about
+    `increase_step` requests/s per second of clean traffic) and a 429 cuts it
+    multiplicatively and holds every caller for `cooldown` seconds. Batch runs
+    settle just under the server's limit instead of cycling burst -> ban -> stall.
+    """
+
+    def __init__(self, name: str, rate: float, min_rate: float, max_rate: float,
+                 burst: float = 5.0, increase_step: float = 0.1,
+                 decrease_factor: float = 0.5, cooldown: float = 15.0):
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+
+        self.acquired = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.rate_limited = 0
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the seconds waited."""
+        with self.lock:
+            self._refill()
+            # Reserve a token even if it isn't there yet - the balance going
+            # negative queues callers in arrival order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait > 0:
+                self.waiting += 1
+
+        if wait > 0:
+            time.sleep(wait)
+            with self.lock:
+                self.waiting -= 1
+        return wait
+
+    def on_success(self):
+        """Additive increase: ~increase_step req/s more per second of successes"""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+    def on_rate_limited(self) -> bool:
+        """Multiplicative decrease plus a cooldown for every caller. Returns
+        False if another thread already backed off for this burst of 429s."""
+        with self.lock:
+            self.rate_limited += 1
+            now = time.monotonic()
+            if now - self.last_decrease < self.cooldown:
+                return False
+            self.last_decrease = now
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            # Push the bucket into debt so queued and new callers all sit out
+            # the cooldown before the next request goes out
+            self.tokens = min(self.tokens, 0) - self.cooldown * self.rate
+            return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'name': self.name,
+                'current_rate': round(self.rate, 3),
+                'acquired': self.acquired,
+                'waiting': self.waiting,
+                'avg_wait': round(self.total_wait / self.acquired, 3) if self.acquired else 0.0,
+                'max_wait': round(self.max_wait, 3),
+                'rate_limited': self.rate_limited,
+            }
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+
+# Global limiter in front of every Yahoo Finance request (see RateLimitTracker.track_request)
+yahoo_limiter = AdaptiveRateLimiter(
+    name='yahoo',
+    rate=float(os.getenv('YAHOO_RATE_LIMIT', '2.0')),
+    min_rate=float(os.getenv('YAHOO_RATE_MIN', '0.2')),
+    max_rate=float(os.getenv('YAHOO_RATE_MAX', '8.0')),
+)
+
+# Global limiter shared by every SECEdgarProvider - SEC allows at most 10 req/s
+# per client, so the ceiling is fixed there and burst is one request
+sec_limiter = AdaptiveRateLimiter(
+    name='sec',
+    rate=float(os.getenv('SEC_RATE_LIMIT', '10.0')),
+    min_rate=1.0,
+    max_rate=float(os.getenv('SEC_RATE_LIMIT', '10.0')),
+    burst=1.0,
+)